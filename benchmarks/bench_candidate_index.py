@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+"""Benchmark: candidate de-duplication cost as the identity index grows.
+
+Fills a :class:`~sourceress.utils.identity.CandidateRun` with synthetic
+candidates (a mix of common and rare names, titles and cities), then times
+:meth:`~sourceress.utils.identity.CandidateRun.resolve` for a batch of
+new sightings – a third of them URL variants, a third near-duplicates under
+member-id URLs and a third unseen people – at several index sizes. With flat
+per-lookup cost the µs/lookup column stays level.
+
+Run with::
+
+    python benchmarks/bench_candidate_index.py --sizes 1000 10000 100000
+    python benchmarks/bench_candidate_index.py --persist   # include the SQLite flush
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from sourceress.utils.identity import CandidateIndex
+
+FIRST = ["Jane", "John", "Priya", "Wei", "Maria", "Ahmed", "Olga", "Luca", "Aisha", "Tom"]
+LAST = ["Smith", "Doe", "Patel", "Chen", "Garcia", "Khan", "Ivanova", "Rossi", "Okafor", "Brown"]
+TITLES = ["Software Engineer", "Data Scientist", "Product Manager", "Senior Data Engineer", "CTO"]
+CITIES = ["London", "Berlin", "Paris", "Bengaluru", "New York", "Toronto", "Lagos", "Madrid"]
+
+
+def _person(rng: random.Random, n: int) -> tuple[str, str, str, str]:
+    # Every tenth person has a common name, so same-name buckets get crowded.
+    name = f"{rng.choice(FIRST)} {rng.choice(LAST)}" if n % 10 == 0 else f"Person{n} {rng.choice(LAST)}"
+    title = f"{rng.choice(TITLES)} at Company {n % 500}"
+    return f"https://www.linkedin.com/in/person-{n}", name, title, rng.choice(CITIES)
+
+
+def run(size: int, batch: int, persist: bool) -> float:
+    rng = random.Random(size)
+    people = [_person(rng, n) for n in range(size)]
+    with tempfile.TemporaryDirectory() as tmp:
+        index = CandidateIndex(Path(tmp) / "candidates.sqlite" if persist else None)
+        run = index.run()
+        for person in people:
+            run.resolve(*person)
+        index.flush()
+
+        sightings = []
+        for i in range(batch):
+            url, name, title, city = people[rng.randrange(size)]
+            if i % 3 == 0:
+                sightings.append((url.replace("www.", "uk.") + "/?trk=x", name, title, city))
+            elif i % 3 == 1:
+                sightings.append((f"https://www.linkedin.com/in/ACoAA{i}", name, title.replace(" at ", " @ "), f"{city}, Earth"))
+            else:
+                sightings.append(_person(rng, size + i))
+
+        start = time.perf_counter()
+        for sighting in sightings:
+            run.resolve(*sighting)
+        index.flush()
+        elapsed = time.perf_counter() - start
+        index.close()
+    return elapsed / batch * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--batch", type=int, default=3_000)
+    parser.add_argument("--persist", action="store_true", help="persist to SQLite")
+    args = parser.parse_args()
+
+    print(f"{'indexed':>10}  {'µs/lookup':>10}")
+    for size in args.sizes:
+        print(f"{size:>10}  {run(size, args.batch, args.persist):>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
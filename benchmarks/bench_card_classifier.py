@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+"""Benchmark: classifying search-card lines, keyword scans vs. the compiled gazetteer.
+
+Times the per-line title/location decision of
+:func:`~sourceress.utils.scraping._parse_card` over card text – a synthetic
+corpus modelled on captured cards, or the cards of real captured search
+pages via ``--dir`` – once with the former approach (``any(keyword in
+line.lower() ...)`` over the two short keyword tuples it used to have, then
+over the full built-in gazetteer for the same coverage) and once with
+:meth:`~sourceress.utils.gazetteer.Gazetteer.classify`. Also reports how many
+lines each approach labels as a location, as a rough coverage check.
+
+Run with::
+
+    python benchmarks/bench_card_classifier.py --cards 20000
+    python benchmarks/bench_card_classifier.py --dir "$SCRAPER_SNAPSHOT_DIR"   # needs lxml
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from typing import Callable
+
+from sourceress.utils import gazetteer as gz
+from sourceress.utils.gazetteer import Gazetteer
+
+# The keyword lists _parse_card used before the gazetteer.
+OLD_TITLE_KEYWORDS = (
+    "developer", "engineer", "manager", "analyst", "scientist", "designer",
+    "consultant", "director", "lead", "senior", "junior",
+)
+OLD_LOCATION_KEYWORDS = (
+    "London", "New York", "San Francisco", "Area", "UK", "US", "United",
+    "Greater", "Metropolitan", "City", "State",
+)
+
+HEADLINES = [
+    "Senior Data Engineer @ Company {n}",
+    "CTO at Company {n}",
+    "Product Manager | Payments",
+    "Co-Founder & CEO at Startup {n}",
+    "Machine Learning Researcher",
+    "Head of Talent at Company {n}",
+    "Frontend Developer (React, TypeScript)",
+]
+PLACES = [
+    "Greater London Area",
+    "Berlin, Germany",
+    "Bengaluru, Karnataka, India",
+    "San Francisco Bay Area",
+    "Toronto, Ontario, Canada",
+    "Paris, Île-de-France, France",
+    "Sydney, New South Wales, Australia",
+]
+NOISE = ["View profile", "• 2nd degree connection", "12 mutual connections", "Connect", "Message"]
+
+
+def _synthetic_cards(count: int) -> list[str]:
+    rng = random.Random(count)
+    cards = []
+    for n in range(count):
+        lines = [f"Person {n}", f"View Person {n}'s profile", rng.choice(NOISE)]
+        lines += [rng.choice(HEADLINES).format(n=n), rng.choice(PLACES), rng.choice(NOISE)]
+        cards.append("\n".join(lines))
+    return cards
+
+
+def _captured_cards(directory: str) -> list[str]:
+    from sourceress.utils import snapshots
+
+    texts = []
+    for path in snapshots.iter_snapshots(directory):
+        snapshot = snapshots.load_snapshot(path)
+        if snapshot.kind != "search":
+            continue
+        doc = snapshots._document(snapshot.html)
+        texts.extend(snapshots._inner_text(card) for card in snapshots._xpath(snapshots._CARD_XPATH)(doc))
+    return texts
+
+
+def _keyword_classifier(titles: tuple[str, ...], locations: tuple[str, ...]) -> Callable[[str], str | None]:
+    def classify(line: str) -> str | None:
+        if "@" in line or any(keyword in line.lower() for keyword in titles):
+            return "title"
+        if any(keyword in line for keyword in locations):
+            return "location"
+        return None
+
+    return classify
+
+
+def _time(lines: list[str], classify: Callable[[str], str | None], rounds: int) -> tuple[float, int]:
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        kinds = [classify(line) for line in lines]
+        best = min(best, time.perf_counter() - start)
+    return best, kinds.count("location")
+
+
+def main(cards: int, directory: str | None, rounds: int) -> None:
+    texts = _captured_cards(directory) if directory else _synthetic_cards(cards)
+    lines = [line.strip() for text in texts for line in text.split("\n")[1:] if line.strip()]
+    if not lines:
+        raise SystemExit(f"No search cards found under {directory}")
+
+    start = time.perf_counter()
+    gazetteer = Gazetteer()
+    build = time.perf_counter() - start
+    print(f"{len(texts)} cards, {len(lines)} lines; gazetteer of {gazetteer.size} entries built in {build * 1e3:.1f} ms")
+    print(f"{'classifier':<12} {'µs/line':>8} {'locations':>10}")
+    classifiers = {
+        "keywords": _keyword_classifier(OLD_TITLE_KEYWORDS, OLD_LOCATION_KEYWORDS),
+        "keywords+": _keyword_classifier(
+            tuple(term.lower() for term in gz.TITLE_TERMS), gz.CITIES + gz.REGIONS + gz.COUNTRIES
+        ),
+        "gazetteer": gazetteer.classify,
+    }
+    for label, classify in classifiers.items():
+        elapsed, locations = _time(lines, classify, rounds)
+        print(f"{label:<12} {elapsed / len(lines) * 1e6:>8.2f} {locations:>10}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cards", type=int, default=20_000)
+    parser.add_argument("--dir", default=None, help="classify the cards of a capture directory instead")
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+    main(args.cards, args.dir, args.rounds)
@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+"""Benchmark: per-call ``aiohttp`` sessions vs. the pooled OpenRouter session.
+
+Spins up a local stand-in for the OpenRouter ``/chat/completions`` endpoint and
+times sequential completions through
+
+1. a fresh ``aiohttp.ClientSession`` per call (the previous behaviour), and
+2. :func:`sourceress.utils.llm._openrouter_chat`, which reuses a shared session.
+
+Run with::
+
+    python benchmarks/bench_openrouter_session.py --calls 200
+
+Over plain HTTP on loopback the gap is the TCP connect + connection setup
+cost; against the real HTTPS endpoint the TLS handshake widens it further.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+
+import aiohttp
+from aiohttp import web
+
+from sourceress.utils import llm
+
+COMPLETION = {"choices": [{"message": {"content": "ok"}}]}
+
+
+async def _completions(request: web.Request) -> web.Response:
+    await request.json()
+    return web.json_response(COMPLETION)
+
+
+async def _start_server() -> tuple[web.AppRunner, str]:
+    app = web.Application()
+    app.router.add_post("/api/v1/chat/completions", _completions)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]  # type: ignore[union-attr]
+    return runner, f"http://127.0.0.1:{port}/api/v1"
+
+
+async def _fresh_session_call(base_url: str) -> str:
+    """Replica of the old implementation: one session per completion."""
+    async with aiohttp.ClientSession() as session:
+        async with session.post(
+            f"{base_url}/chat/completions",
+            json={"model": "bench", "messages": []},
+            timeout=aiohttp.ClientTimeout(total=60),
+        ) as resp:
+            resp.raise_for_status()
+            data = await resp.json()
+            return data["choices"][0]["message"]["content"]
+
+
+async def _time_calls(call, n: int) -> list[float]:
+    latencies = []
+    for _ in range(n):
+        start = time.perf_counter()
+        await call()
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+def _report(label: str, latencies: list[float]) -> None:
+    ordered = sorted(latencies)
+    p95 = ordered[int(len(ordered) * 0.95) - 1]
+    print(
+        f"{label:<16} mean={statistics.mean(latencies):7.3f} ms  "
+        f"median={statistics.median(latencies):7.3f} ms  p95={p95:7.3f} ms"
+    )
+
+
+async def main(calls: int) -> None:
+    runner, base_url = await _start_server()
+    llm.OPENROUTER_BASE_URL = base_url
+    llm.OPENROUTER_API_KEY = llm.OPENROUTER_API_KEY or "bench"
+
+    try:
+        fresh = await _time_calls(lambda: _fresh_session_call(base_url), calls)
+        pooled = await _time_calls(lambda: llm._openrouter_chat("system", "user"), calls)
+    finally:
+        await llm.aclose()
+        await runner.cleanup()
+
+    print(f"{calls} sequential completions against {base_url}")
+    _report("fresh session", fresh)
+    _report("pooled session", pooled)
+    print(f"speed-up (mean): {statistics.mean(fresh) / statistics.mean(pooled):.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=200)
+    asyncio.run(main(parser.parse_args().calls))
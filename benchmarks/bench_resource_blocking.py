@@ -0,0 +1,174 @@
+#!/usr/bin/env python
+"""Benchmark: page loads with and without network resource blocking.
+
+Serves a local stand-in for a LinkedIn result page – markup plus images, web
+fonts, an autoplaying video and a third-party "telemetry" script – and loads
+it repeatedly in a real browser, first with blocking off and then with the
+:class:`~sourceress.utils.resource_blocking.BlockPolicy`. The server counts
+the bytes it sends, so the report shows bytes transferred and page-load time
+per load for both runs.
+
+Run with::
+
+    python benchmarks/bench_resource_blocking.py --loads 20
+    python benchmarks/bench_resource_blocking.py --engine selenium
+
+The Playwright engine needs ``playwright install chromium``; the Selenium
+engine needs a local Chrome. The telemetry script is served from
+``localhost`` while the page itself comes from ``127.0.0.1``, so domain
+blocking is exercised too.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from aiohttp import web
+
+from sourceress.utils.resource_blocking import BlockPolicy, apply_to_driver, route_context
+
+IMAGES = 30
+IMAGE_BYTES = 120_000
+FONT_BYTES = 180_000
+VIDEO_BYTES = 2_000_000
+SCRIPT_BYTES = 60_000
+
+POLICY = BlockPolicy(domains=frozenset({"localhost"}))
+
+
+def _page(port: int) -> str:
+    cards = "".join(
+        f'<li data-chameleon-result-urn="urn:li:member:{i}"><img src="/img/{i}.png">'
+        f'<a href="/in/person-{i}">Person {i}</a><div>Engineer @ Company {i}</div></li>'
+        for i in range(IMAGES)
+    )
+    return f"""<!doctype html><html><head>
+<style>
+@font-face {{ font-family: Brand; src: url(/fonts/brand.woff2) format("woff2"); }}
+@font-face {{ font-family: BrandBold; src: url(/fonts/brand-bold.woff2) format("woff2"); }}
+body {{ font-family: Brand, sans-serif; }} h1 {{ font-family: BrandBold; }}
+</style>
+<script src="http://localhost:{port}/track.js"></script>
+</head><body><h1>Results</h1>
+<video src="/media/intro.mp4" autoplay muted preload="auto"></video>
+<ul>{cards}</ul></body></html>"""
+
+
+class _Server:
+    def __init__(self) -> None:
+        self.bytes_sent = 0
+        self.port = 0
+        self._runner: web.AppRunner | None = None
+
+    def _send(self, body: bytes, content_type: str) -> web.Response:
+        self.bytes_sent += len(body)
+        return web.Response(body=body, content_type=content_type, headers={"Cache-Control": "no-store"})
+
+    async def start(self) -> str:
+        app = web.Application()
+        app.router.add_get("/", lambda _: self._send(_page(self.port).encode(), "text/html"))
+        app.router.add_get("/img/{name}", lambda _: self._send(b"\x89PNG" + b"\0" * IMAGE_BYTES, "image/png"))
+        app.router.add_get("/fonts/{name}", lambda _: self._send(b"\0" * FONT_BYTES, "font/woff2"))
+        app.router.add_get("/media/{name}", lambda _: self._send(b"\0" * VIDEO_BYTES, "video/mp4"))
+        app.router.add_get(
+            "/track.js", lambda _: self._send(b"//" + b" " * SCRIPT_BYTES, "application/javascript")
+        )
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]  # type: ignore[union-attr]
+        return f"http://127.0.0.1:{self.port}/"
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+
+async def _playwright_loads(server: _Server, url: str, loads: int, block: bool) -> tuple[list[float], list[int]]:
+    from playwright.async_api import async_playwright
+
+    times, sizes = [], []
+    async with async_playwright() as playwright:
+        browser = await playwright.chromium.launch()
+        try:
+            for _ in range(loads):
+                context = await browser.new_context()
+                if block:
+                    await route_context(context, POLICY)
+                page = await context.new_page()
+                before = server.bytes_sent
+                start = time.perf_counter()
+                await page.goto(url, wait_until="load")
+                times.append(time.perf_counter() - start)
+                await asyncio.sleep(0.2)  # let late media range requests land
+                sizes.append(server.bytes_sent - before)
+                await context.close()
+        finally:
+            await browser.close()
+    return times, sizes
+
+
+async def _selenium_loads(server: _Server, url: str, loads: int, block: bool) -> tuple[list[float], list[int]]:
+    from selenium import webdriver
+
+    options = webdriver.ChromeOptions()
+    options.add_argument("--headless=new")
+    if block:
+        for argument in POLICY.chrome_arguments():
+            options.add_argument(argument)
+    driver = await asyncio.to_thread(webdriver.Chrome, options=options)
+    times, sizes = [], []
+    try:
+        driver.execute_cdp_cmd("Network.setCacheDisabled", {"cacheDisabled": True})
+        if block:
+            apply_to_driver(driver, POLICY)
+        for _ in range(loads):
+            before = server.bytes_sent
+            start = time.perf_counter()
+            await asyncio.to_thread(driver.get, url)
+            times.append(time.perf_counter() - start)
+            await asyncio.sleep(0.2)
+            sizes.append(server.bytes_sent - before)
+    finally:
+        await asyncio.to_thread(driver.quit)
+    return times, sizes
+
+
+def _report(label: str, times: list[float], sizes: list[int]) -> None:
+    print(
+        f"{label:<10} load mean={statistics.mean(times) * 1000:8.1f} ms  "
+        f"median={statistics.median(times) * 1000:8.1f} ms  "
+        f"bytes/load={statistics.mean(sizes) / 1024:9.1f} KiB"
+    )
+
+
+async def main(engine: str, loads: int) -> None:
+    server = _Server()
+    url = await server.start()
+    run = _playwright_loads if engine == "playwright" else _selenium_loads
+    try:
+        open_times, open_sizes = await run(server, url, loads, block=False)
+        blocked_times, blocked_sizes = await run(server, url, loads, block=True)
+    finally:
+        await server.stop()
+
+    print(f"{loads} loads of {url} ({engine})")
+    _report("unblocked", open_times, open_sizes)
+    _report("blocked", blocked_times, blocked_sizes)
+    saved = 1 - statistics.mean(blocked_sizes) / statistics.mean(open_sizes)
+    print(
+        f"bytes saved: {saved:.0%}  "
+        f"speed-up (mean): {statistics.mean(open_times) / statistics.mean(blocked_times):.2f}x"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--engine", choices=("playwright", "selenium"), default="playwright")
+    parser.add_argument("--loads", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.engine, args.loads))
@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+"""Benchmark: offline snapshot parsing, in-process vs. a process pool.
+
+Writes a synthetic corpus of gzip snapshots (search pages with ten result
+cards each, plus profile pages) to a temporary directory – or uses a real
+capture directory via ``--dir`` – and times
+:func:`sourceress.utils.snapshots.parse_snapshots` with one worker and with
+``--workers`` processes.
+
+Run with::
+
+    python benchmarks/bench_snapshot_parser.py --pages 2000 --workers 8
+    python benchmarks/bench_snapshot_parser.py --dir "$SCRAPER_SNAPSHOT_DIR"
+
+Needs the ``snapshots`` extra (``lxml``).
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from sourceress.utils import snapshots
+
+CARD = """<li><div data-chameleon-result-urn="urn:li:member:{n}">
+  <div><a href="/in/person-{n}?miniProfile=1"><span>Person {n}</span></a></div>
+  <div>View Person {n}'s profile</div>
+  <div>• 2nd degree connection</div>
+  <div>Senior Data Engineer @ Company {n}</div>
+  <div>Greater London Area</div>
+  <button>Connect</button>
+</div></li>"""
+
+PROFILE = """<html><body>
+<h1 class="text-heading-xlarge">Person {n}</h1>
+<div class="text-body-medium">Senior Data Engineer</div>
+<span class="text-body-small inline">London, England</span>
+<div class="pv-shared-text-with-see-more">Builds data platforms.</div>
+{skills}
+<div class="pv-entity__summary-info"><h3>Data Engineer</h3>
+  <p class="pv-entity__secondary-title">Company {n}</p></div>
+</body></html>"""
+
+
+def _write_corpus(root: Path, pages: int) -> list[Path]:
+    skills = "".join(
+        f'<span class="pv-skill-category-entity__name">Skill {i}</span>' for i in range(10)
+    )
+    paths = []
+    for page in range(pages):
+        if page % 2:
+            html = PROFILE.format(n=page, skills=skills)
+            paths.append(snapshots.save_snapshot("profile", f"https://x/in/{page}", html, root))
+        else:
+            cards = "".join(CARD.format(n=page * 10 + i) for i in range(10))
+            html = f"<html><body><main><ul>{cards}</ul></main></body></html>"
+            paths.append(snapshots.save_snapshot("search", f"https://x/s?page={page}", html, root))
+    return paths
+
+
+def _time(paths: list[Path], workers: int) -> float:
+    start = time.perf_counter()
+    results = snapshots.parse_snapshots(paths, workers=workers)
+    elapsed = time.perf_counter() - start
+    assert len(results) == len(paths)
+    return elapsed
+
+
+def main(pages: int, workers: int, directory: str | None) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        if directory:
+            paths = list(snapshots.iter_snapshots(directory))
+        else:
+            paths = _write_corpus(Path(tmp), pages)
+        if not paths:
+            raise SystemExit(f"No snapshots found under {directory}")
+
+        print(f"{len(paths)} snapshots")
+        for label, count in (("1 worker", 1), (f"{workers} workers", workers)):
+            elapsed = _time(paths, count)
+            print(f"{label:<12} {elapsed:7.3f} s  {len(paths) / elapsed:9.0f} pages/s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=2000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--dir", default=None, help="parse an existing capture directory instead")
+    args = parser.parse_args()
+    main(args.pages, args.workers, args.dir)
@@ -4,5 +4,19 @@ def hello() -> str:
 # Semantic version of the package
 __version__ = "0.1.0"
 
-# Re-export major submodules for convenience
-from . import agents, models, workflows  # noqa: F401
+# Re-export major submodules for convenience. They are imported on first
+# attribute access (PEP 562) so that ``import sourceress`` – and with it the
+# CLI's ``--version``/``--help`` – does not pay for crewai, selenium & co.
+_SUBMODULES = {"agents", "models", "workflows"}
+
+
+def __getattr__(name: str):
+    if name in _SUBMODULES:
+        import importlib
+
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_SUBMODULES})
@@ -0,0 +1,5 @@
+"""Allow ``python -m sourceress``."""
+
+from sourceress.main import main
+
+main()
@@ -1,11 +1,30 @@
-"""Agent subpackage exposing all concrete agent classes for external imports."""
+"""Agent subpackage exposing all concrete agent classes for external imports.
 
-from .jd_ingestor import JDIngestor  # noqa: F401
-from .linkedin_sourcer import LinkedInSourcer  # noqa: F401
-from .relevance_scorer import RelevanceScorer  # noqa: F401
-from .key_matcher import KeyMatcher  # noqa: F401
-from .pitch_generator import PitchGenerator  # noqa: F401
-from .excel_writer import ExcelWriter  # noqa: F401
+Agents are imported lazily on first access: every agent pulls in crewai via
+:mod:`sourceress.agents.base`, and the sourcer additionally needs selenium.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .excel_writer import ExcelWriter
+    from .jd_ingestor import JDIngestor
+    from .key_matcher import KeyMatcher
+    from .linkedin_sourcer import LinkedInSourcer
+    from .pitch_generator import PitchGenerator
+    from .relevance_scorer import RelevanceScorer
+
+_AGENT_MODULES = {
+    "JDIngestor": "jd_ingestor",
+    "LinkedInSourcer": "linkedin_sourcer",
+    "RelevanceScorer": "relevance_scorer",
+    "KeyMatcher": "key_matcher",
+    "PitchGenerator": "pitch_generator",
+    "ExcelWriter": "excel_writer",
+}
 
 __all__ = [
     "JDIngestor",
@@ -14,4 +33,17 @@ __all__ = [
     "KeyMatcher",
     "PitchGenerator",
     "ExcelWriter",
-] 
\ No newline at end of file
+]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _AGENT_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -9,6 +9,9 @@ Provides:
       :py:meth:`run` coroutine.
     • Compatibility stubs for CrewAI's ``Agent`` API – subclasses only need to
       implement :py:meth:`run` and set ``name``.
+    • LLM call attribution: every ``run`` executes inside
+      :func:`sourceress.utils.llm.calling_agent`, so per-call metrics carry the
+      agent's ``name``.
 
 This keeps individual agent files clean and consistent while ensuring robust
 error-handling across the project.
@@ -16,6 +19,7 @@ error-handling across the project.
 
 from __future__ import annotations
 
+import functools
 from typing import Any, Callable, Coroutine, TypeVar
 
 from crewai import Agent  # type: ignore
@@ -23,6 +27,8 @@ from loguru import logger
 from pydantic import PrivateAttr
 from tenacity import AsyncRetrying, stop_after_attempt, wait_exponential
 
+from sourceress.utils.llm import calling_agent
+
 __all__ = ["BaseAgent"]
 
 T = TypeVar("T")
@@ -55,6 +61,21 @@ class BaseAgent(Agent):
 
     # -----------------------------------------------------------------------------
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Tag LLM calls made from a subclass's ``run`` with the agent name."""
+
+        super().__init_subclass__(**kwargs)
+        run = cls.__dict__.get("run")
+        if run is None:
+            return
+
+        @functools.wraps(run)
+        async def _tagged_run(self: BaseAgent, *args: Any, **kw: Any) -> Any:
+            with calling_agent(self.name):
+                return await run(self, *args, **kw)
+
+        cls.run = _tagged_run  # type: ignore[method-assign]
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:  # noqa: D401
         """Initialise agent and bind a contextual logger."""
 
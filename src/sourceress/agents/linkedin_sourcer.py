@@ -3,15 +3,23 @@
 """LinkedIn Sourcer Agent.
 
 Searches LinkedIn for candidate profiles matching a given job description.
+By default one boolean query is run; ``query_variants > 1`` switches to a
+query plan whose searches run concurrently (see :func:`_plan_queries`).
 """
 
 from __future__ import annotations
 
-from typing import Any
+import itertools
+from contextlib import aclosing
+from typing import Any, AsyncIterator
+
+from loguru import logger
 
 from sourceress.agents.base import BaseAgent
-from sourceress.models import JobDescription, SourcingResult
-from sourceress.utils.linkedin_api import fetch_profiles
+from sourceress.models import CandidateProfile, JobDescription, SourcingResult
+from sourceress.utils.identity import get_candidate_index
+from sourceress.utils.linkedin_api import fetch_profiles_async, fetch_profiles_fanout, iter_profiles
+from sourceress.utils.pacing import PACING
 
 
 class LinkedInSourcer(BaseAgent):
@@ -29,11 +37,22 @@ class LinkedInSourcer(BaseAgent):
                      "and can efficiently navigate through profiles to find the best matches.",
         )
 
-    async def run(self, jd: JobDescription, **kwargs: Any) -> SourcingResult:  # noqa: D401
+    async def run(
+        self,
+        jd: JobDescription,
+        query_variants: int = 1,
+        target: int = 20,
+        **kwargs: Any,
+    ) -> SourcingResult:  # noqa: D401
         """Execute the agent.
 
         Args:
             jd: Structured job description.
+            query_variants: Searches to plan for *jd*. With more than one,
+                title synonyms, other skill pairs and location-free variants
+                of the base query run concurrently and stop once *target*
+                unique candidates are found.
+            target: Number of candidates wanted.
             **kwargs: Additional runtime parameters.
 
         Returns:
@@ -41,69 +60,170 @@ class LinkedInSourcer(BaseAgent):
         """
         self.log.debug("Starting LinkedIn sourcing for JD: %s", jd.title)
 
-        # 1. Construct optimized boolean search query for LinkedIn
-        # Strategy: Use LinkedIn's boolean operators for precise targeting
-        # Format: "title" AND ("skill1" OR "skill2") - keep it simple and effective
-        
-        # Extract core components
-        core_title = jd.title.split(" - ")[0].split(" at ")[0].strip()
-        
-        # Build boolean query components
-        query_parts = []
-        key_skills = []  # Initialize key_skills to avoid scope issues
-        
-        # Title (required) - use quotes for exact match
-        query_parts.append(f'"{core_title}"')
-        
-        # Must-have skills (OR group) - extract key terms dynamically
-        if jd.must_haves:
-            # Extract key terms from must-haves (avoid generic words)
-            generic_words = {"experience", "years", "plus", "with", "and", "or", "the", "a", "an", "of", "in", "on", "at", "to", "for", "is", "are", "was", "were", "be", "been", "being", "have", "has", "had", "do", "does", "did", "will", "would", "could", "should", "may", "might", "can", "must", "shall"}
-            
-            for skill in jd.must_haves:
-                # Clean and extract meaningful terms
-                words = skill.lower().replace("+", " ").replace("-", " ").split()
-                meaningful_words = [word for word in words if word not in generic_words and len(word) > 2]
-                
-                # Take the most distinctive terms (likely technologies/skills)
-                for word in meaningful_words:
-                    if word not in [s.strip('"') for s in key_skills]:  # Avoid duplicates
-                        key_skills.append(f'"{word}"')
-                        break
-                
-                if len(key_skills) >= 2:  # Limit to 2 for URL length
-                    break
-            
-            # Add skills as OR group
-            if key_skills:
-                skills_group = " OR ".join(key_skills)
-                query_parts.append(f"({skills_group})")
-        
-        # Add location filter if available
-        if jd.location:
-            query_parts.append(f'"{jd.location}"')
-        
-        # Combine with AND operators
-        search_query = " AND ".join(query_parts)
-        
-        self.log.info(f"Boolean search query: {search_query}")
-        self.log.debug(f"Components: title='{core_title}', skills={key_skills}, location='{jd.location}'")
+        # 1. Construct optimized boolean search query for LinkedIn (the base
+        # query comes first, followed by any planned variants)
+        queries = _plan_queries(jd, query_variants)
 
-        # 2. Fetch profiles using the linkedin_api utility
+        # 2. Fetch profiles using the linkedin_api utility; the whole run,
+        # concurrent queries included, draws from one pacing budget
+        PACING.reset()
         try:
-            profiles = fetch_profiles(search_query, limit=20)  # Using a limit for MVP
+            if len(queries) > 1:
+                self.log.info(f"Fanning out over {len(queries)} queries")
+                profiles = await fetch_profiles_fanout(queries, target=target)
+            else:
+                profiles = await fetch_profiles_async(queries[0], limit=target)
         except Exception as e:
             self.log.error(f"Failed to fetch profiles from LinkedIn: {e}")
             profiles = []
 
-        # 3. Deduplicate profiles by LinkedIn URL to ensure uniqueness
-        seen_urls = set()
+        # 3. Deduplicate profiles by candidate identity (URL forms, and
+        # near-duplicates within this run)
+        seen: set[str] = set()
         unique_profiles = []
-        for profile in profiles:
-            if profile.linkedin_url not in seen_urls:
-                unique_profiles.append(profile)
-                seen_urls.add(profile.linkedin_url)
+        async with get_candidate_index().run() as candidates:
+            for profile in profiles:
+                identity = candidates.resolve_profile(profile)
+                if identity not in seen:
+                    unique_profiles.append(profile)
+                    seen.add(identity)
         
         self.log.info(f"Sourced {len(unique_profiles)} unique candidate profiles.")
 
         return SourcingResult(candidates=unique_profiles)
+
+    async def stream(
+        self, jd: JobDescription, limit: int = 20, **kwargs: Any
+    ) -> AsyncIterator[CandidateProfile]:
+        """Yield unique candidates for *jd* while the search is still running.
+
+        Same query and de-duplication as :meth:`run`, but each candidate is
+        yielded as soon as its search card is parsed (see
+        :func:`~sourceress.utils.linkedin_api.iter_profiles`), so scoring can
+        start on the first results. Close the iterator (e.g. with
+        :func:`contextlib.aclosing`) to stop the search early.
+
+        Args:
+            jd: Structured job description.
+            limit: Maximum number of search results to read.
+            **kwargs: Forwarded to :func:`~sourceress.utils.linkedin_api.iter_profiles`
+                (``buffer``, ``stop``).
+        """
+        search_query = _build_search_query(jd)
+        seen: set[str] = set()
+        PACING.reset()
+        async with get_candidate_index().run() as candidates, aclosing(
+            iter_profiles(search_query, limit=limit, **kwargs)
+        ) as profiles:
+            async for profile in profiles:
+                identity = candidates.resolve_profile(profile)
+                if identity in seen:
+                    continue
+                seen.add(identity)
+                yield profile
+        self.log.info(f"Streamed {len(seen)} unique candidate profiles.")
+
+
+def _build_search_query(jd: JobDescription) -> str:
+    """Build the LinkedIn boolean search query for *jd*."""
+    # Strategy: Use LinkedIn's boolean operators for precise targeting
+    # Format: "title" AND ("skill1" OR "skill2") - keep it simple and effective
+    core_title = _core_title(jd)
+    key_skills = _skill_terms(jd)[:2]  # Limit to 2 for URL length
+    search_query = _compose_query(core_title, key_skills, jd.location)
+
+    logger.info(f"Boolean search query: {search_query}")
+    logger.debug(f"Components: title='{core_title}', skills={key_skills}, location='{jd.location}'")
+    return search_query
+
+
+def _plan_queries(jd: JobDescription, max_queries: int) -> list[str]:
+    """Return up to *max_queries* complementary searches for *jd*.
+
+    The first entry is :func:`_build_search_query`. The rest change one part
+    of it at a time, taking turns between title synonyms, other pairs of
+    must-have skills and dropping the location, so that together they cover
+    candidates the base query misses.
+    """
+    base = _build_search_query(jd)
+    core_title = _core_title(jd)
+    skills = _skill_terms(jd)
+    base_skills = skills[:2]
+
+    titles = [(title, base_skills, jd.location) for title in _title_variants(core_title)]
+    pairs = [
+        (core_title, list(pair), jd.location)
+        for pair in itertools.combinations(skills[:4], 2)
+        if list(pair) != base_skills
+    ]
+    widened = [(core_title, base_skills, "")] if jd.location else []
+    # Second round: broader titles without the location filter.
+    if jd.location:
+        widened += [(title, base_skills, "") for title, _, _ in titles]
+
+    queries = [base]
+    for variant in itertools.chain.from_iterable(itertools.zip_longest(titles, pairs, widened)):
+        if variant is None:
+            continue
+        query = _compose_query(*variant)
+        if query not in queries:
+            queries.append(query)
+    return queries[: max(1, max_queries)]
+
+
+def _core_title(jd: JobDescription) -> str:
+    """The job title without team or company suffixes."""
+    return jd.title.split(" - ")[0].split(" at ")[0].strip()
+
+
+def _skill_terms(jd: JobDescription) -> list[str]:
+    """One distinctive term per must-have, in order, without duplicates."""
+    key_skills: list[str] = []
+    for skill in jd.must_haves:
+        # Clean and extract meaningful terms
+        words = skill.lower().replace("+", " ").replace("-", " ").split()
+        meaningful_words = [word for word in words if word not in _GENERIC_WORDS and len(word) > 2]
+
+        # Take the most distinctive terms (likely technologies/skills)
+        for word in meaningful_words:
+            if word not in key_skills:  # Avoid duplicates
+                key_skills.append(word)
+                break
+    return key_skills
+
+
+def _title_variants(title: str) -> list[str]:
+    """Synonymous titles: role nouns swapped and seniority prefixes dropped."""
+    words = title.split()
+    unranked = [word for word in words if word.lower().rstrip(".") not in _SENIORITY_WORDS]
+    variants = []
+    for candidate in (words, unranked):
+        swapped = [_ROLE_SYNONYMS.get(word.lower(), word) for word in candidate]
+        for option in (candidate, swapped):
+            variant = " ".join(option)
+            if option and variant.lower() != title.lower() and variant not in variants:
+                variants.append(variant)
+    return variants
+
+
+def _compose_query(title: str, skills: list[str], location: str) -> str:
+    # "title" AND ("skill1" OR "skill2") AND "location"
+    query_parts = [f'"{title}"']
+    if skills:
+        query_parts.append("(" + " OR ".join(f'"{skill}"' for skill in skills) + ")")
+    if location:
+        query_parts.append(f'"{location}"')
+    return " AND ".join(query_parts)
+
+
+# Words that never make a useful search term on their own.
+_GENERIC_WORDS = {"experience", "years", "plus", "with", "and", "or", "the", "a", "an", "of", "in", "on", "at", "to", "for", "is", "are", "was", "were", "be", "been", "being", "have", "has", "had", "do", "does", "did", "will", "would", "could", "should", "may", "might", "can", "must", "shall"}
+
+_SENIORITY_WORDS = {"senior", "sr", "junior", "jr", "lead", "principal", "staff", "head", "chief"}
+
+_ROLE_SYNONYMS = {
+    "developer": "Engineer",
+    "engineer": "Developer",
+    "programmer": "Developer",
+    "dev": "Developer",
+}
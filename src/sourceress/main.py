@@ -8,9 +8,7 @@ from pathlib import Path
 
 import click
 
-from sourceress.utils.logging import logger  # noqa: E402 isort: skip
-from sourceress import __version__  # noqa: E402 isort: skip
-from sourceress.workflows import run_end_to_end  # noqa: E402 isort: skip
+from sourceress import __version__
 
 
 @click.command()
@@ -19,10 +17,15 @@ from sourceress.workflows import run_end_to_end  # noqa: E402 isort: skip
 @click.version_option(__version__, prog_name="sourceress")
 def main(jd_file: Path, output: Path) -> None:  # noqa: D401
     """Run the full pipeline from the CLI."""
+    # Imported here so ``--version``/``--help`` return without loading the
+    # agent stack (crewai, selenium, transformers) or opening log sinks.
+    from sourceress.utils.logging import logger
+    from sourceress.workflows import run_end_to_end
+
     jd_text = jd_file.read_text(encoding="utf-8")
     logger.info("Loaded JD from %s (chars=%d)", jd_file, len(jd_text))
     sys.exit(asyncio.run(run_end_to_end(jd_text, output_path=output)))
 
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
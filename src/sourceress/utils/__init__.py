@@ -1,3 +1,21 @@
-"""Utility modules (logging, scraping, API wrappers, etc.)."""
+"""Utility modules (logging, scraping, API wrappers, etc.).
 
-from .logging import logger  # noqa: F401 
\ No newline at end of file
+``logger`` is resolved lazily: importing :mod:`sourceress.utils.logging`
+configures the stderr and file sinks, which sibling modules such as
+:mod:`sourceress.utils.cache` should not trigger on their own.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .logging import logger  # noqa: F401
+
+
+def __getattr__(name: str) -> Any:
+    if name == "logger":
+        from .logging import logger
+
+        return logger
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,205 @@
+"""Persistent key/value caches backed by SQLite.
+
+Used to memoise expensive but repeatable work (LLM completions, search
+results) across runs. Cache files live under ``SOURCERESS_CACHE_DIR``
+(default: ``.cache/``).
+
+Usage
+-----
+>>> cache = SQLiteCache(default_cache_dir() / "example.sqlite", ttl=3600)
+>>> key = make_key("chat", "model-id", "prompt")
+>>> cache.set(key, {"reply": "hello"})
+>>> cache.get(key)
+{'reply': 'hello'}
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+__all__ = ["SQLiteCache", "CacheEntry", "default_cache_dir", "make_key"]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+)
+"""
+
+
+def default_cache_dir() -> Path:
+    """Return the directory that holds persistent caches."""
+    return Path(os.getenv("SOURCERESS_CACHE_DIR", ".cache"))
+
+
+def make_key(*parts: Any) -> str:
+    """Hash *parts* into a stable content-addressed cache key."""
+    payload = json.dumps(parts, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    """A cached value plus its age in seconds."""
+
+    value: Any
+    age: float
+
+
+class SQLiteCache:
+    """JSON value cache with TTL and size-based LRU eviction.
+
+    Args:
+        path: SQLite file; parent directories are created on first use.
+        ttl: Seconds after which an entry is considered expired (``None`` = never).
+        max_entries: Maximum number of rows kept (``None`` = unbounded).
+        max_bytes: Maximum combined size of serialised values (``None`` = unbounded).
+
+    The connection is opened lazily and shared between threads behind a lock.
+    ``hits`` and ``misses`` count :meth:`get` lookups since construction.
+    """
+
+    def __init__(
+        self,
+        path: Path | str,
+        *,
+        ttl: float | None = None,
+        max_entries: int | None = None,
+        max_bytes: int | None = None,
+    ) -> None:
+        self.path = Path(path)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the value for *key*, or *default* if missing or expired."""
+        entry = self.get_entry(key)
+        if entry is None or (self.ttl is not None and entry.age > self.ttl):
+            self.misses += 1
+            return default
+        self.hits += 1
+        return entry.value
+
+    def get_entry(self, key: str) -> CacheEntry | None:
+        """Return the raw entry for *key* regardless of TTL (no hit/miss accounting)."""
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT value, created_at FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute("UPDATE entries SET accessed_at = ? WHERE key = ?", (now, key))
+            conn.commit()
+        return CacheEntry(value=json.loads(row[0]), age=now - row[1])
+
+    def set(self, key: str, value: Any) -> None:
+        """Store *value* (must be JSON-serialisable) under *key* and evict if needed."""
+        payload = json.dumps(value)
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO entries (key, value, size, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, payload, len(payload), now, now),
+            )
+            self._evict(conn, now)
+            conn.commit()
+
+    def delete(self, key: str) -> None:
+        """Remove *key* if present."""
+        with self._lock:
+            conn = self._connect()
+            conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+            conn.commit()
+
+    def clear(self) -> None:
+        """Remove every entry and reset the counters."""
+        with self._lock:
+            conn = self._connect()
+            conn.execute("DELETE FROM entries")
+            conn.commit()
+        self.hits = self.misses = 0
+
+    def stats(self) -> dict[str, int]:
+        """Return hit/miss counters plus the current entry count and size."""
+        with self._lock:
+            count, size = self._connect().execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries"
+            ).fetchone()
+        return {"hits": self.hits, "misses": self.misses, "entries": count, "bytes": size}
+
+    def close(self) -> None:
+        """Close the underlying connection (reopened on next use)."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def __len__(self) -> int:
+        return self.stats()["entries"]
+
+    # ------------------------------------------------------------------
+    # Internal helpers (caller must hold ``self._lock``)
+    # ------------------------------------------------------------------
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(_SCHEMA)
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed_at)"
+            )
+            logger.debug(f"Opened cache {self.path}")
+        return self._conn
+
+    def _evict(self, conn: sqlite3.Connection, now: float) -> None:
+        if self.ttl is not None:
+            conn.execute("DELETE FROM entries WHERE created_at < ?", (now - self.ttl,))
+
+        if self.max_entries is not None:
+            conn.execute(
+                "DELETE FROM entries WHERE key IN ("
+                "SELECT key FROM entries ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+
+        if self.max_bytes is not None:
+            (total,) = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()
+            if total <= self.max_bytes:
+                return
+            stale = []
+            for key, size in conn.execute(
+                "SELECT key, size FROM entries ORDER BY accessed_at ASC"
+            ):
+                if total <= self.max_bytes:
+                    break
+                stale.append((key,))
+                total -= size
+            conn.executemany("DELETE FROM entries WHERE key = ?", stale)
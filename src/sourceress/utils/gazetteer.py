@@ -0,0 +1,240 @@
+"""Job-title and location gazetteers compiled into a single-pass line classifier.
+
+:func:`~.scraping._parse_card` has to decide, for every text line of a search
+result card, whether it is the headline (job title) or the location.
+:class:`Gazetteer` builds one regular expression from the title terms and the
+place names (cities, regions, countries) – each list folded into a trie so
+the engine never re-tests a shared prefix – and :meth:`Gazetteer.classify`
+scans a line once, case-insensitively, without lower-casing it first.
+
+Title terms match whole words with simple inflections (``engineer`` also
+matches ``Engineers`` and ``Engineering``), and an ``@`` marks a headline as
+well. Place names match whole words. All-caps entries such as ``UK`` or
+``CTO`` are matched case-sensitively so that ordinary words containing them
+never count. A line with any title term is a title, even if it also names a
+place.
+
+The built-in lists cover common roles and the usual LinkedIn locations. Set
+``CARD_GAZETTEER_FILE`` to a JSON file with any of the keys ``titles``,
+``cities``, ``regions`` and ``countries`` (lists of strings) to add entries.
+
+Usage
+-----
+>>> get_gazetteer().classify("Greater Munich Metropolitan Area")
+'location'
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Iterable, Literal
+
+__all__ = ["Gazetteer", "LineKind", "get_gazetteer"]
+
+LineKind = Literal["title", "location"]
+
+GAZETTEER_FILE = os.getenv("CARD_GAZETTEER_FILE")
+
+# -----------------------------------------------------------------------------
+# Built-in gazetteers
+# -----------------------------------------------------------------------------
+
+TITLE_TERMS = (
+    "developer", "engineer", "manager", "analyst", "scientist", "designer",
+    "consultant", "director", "lead", "senior", "junior", "architect",
+    "administrator", "specialist", "officer", "founder", "president",
+    "head of", "intern", "recruiter", "researcher", "professor", "lecturer",
+    "student", "partner", "principal", "staff", "chief", "owner", "executive",
+    "coordinator", "associate", "assistant", "programmer", "technician",
+    "advisor", "adviser", "strategist", "freelancer", "contractor",
+    "management", "development", "CEO", "CTO", "CFO", "COO", "CIO", "CPO",
+    "VP", "SVP", "EVP", "SDE", "SWE", "QA",
+)
+
+CITIES = (
+    # Europe
+    "London", "Manchester", "Birmingham", "Edinburgh", "Glasgow", "Bristol",
+    "Leeds", "Cambridge", "Oxford", "Belfast", "Cardiff", "Dublin", "Paris",
+    "Lyon", "Berlin", "Munich", "Hamburg", "Frankfurt", "Cologne", "Stuttgart",
+    "Düsseldorf", "Amsterdam", "Rotterdam", "Utrecht", "Eindhoven", "Brussels",
+    "Antwerp", "Luxembourg", "Zurich", "Zürich", "Geneva", "Basel", "Vienna",
+    "Prague", "Warsaw", "Krakow", "Kraków", "Budapest", "Bucharest", "Madrid",
+    "Barcelona", "Valencia", "Lisbon", "Porto", "Milan", "Rome", "Turin",
+    "Stockholm", "Gothenburg", "Copenhagen", "Oslo", "Helsinki", "Tallinn",
+    "Riga", "Vilnius", "Athens", "Istanbul", "Kyiv", "Kiev",
+    # Americas
+    "New York", "New York City", "San Francisco", "San Jose", "Seattle",
+    "Los Angeles", "San Diego", "Austin", "Dallas", "Houston", "Chicago",
+    "Boston", "Washington", "Atlanta", "Miami", "Denver", "Portland",
+    "Philadelphia", "Pittsburgh", "Phoenix", "Minneapolis", "Detroit",
+    "Raleigh", "Nashville", "Salt Lake City", "Toronto", "Vancouver",
+    "Montreal", "Montréal", "Ottawa", "Calgary", "Waterloo", "Mexico City",
+    "Guadalajara", "São Paulo", "Sao Paulo", "Rio de Janeiro", "Buenos Aires",
+    "Santiago", "Bogotá", "Bogota", "Medellín", "Lima",
+    # Asia-Pacific, Middle East and Africa
+    "Bengaluru", "Bangalore", "Mumbai", "Pune", "Hyderabad", "Chennai",
+    "New Delhi", "Delhi", "Gurgaon", "Gurugram", "Noida", "Kolkata",
+    "Ahmedabad", "Singapore", "Hong Kong", "Tokyo", "Osaka", "Seoul",
+    "Beijing", "Shanghai", "Shenzhen", "Taipei", "Bangkok", "Jakarta",
+    "Kuala Lumpur", "Manila", "Ho Chi Minh City", "Hanoi", "Sydney",
+    "Melbourne", "Brisbane", "Perth", "Auckland", "Wellington", "Dubai",
+    "Abu Dhabi", "Doha", "Riyadh", "Tel Aviv", "Cairo", "Lagos", "Nairobi",
+    "Cape Town", "Johannesburg",
+)
+
+REGIONS = (
+    # Generic LinkedIn location markers
+    "Area", "Greater", "Metropolitan", "Metro", "Metroplex", "Region",
+    "City", "State", "County", "Province", "Bay Area",
+    # UK and Ireland
+    "England", "Scotland", "Wales", "Northern Ireland",
+    # United States
+    "Alabama", "Alaska", "Arizona", "Arkansas", "California", "Colorado",
+    "Connecticut", "Delaware", "Florida", "Georgia", "Hawaii", "Idaho",
+    "Illinois", "Indiana", "Iowa", "Kansas", "Kentucky", "Louisiana", "Maine",
+    "Maryland", "Massachusetts", "Michigan", "Minnesota", "Mississippi",
+    "Missouri", "Montana", "Nebraska", "Nevada", "New Hampshire",
+    "New Jersey", "New Mexico", "North Carolina", "North Dakota", "Ohio",
+    "Oklahoma", "Oregon", "Pennsylvania", "Rhode Island", "South Carolina",
+    "South Dakota", "Tennessee", "Texas", "Utah", "Vermont", "Virginia",
+    "West Virginia", "Wisconsin", "Wyoming",
+    # Canada, Australia, India, Germany
+    "Ontario", "Quebec", "Québec", "British Columbia", "Alberta",
+    "New South Wales", "Victoria", "Queensland", "Karnataka", "Maharashtra",
+    "Telangana", "Tamil Nadu", "Haryana", "Bavaria", "Bayern",
+    # Supranational
+    "EMEA", "APAC", "LATAM", "DACH", "EU",
+)
+
+COUNTRIES = (
+    "United Kingdom", "UK", "United States", "US", "USA", "Ireland", "France",
+    "Germany", "Deutschland", "Netherlands", "Belgium", "Switzerland",
+    "Austria", "Spain", "Portugal", "Italy", "Sweden", "Norway", "Denmark",
+    "Finland", "Iceland", "Poland", "Czechia", "Czech Republic", "Slovakia",
+    "Hungary", "Romania", "Bulgaria", "Greece", "Croatia", "Serbia",
+    "Slovenia", "Estonia", "Latvia", "Lithuania", "Ukraine", "Turkey",
+    "Türkiye", "Israel", "Egypt", "Nigeria", "Kenya", "South Africa",
+    "Morocco", "Ghana", "Canada", "Mexico", "Brazil", "Argentina", "Chile",
+    "Colombia", "Peru", "Uruguay", "India", "Pakistan", "Bangladesh",
+    "Sri Lanka", "Nepal", "China", "Japan", "South Korea", "Korea", "Taiwan",
+    "Vietnam", "Thailand", "Malaysia", "Indonesia", "Philippines",
+    "Australia", "New Zealand", "United Arab Emirates", "UAE", "Saudi Arabia",
+    "Qatar",
+)
+
+# -----------------------------------------------------------------------------
+# Pattern compilation
+# -----------------------------------------------------------------------------
+
+
+def _trie_regex(terms: Iterable[str]) -> str:
+    """Return a regex alternation of *terms* with shared prefixes factored out."""
+    trie: dict[str, dict] = {}
+    for term in terms:
+        node = trie
+        for char in term:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def _render(node: dict[str, dict]) -> str:
+        branches = sorted(re.escape(char) + _render(child) for char, child in node.items() if char)
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        # Greedy: the longest entry is tried first, shorter ones on backtracking.
+        return f"(?:{body})?" if "" in node else body
+
+    return _render(trie)
+
+
+def _split_case(terms: Iterable[str]) -> tuple[set[str], set[str]]:
+    """Split *terms* into lower-cased words and case-sensitive all-caps ones."""
+    folded: set[str] = set()
+    exact: set[str] = set()
+    for term in terms:
+        term = " ".join(term.split())
+        if not term:
+            continue
+        if term.isupper():
+            exact.add(term)
+        else:
+            folded.add(term.lower())
+    return folded, exact
+
+
+def _group(folded: set[str], exact: set[str], suffix: str) -> str:
+    parts = []
+    if folded:
+        parts.append(rf"(?:{_trie_regex(folded)}){suffix}\b")
+    if exact:
+        parts.append(rf"(?-i:{_trie_regex(exact)})\b")
+    return "|".join(parts) or r"(?!)"
+
+
+class Gazetteer:
+    """Classifier for search-card lines built from title and place gazetteers.
+
+    Args:
+        titles: Job-title terms (whole words, simple inflections allowed).
+        locations: City, region and country names (whole words).
+    """
+
+    def __init__(
+        self,
+        titles: Iterable[str] = TITLE_TERMS,
+        locations: Iterable[str] = CITIES + REGIONS + COUNTRIES,
+    ) -> None:
+        title_words, title_caps = _split_case(titles)
+        place_words, place_caps = _split_case(locations)
+        self.size = len(title_words) + len(title_caps) + len(place_words) + len(place_caps)
+        # Entries are only tried where a word starts, which lets the engine
+        # skip through the rest of the line cheaply.
+        self._search = re.compile(
+            rf"(?<!\w)(?:(?P<title>{_group(title_words, title_caps, '(?:s|es|ing)?')})"
+            rf"|(?P<location>{_group(place_words, place_caps, '')}))"
+            r"|(?P<at>@)",
+            re.IGNORECASE,
+        ).search
+
+    @classmethod
+    def from_file(cls, path: Path | str) -> Gazetteer:
+        """Return the built-in gazetteer extended with the entries in the JSON file *path*."""
+        extra = json.loads(Path(path).read_text(encoding="utf-8"))
+        return cls(
+            titles=TITLE_TERMS + tuple(extra.get("titles", ())),
+            locations=CITIES
+            + REGIONS
+            + COUNTRIES
+            + tuple(extra.get("cities", ()))
+            + tuple(extra.get("regions", ()))
+            + tuple(extra.get("countries", ())),
+        )
+
+    def classify(self, line: str) -> LineKind | None:
+        """Return ``"title"``, ``"location"`` or ``None`` for one card line."""
+        match = self._search(line)
+        if match is None:
+            return None
+        # A title anywhere on the line wins over places before it.
+        while match.lastgroup == "location":
+            match = self._search(line, match.end())
+            if match is None:
+                return "location"
+        return "title"
+
+
+_GAZETTEER: Gazetteer | None = None
+_GAZETTEER_LOCK = threading.Lock()
+
+
+def get_gazetteer() -> Gazetteer:
+    """Return the process-wide gazetteer (extended from ``CARD_GAZETTEER_FILE`` if set)."""
+    global _GAZETTEER
+    with _GAZETTEER_LOCK:
+        if _GAZETTEER is None:
+            _GAZETTEER = Gazetteer.from_file(GAZETTEER_FILE) if GAZETTEER_FILE else Gazetteer()
+        return _GAZETTEER
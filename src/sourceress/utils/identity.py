@@ -0,0 +1,390 @@
+"""Candidate identity helpers.
+
+LinkedIn serves the same profile under many URLs – country subdomains
+(``uk.linkedin.com``), the mobile host, tracking query strings
+(``?miniProfile=…``), trailing slashes and differently-cased or
+percent-encoded slugs. :func:`canonical_profile_url` folds them onto one key
+so caches and stores can recognise a candidate. Legacy ``/pub/`` URLs keep
+their whole path: the name alone (``/pub/john-smith``) is not unique, only
+the id segments after it are.
+
+Some duplicates share no URL form at all: search results may link the member
+id (``/in/ACoAAB…``) while another query links the vanity slug.
+:class:`CandidateIndex` resolves every sighting to one identity – by hashed
+canonical URL, or by name plus enriched summary – and remembers the mapping
+across runs in ``candidates.sqlite`` under ``SOURCERESS_CACHE_DIR``
+(``CANDIDATE_INDEX=0`` keeps it in memory only). A :class:`CandidateRun` also
+merges near-duplicates by a SimHash of name, title and location among
+candidates with the same name, for the length of one sourcing run only.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from pathlib import Path
+from typing import Any
+from urllib.parse import quote, unquote, urlsplit, urlunsplit
+
+from loguru import logger
+
+from .cache import default_cache_dir
+
+__all__ = ["CandidateIndex", "CandidateRun", "canonical_profile_url", "get_candidate_index"]
+
+CANDIDATE_INDEX_ENABLED = os.getenv("CANDIDATE_INDEX", "1").lower() not in {"0", "false", "no", "off"}
+
+_PROFILE_PATH = re.compile(r"^/(in|pub)/(.+)", re.IGNORECASE)
+
+
+def canonical_profile_url(url: str) -> str:
+    """Return the canonical ``https://www.linkedin.com/in/<slug>`` form of *url*.
+
+    Sub-pages of a vanity profile (``/in/<slug>/details/…``) fold onto the
+    profile. Legacy ``/pub/<name>/<id>/<id>/<id>`` URLs keep every segment
+    and are never rewritten to ``/in/<name>``, which may be someone else.
+    Non-profile URLs are returned with the query, fragment and trailing slash
+    removed and the scheme and host lower-cased.
+
+    >>> canonical_profile_url("http://UK.linkedin.com/in/Jane-Doe/?miniProfile=1")
+    'https://www.linkedin.com/in/jane-doe'
+    """
+    url = url.strip()
+    parts = urlsplit(url if "://" in url else f"https://{url}")
+    host = (parts.hostname or "").lower()
+    match = _PROFILE_PATH.match(parts.path)
+    if match and (host == "linkedin.com" or host.endswith(".linkedin.com")):
+        kind = match.group(1).lower()
+        segments = [unquote(segment).lower() for segment in match.group(2).split("/") if segment]
+        if kind == "in":
+            segments = segments[:1]
+        if segments:
+            path = "/".join(quote(segment, safe="-_.~") for segment in segments)
+            return f"https://www.linkedin.com/{kind}/{path}"
+    return urlunsplit((parts.scheme.lower(), host, parts.path.rstrip("/"), "", ""))
+
+
+# -----------------------------------------------------------------------------
+# Candidate identity index
+# -----------------------------------------------------------------------------
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+# Dropped before fingerprinting: joiners in headlines ("CTO at Acme") and
+# post-nominals that come and go on names ("Jane Doe, PhD").
+_STOP_TOKENS = frozenset({"at", "the", "of", "and", "in", "for", "a", "an", "with"})
+_NAME_SUFFIXES = frozenset({"phd", "mba", "cfa", "cpa", "pmp", "msc", "bsc", "md", "jr", "sr", "ii", "iii"})
+
+# Replaces the former ``identities`` table, whose rows could hold merges by
+# name similarity; those are no longer persisted, so it is not read.
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS aliases (
+    url_hash INTEGER PRIMARY KEY,
+    identity TEXT NOT NULL,
+    summary_key INTEGER,
+    seen_at REAL NOT NULL
+)
+"""
+
+# Summaries shorter than this are too generic to identify a person.
+_MIN_SUMMARY_TOKENS = 8
+
+
+def _tokens(text: str) -> list[str]:
+    folded = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode().lower()
+    return [token for token in _TOKEN.findall(folded) if token not in _STOP_TOKENS]
+
+
+def _hash64(text: str) -> int:
+    return int.from_bytes(hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+def _signed(value: int) -> int:
+    # SQLite integers are signed 64-bit.
+    return value - (1 << 64) if value >= 1 << 63 else value
+
+
+def _simhash(features: list[str]) -> int:
+    counts = [0] * 64
+    for feature in features:
+        h = _hash64(feature)
+        for bit in range(64):
+            counts[bit] += 1 if h >> bit & 1 else -1
+    return sum(1 << bit for bit, count in enumerate(counts) if count > 0)
+
+
+def _name_key(name: str) -> str:
+    return " ".join(sorted(t for t in _tokens(name) if t not in _NAME_SUFFIXES))
+
+
+def _summary_key(name: str, summary: str) -> int | None:
+    """Hash of the name and enriched summary; ``None`` without a name or a long enough summary."""
+    name_key = _name_key(name)
+    tokens = _tokens(summary)
+    if not name_key or len(tokens) < _MIN_SUMMARY_TOKENS:
+        return None
+    return _hash64(f"{name_key}|{' '.join(tokens)}")
+
+
+def _fingerprint(name: str, title: str, location: str) -> int | None:
+    """SimHash over the name, title and location tokens; ``None`` without title or location."""
+    # Cards vary between "London" and "London, England, United Kingdom".
+    city = location.split(",")[0]
+    context = [f"t:{t}" for t in _tokens(title)] + [f"l:{t}" for t in _tokens(city)]
+    if not context:
+        return None
+    return _simhash([f"n:{t}" for t in _name_key(name).split()] + context)
+
+
+class CandidateIndex:
+    """Resolves candidate sightings to stable, persisted identities.
+
+    An identity is the canonical URL of the first form a person was seen
+    under. :meth:`resolve` only merges a sighting into an existing identity on
+    strong evidence:
+
+    1. the 64-bit hash of its canonical URL matches a URL seen before;
+    2. the same normalised name with the same enriched summary (of at least
+       ``_MIN_SUMMARY_TOKENS`` words).
+
+    Merges by name, title and location similarity are left to :meth:`run`:
+    they last for one sourcing run and are never written to disk, since
+    people with a common name, the same role and the same city would
+    otherwise be merged for good.
+
+    New sightings are buffered; :meth:`flush` (also called by :meth:`close`)
+    writes them in one transaction, so async callers can resolve on the event
+    loop and persist from a worker thread.
+
+    Args:
+        path: SQLite file persisting the index (``None`` = memory only). It
+            is loaded on first use; parent directories are created as needed.
+        max_distance: Hamming distance (of 64 bits) a :meth:`run` still counts
+            as the same person.
+    """
+
+    def __init__(self, path: Path | str | None = None, *, max_distance: int = 8) -> None:
+        self.path = Path(path) if path is not None else None
+        self.max_distance = max_distance
+        self._aliases: dict[int, str] = {}
+        self._by_summary: dict[int, str] = {}
+        self._pending: list[tuple[int, str, int | None, float]] = []
+        self._identities = 0
+        self._loaded = False
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()  # guards the connection
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def resolve(self, url: str, name: str = "", summary: str = "") -> str:
+        """Return the identity for a sighting of *url*, recording it if new."""
+        canonical = canonical_profile_url(url)
+        url_hash = _hash64(canonical)
+        summary_key = _summary_key(name, summary)
+        with self._lock:
+            self._load()
+            identity = self._aliases.get(url_hash)
+            if identity is None:
+                identity = self._by_summary.get(summary_key) if summary_key is not None else None
+                if identity is None:
+                    identity = canonical
+                    self._identities += 1
+                else:
+                    logger.debug(f"{canonical} resolved to {identity} by its profile summary")
+            elif summary_key is None or summary_key in self._by_summary:
+                return identity
+            self._record(url_hash, identity, summary_key)
+            return identity
+
+    def resolve_profile(self, profile: Any) -> str:
+        """:meth:`resolve` for a profile object (e.g. :class:`~sourceress.models.CandidateProfile`)."""
+        return self.resolve(profile.linkedin_url, profile.name or "", getattr(profile, "summary", "") or "")
+
+    def run(self) -> CandidateRun:
+        """Start a sourcing run that also merges near-duplicates (see :class:`CandidateRun`)."""
+        return CandidateRun(self)
+
+    def load(self) -> None:
+        """Read the persisted index now rather than on first use."""
+        with self._lock:
+            self._load()
+
+    def flush(self) -> None:
+        """Write buffered sightings to SQLite in one transaction."""
+        with self._lock:
+            rows, self._pending = self._pending, []
+        if not rows:
+            return
+        with self._write_lock:
+            conn = self._connect()
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO aliases (url_hash, identity, summary_key, seen_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    rows,
+                )
+        logger.debug(f"Recorded {len(rows)} candidate URLs")
+
+    def __contains__(self, url: object) -> bool:
+        if not isinstance(url, str):
+            return False
+        with self._lock:
+            self._load()
+            return _hash64(canonical_profile_url(url)) in self._aliases
+
+    def __len__(self) -> int:
+        """Number of distinct identities."""
+        with self._lock:
+            self._load()
+            return self._identities
+
+    def close(self) -> None:
+        """Flush buffered sightings and close the connection (reopened on next write)."""
+        self.flush()
+        with self._write_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # ------------------------------------------------------------------
+    # Internal helpers (caller must hold ``self._lock``)
+    # ------------------------------------------------------------------
+
+    def _record(self, url_hash: int, identity: str, summary_key: int | None) -> None:
+        self._aliases[url_hash] = identity
+        if summary_key is not None:
+            self._by_summary.setdefault(summary_key, identity)
+        if self.path is not None:
+            self._pending.append(
+                (
+                    _signed(url_hash),
+                    identity,
+                    None if summary_key is None else _signed(summary_key),
+                    time.time(),
+                )
+            )
+
+    def _load(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        if self.path is None or not self.path.exists():
+            return
+        with self._write_lock:
+            rows = self._connect().execute("SELECT url_hash, identity, summary_key FROM aliases").fetchall()
+        identities: set[str] = set()
+        for url_hash, identity, summary_key in rows:
+            self._aliases[url_hash % (1 << 64)] = identity
+            if summary_key is not None:
+                self._by_summary.setdefault(summary_key % (1 << 64), identity)
+            identities.add(identity)
+        self._identities = len(identities)
+        logger.debug(f"Loaded {len(self._aliases)} candidate URLs ({self._identities} identities)")
+
+    def _connect(self) -> sqlite3.Connection:
+        # Caller must hold ``self._write_lock``.
+        assert self.path is not None
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(_SCHEMA)
+            logger.debug(f"Opened candidate index {self.path}")
+        return self._conn
+
+
+class CandidateRun:
+    """One sourcing run's view of a :class:`CandidateIndex`.
+
+    Sightings resolve through the index first. On top of that, candidates
+    with the same normalised name whose SimHash over name, title and location
+    lies within the index's ``max_distance`` bits are merged – both sightings
+    need a title or location, so bare names never merge. These near-duplicate
+    merges are kept by this object only and end with the run.
+
+    Use it as an (async) context manager to load the index before the run
+    and flush its new sightings afterwards, off the event loop when async.
+    """
+
+    def __init__(self, index: CandidateIndex) -> None:
+        self.index = index
+        self._merged: dict[str, str] = {}
+        self._by_name: dict[str, list[tuple[int, str]]] = {}
+        self._lock = threading.Lock()
+
+    def resolve(
+        self, url: str, name: str = "", title: str = "", location: str = "", summary: str = ""
+    ) -> str:
+        """Return the identity of a sighting within this run."""
+        identity = self.index.resolve(url, name, summary)
+        with self._lock:
+            merged = self._merged.get(identity)
+            if merged is not None:
+                return merged
+            name_key = _name_key(name)
+            fingerprint = _fingerprint(name, title, location)
+            merged = self._near_duplicate(name_key, fingerprint) or identity
+            if merged != identity:
+                logger.debug(f"{identity} resolved to near-duplicate {merged} for this run")
+            self._merged[identity] = merged
+            if fingerprint is not None and name_key:
+                self._by_name.setdefault(name_key, []).append((fingerprint, merged))
+            return merged
+
+    def resolve_profile(self, profile: Any) -> str:
+        """:meth:`resolve` for a profile object (e.g. :class:`~sourceress.models.CandidateProfile`)."""
+        return self.resolve(
+            profile.linkedin_url,
+            profile.name or "",
+            profile.title or "",
+            profile.location or "",
+            getattr(profile, "summary", "") or "",
+        )
+
+    def __enter__(self) -> CandidateRun:
+        self.index.load()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.index.flush()
+
+    async def __aenter__(self) -> CandidateRun:
+        await asyncio.to_thread(self.index.load)
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await asyncio.to_thread(self.index.flush)
+
+    def _near_duplicate(self, name_key: str, fingerprint: int | None) -> str | None:
+        if fingerprint is None or not name_key:
+            return None
+        for other, identity in self._by_name.get(name_key, ()):
+            if (fingerprint ^ other).bit_count() <= self.index.max_distance:
+                return identity
+        return None
+
+
+_INDEX: CandidateIndex | None = None
+_INDEX_LOCK = threading.Lock()
+
+
+def get_candidate_index() -> CandidateIndex:
+    """Return the process-wide index, persisted unless ``CANDIDATE_INDEX=0``."""
+    global _INDEX
+    with _INDEX_LOCK:
+        if _INDEX is None:
+            path = default_cache_dir() / "candidates.sqlite" if CANDIDATE_INDEX_ENABLED else None
+            _INDEX = CandidateIndex(path)
+            atexit.register(_INDEX.close)
+        return _INDEX
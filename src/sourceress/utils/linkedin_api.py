@@ -1,63 +1,397 @@
 """Thin wrapper around LinkedIn scraping utilities.
 
-Abstracted to enable unit testing via mocks.
+Abstracted to enable unit testing via mocks. Search hits are recorded in the
+profile store (see :mod:`.profile_store`), and profiles already enriched
+there recently get their summary and skills without a page visit.
+
+:func:`fetch_profiles_async` is the event-loop friendly form of
+:func:`fetch_profiles`: it scrapes with the engine chosen by
+``SCRAPER_BACKEND`` (Selenium on a worker thread, or Playwright).
+
+:func:`iter_profiles` streams the same validated profiles while the search is
+still scrolling. At most ``LINKEDIN_STREAM_BUFFER`` (default: 10) profiles
+wait for the consumer; beyond that the scraper pauses.
+
+:func:`fetch_profiles_fanout` runs several queries at once – up to
+``LINKEDIN_FANOUT_CONCURRENCY`` (default: 3) on separate pooled browsers –
+and merges their hits until enough unique candidates are found.
+
+Both read through the search cache (see :mod:`.search_cache`): a query seen
+recently – in any equivalent spelling – replays its stored result cards
+instead of opening a browser, and stale entries are refreshed in the
+background while they are served.
 """
 
 from __future__ import annotations
 
-from typing import List
+import asyncio
+import os
+from contextlib import aclosing
+from typing import Any, AsyncIterator, List, Sequence
 
 from loguru import logger
 
-from .scraping import search_linkedin_async, search_linkedin
+from .identity import CandidateRun, get_candidate_index
+from .linkedin_auth import get_driver_pool
+from .profile_store import CARD_FIELDS, get_profile_store
+from .search_cache import get_search_cache
+from .scraping import enrich_profiles, enrich_profiles_async, search_linkedin_async, search_linkedin
 from sourceress.models import CandidateProfile
 
+STREAM_BUFFER = int(os.getenv("LINKEDIN_STREAM_BUFFER", "10"))
+FANOUT_CONCURRENCY = int(os.getenv("LINKEDIN_FANOUT_CONCURRENCY", "3"))
 
-def fetch_profiles(search_terms: str, limit: int = 50) -> List[CandidateProfile]:
-    """Return structured LinkedIn profiles matching the search terms."""
+
+def fetch_profiles(
+    search_terms: str,
+    limit: int = 50,
+    enrich: bool = False,
+    concurrency: int | None = None,
+) -> List[CandidateProfile]:
+    """Return structured LinkedIn profiles matching the search terms.
+
+    With ``enrich=True`` every hit's profile page is visited (in parallel, see
+    :func:`~.scraping.enrich_profiles`) to fill in ``summary`` and ``skills``.
+    """
     logger.debug("Fetching up to %d profiles for search terms: %s", limit, search_terms)
 
     try:
-        raw_profiles = search_linkedin(search_terms, max_results=limit)
+        raw_profiles = _cache_lookup(search_terms, limit)
+        cached = raw_profiles is not None
+        if raw_profiles is None:
+            raw_profiles = search_linkedin(search_terms, max_results=limit)
+            _cache_store(search_terms, limit, raw_profiles)
         
-        validated_profiles = []
-        for profile_data in raw_profiles:
-            try:
-                # Basic normalization and data cleaning
-                name = profile_data.get("name", "").strip()
-                linkedin_url = profile_data.get("linkedin_url", "").split("?")[0]
-                title = profile_data.get("title", "").strip()
-                location = profile_data.get("location", "").strip()
-
-                # Fix common data extraction issues
-                if not name or name == "Unknown":
-                    if title and " at " in title:
-                        name = title.split(" at ")[0].strip()
-                    else:
-                        logger.warning(f"Could not determine name for profile: {profile_data}")
-                        continue
-
-                if title == location and title:
-                    location = ""
-
-                # Create CandidateProfile instance
-                validated_profiles.append(
-                    CandidateProfile(
-                        name=name,
-                        linkedin_url=linkedin_url,
-                        title=title,
-                        location=location,
-                        summary=profile_data.get("summary", ""),
-                        skills=profile_data.get("skills", []),
-                    )
-                )
-            except Exception as e:
-                logger.warning(f"Skipping profile due to validation error: {e} | Data: {profile_data}")
-                continue
+        validated_profiles = [
+            profile for profile in map(_to_candidate, raw_profiles) if profile is not None
+        ]
         
         logger.info(f"Successfully fetched and validated {len(validated_profiles)} profiles.")
+        if validated_profiles:
+            validated_profiles = _sync_profile_store(validated_profiles, record=not cached)
+        if enrich and validated_profiles:
+            validated_profiles = _merge_enrichment(validated_profiles, concurrency)
         return validated_profiles
 
     except Exception as e:
         logger.error(f"An error occurred while fetching profiles: {e}")
-        return [] 
\ No newline at end of file
+        return [] 
+
+
+async def fetch_profiles_async(
+    search_terms: str,
+    limit: int = 50,
+    enrich: bool = False,
+    concurrency: int | None = None,
+) -> List[CandidateProfile]:
+    """Async variant of :func:`fetch_profiles`.
+
+    Searches and enriches through the engine selected by ``SCRAPER_BACKEND``
+    (see :func:`~.scraping.search_linkedin_async`), and keeps cache and
+    profile-store I/O off the event loop.
+    """
+    logger.debug(f"Fetching up to {limit} profiles for search terms: {search_terms}")
+
+    try:
+        raw_profiles = await asyncio.to_thread(
+            _cache_lookup, search_terms, limit, asyncio.get_running_loop()
+        )
+        cached = raw_profiles is not None
+        if raw_profiles is None:
+            raw_profiles = await search_linkedin_async(search_terms, max_results=limit)
+            await asyncio.to_thread(_cache_store, search_terms, limit, raw_profiles)
+
+        validated_profiles = [
+            profile for profile in map(_to_candidate, raw_profiles) if profile is not None
+        ]
+
+        logger.info(f"Successfully fetched and validated {len(validated_profiles)} profiles.")
+        if validated_profiles:
+            validated_profiles = await asyncio.to_thread(
+                _sync_profile_store, validated_profiles, record=not cached
+            )
+        if enrich and validated_profiles:
+            details = await enrich_profiles_async(
+                [profile.linkedin_url for profile in validated_profiles], concurrency=concurrency
+            )
+            validated_profiles = _apply_enrichment(validated_profiles, details)
+        return validated_profiles
+
+    except Exception as e:  # noqa: BLE001
+        logger.error(f"An error occurred while fetching profiles: {e}")
+        return []
+
+
+async def iter_profiles(
+    search_terms: str,
+    limit: int = 50,
+    *,
+    buffer: int = STREAM_BUFFER,
+    stop: asyncio.Event | None = None,
+) -> AsyncIterator[CandidateProfile]:
+    """Yield validated profiles matching *search_terms* as their cards are parsed.
+
+    Profiles are normalised exactly as in :func:`fetch_profiles` (without
+    enrichment). At most *buffer* profiles are queued for the consumer; once
+    the queue is full the search waits, so a slow consumer slows the scroll
+    rather than piling up results.
+
+    Setting *stop* – which may be shared between several streams – or
+    closing the iterator, e.g. with :func:`contextlib.aclosing`, ends the
+    search after the current card. Search failures end the stream early,
+    like :func:`fetch_profiles`. Cached searches are replayed without a
+    browser; only searches that ran to the end are cached.
+    """
+    logger.debug(f"Streaming up to {limit} profiles for search terms: {search_terms}")
+    stop = stop or asyncio.Event()
+    closed = asyncio.Event()  # the consumer has gone away
+    queue: asyncio.Queue[CandidateProfile | None] = asyncio.Queue(maxsize=max(1, buffer))
+
+    cached_cards = await asyncio.to_thread(
+        _cache_lookup, search_terms, limit, asyncio.get_running_loop()
+    )
+    seen_cards: list[dict[str, Any]] = []
+
+    def _stopped() -> bool:
+        return stop.is_set() or closed.is_set()
+
+    async def _on_card(card: dict[str, Any]) -> bool:
+        if _stopped():
+            return False
+        profile = _to_candidate(card)
+        if profile is not None:
+            (profile,) = await asyncio.to_thread(
+                _sync_profile_store, [profile], record=cached_cards is None
+            )
+            await queue.put(profile)
+        return not _stopped()
+
+    async def _on_search_card(card: dict[str, Any]) -> bool:
+        seen_cards.append(card)
+        return await _on_card(card)
+
+    async def _produce() -> None:
+        try:
+            if cached_cards is not None:
+                for card in cached_cards:
+                    if not await _on_card(card):
+                        break
+            else:
+                await search_linkedin_async(search_terms, max_results=limit, on_card=_on_search_card)
+                if not _stopped():
+                    await asyncio.to_thread(_cache_store, search_terms, limit, seen_cards)
+        except Exception as e:  # noqa: BLE001
+            logger.error(f"An error occurred while streaming profiles: {e}")
+        finally:
+            if not closed.is_set():
+                await queue.put(None)
+
+    producer = asyncio.create_task(_produce())
+    yielded = 0
+    try:
+        while (profile := await queue.get()) is not None:
+            yielded += 1
+            yield profile
+            if stop.is_set():
+                break
+        logger.info(f"Streamed {yielded} profiles.")
+    finally:
+        closed.set()
+        # Free the slot a blocked producer may be waiting for, then let the
+        # search notice the stop and hand its browser back.
+        while not queue.empty():
+            queue.get_nowait()
+        await producer
+
+
+async def fetch_profiles_fanout(
+    queries: Sequence[str],
+    target: int = 50,
+    per_query: int | None = None,
+    concurrency: int = FANOUT_CONCURRENCY,
+) -> List[CandidateProfile]:
+    """Run *queries* concurrently and merge their hits into one de-duplicated list.
+
+    Each query streams through :func:`iter_profiles`; profiles are kept in
+    arrival order, de-duplicated by identity (see :class:`~.identity.CandidateRun`).
+    Once *target* unique profiles are in hand every running search stops
+    after its current card and queries not yet started are skipped.
+
+    Args:
+        queries: Search strings, most important first (they start in order).
+        target: Unique profiles wanted.
+        per_query: Result cap for each search (default: *target*).
+        concurrency: Searches running at once; the driver pool is grown to match.
+    """
+    concurrency = max(1, min(concurrency, len(queries)))
+    per_query = per_query or target
+    stop = asyncio.Event()
+    semaphore = asyncio.Semaphore(concurrency)
+    seen: set[str] = set()
+    merged: list[CandidateProfile] = []
+    get_driver_pool().grow(concurrency)
+
+    async def _run(query: str, candidates: CandidateRun) -> None:
+        async with semaphore:
+            if stop.is_set():
+                return
+            found = 0
+            async with aclosing(iter_profiles(query, limit=per_query, stop=stop)) as profiles:
+                async for profile in profiles:
+                    key = candidates.resolve_profile(profile)
+                    if key in seen or len(merged) >= target:
+                        continue
+                    seen.add(key)
+                    merged.append(profile)
+                    found += 1
+                    if len(merged) >= target:
+                        stop.set()
+            logger.debug(f"Query contributed {found} new profiles: {query}")
+
+    async with get_candidate_index().run() as candidates:
+        await asyncio.gather(*(_run(query, candidates) for query in queries))
+    logger.info(f"Fan-out over {len(queries)} queries found {len(merged)} unique profiles.")
+    return merged
+
+
+def _to_candidate(profile_data: dict[str, Any]) -> CandidateProfile | None:
+    """Normalise one search hit into a :class:`CandidateProfile` (``None`` if unusable)."""
+    try:
+        # Basic normalization and data cleaning
+        name = profile_data.get("name", "").strip()
+        linkedin_url = profile_data.get("linkedin_url", "").split("?")[0]
+        title = profile_data.get("title", "").strip()
+        location = profile_data.get("location", "").strip()
+
+        # Fix common data extraction issues
+        if not name or name == "Unknown":
+            if title and " at " in title:
+                name = title.split(" at ")[0].strip()
+            else:
+                logger.warning(f"Could not determine name for profile: {profile_data}")
+                return None
+
+        if title == location and title:
+            location = ""
+
+        return CandidateProfile(
+            name=name,
+            linkedin_url=linkedin_url,
+            title=title,
+            location=location,
+            summary=profile_data.get("summary", ""),
+            skills=profile_data.get("skills", []),
+        )
+    except Exception as e:
+        logger.warning(f"Skipping profile due to validation error: {e} | Data: {profile_data}")
+        return None
+
+
+def _merge_enrichment(
+    profiles: List[CandidateProfile], concurrency: int | None
+) -> List[CandidateProfile]:
+    """Copy summary/skills from profile pages onto *profiles*; failures keep the search data."""
+    details = enrich_profiles([profile.linkedin_url for profile in profiles], concurrency=concurrency)
+    return _apply_enrichment(profiles, details)
+
+
+def _apply_enrichment(
+    profiles: List[CandidateProfile], details: List[dict[str, Any]]
+) -> List[CandidateProfile]:
+    merged = []
+    for profile, detail in zip(profiles, details, strict=True):
+        if "error" in detail:
+            merged.append(profile)
+            continue
+        merged.append(
+            profile.model_copy(
+                update={
+                    "summary": detail.get("summary") or profile.summary,
+                    "skills": detail.get("skills") or profile.skills,
+                }
+            )
+        )
+    return merged
+
+
+def _cache_lookup(
+    search_terms: str, limit: int, loop: asyncio.AbstractEventLoop | None = None
+) -> list[dict[str, Any]] | None:
+    """Return cached result cards for the search, revalidating stale ones in the background.
+
+    Async callers pass their event *loop*: the refresh then runs
+    :func:`~.scraping.search_linkedin_async` there, i.e. with the engine
+    selected by ``SCRAPER_BACKEND``. Without one it runs the Selenium search.
+    """
+    cache = get_search_cache()
+    if cache is None:
+        return None
+    try:
+        hit = cache.lookup(search_terms, limit)
+        if hit is None:
+            return None
+        if hit.stale:
+            cache.revalidate(search_terms, limit, lambda: _refresh_search(search_terms, limit, loop))
+    except Exception as e:  # noqa: BLE001
+        logger.warning(f"Search cache lookup failed: {e}")
+        return None
+    logger.info(f"Serving {len(hit.cards)} cached search results ({hit.age / 3600:.1f}h old): {search_terms}")
+    return hit.cards
+
+
+def _refresh_search(
+    search_terms: str, limit: int, loop: asyncio.AbstractEventLoop | None
+) -> list[dict[str, Any]]:
+    """Search again for a background cache refresh (see :func:`_cache_lookup`)."""
+    if loop is None:
+        return search_linkedin(search_terms, max_results=limit)
+    future = asyncio.run_coroutine_threadsafe(search_linkedin_async(search_terms, max_results=limit), loop)
+    return future.result()
+
+
+def _cache_store(search_terms: str, limit: int, cards: list[dict[str, Any]]) -> None:
+    """Remember the result cards of a completed search."""
+    cache = get_search_cache()
+    if cache is None:
+        return
+    try:
+        cache.store(search_terms, limit, cards)
+    except Exception as e:  # noqa: BLE001
+        logger.warning(f"Search cache store failed: {e}")
+
+
+def _sync_profile_store(profiles: List[CandidateProfile], record: bool = True) -> List[CandidateProfile]:
+    """Record the search-card fields and fill summary/skills from fresh stored profiles.
+
+    Cards replayed from the search cache pass ``record=False``: they were
+    recorded when first scraped and must not look freshly seen.
+    """
+    store = get_profile_store()
+    if store is None:
+        return profiles
+    try:
+        fresh = store.fresh_fields([profile.linkedin_url for profile in profiles])
+        if record:
+            store.put_many(
+                (
+                    (profile.linkedin_url, {f: getattr(profile, f) for f in CARD_FIELDS if getattr(profile, f)})
+                    for profile in profiles
+                ),
+                source="search",
+            )
+    except Exception as e:  # noqa: BLE001
+        logger.warning(f"Profile store unavailable: {e}")
+        return profiles
+
+    synced = []
+    for profile in profiles:
+        stored = fresh.get(profile.linkedin_url, {})
+        synced.append(
+            profile.model_copy(
+                update={
+                    "summary": profile.summary or stored.get("summary") or profile.summary,
+                    "skills": profile.skills or stored.get("skills") or profile.skills,
+                }
+            )
+        )
+    return synced
@@ -5,34 +5,135 @@ This module provides a simple session-based authentication flow:
 1. One-time browser login saves session cookies
 2. Future runs reuse saved session (no re-login needed)
 3. Modular design for easy UI integration later
+
+``undetected_chromedriver`` and selenium are only imported once a browser is
+actually started, keeping ``import sourceress.utils.linkedin_auth`` cheap.
+
+Scrapers borrow pre-authenticated browsers from a shared :class:`DriverPool`
+(see :func:`get_driver_pool`) instead of starting Chrome per request. Pool
+size and recycling are configured with ``LINKEDIN_DRIVER_POOL_SIZE``
+(default: 2) and ``LINKEDIN_DRIVER_MAX_PAGES`` (default: 50). Drivers from
+:meth:`LinkedInAuthenticator.get_authenticated_driver` skip the downloads
+listed in the :mod:`.resource_blocking` policy.
+
+Session cookies live in a JSON jar (``LINKEDIN_SESSION_FILE``, default
+``.linkedin_session.json``) whose ``li_at`` expiry is read without starting a
+browser; a pickle left by older versions is converted on first load. The
+:class:`SessionMonitor` (see :func:`get_session_monitor`) uses that expiry and
+the landing URL of each navigation to decide when the scrapers need to probe
+the page for sign-in prompts. ``LINKEDIN_SESSION_CHECK_INTERVAL`` (seconds,
+default: 300) forces a probe once the last confirmation is that old, and
+``LINKEDIN_SESSION_EXPIRY_MARGIN`` (seconds, default: 3600) treats a cookie
+that close to expiry as suspect.
 """
 
 from __future__ import annotations
 
+import atexit
+import json
+import os
 import pickle
+import threading
 import time
+from contextlib import contextmanager
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Callable, Iterator, Literal, Optional
+from urllib.parse import urlsplit
 
-import undetected_chromedriver as uc
 from loguru import logger
-from selenium.webdriver.common.by import By
+
+from .pacing import SCRAPE_METRICS, wait_until_settled
+from .resource_blocking import apply_to_driver, get_block_policy
+
+if TYPE_CHECKING:
+    import undetected_chromedriver as uc
+
+DRIVER_POOL_SIZE = int(os.getenv("LINKEDIN_DRIVER_POOL_SIZE", "2"))
+DRIVER_MAX_PAGES = int(os.getenv("LINKEDIN_DRIVER_MAX_PAGES", "50"))
+
+SESSION_FILE = Path(os.getenv("LINKEDIN_SESSION_FILE", ".linkedin_session.json"))
+SESSION_CHECK_INTERVAL = float(os.getenv("LINKEDIN_SESSION_CHECK_INTERVAL", "300"))
+SESSION_EXPIRY_MARGIN = float(os.getenv("LINKEDIN_SESSION_EXPIRY_MARGIN", "3600"))
+
+#: Cookie carrying the LinkedIn login; its expiry bounds the session.
+SESSION_COOKIE = "li_at"
+
+#: Format version written to the cookie jar.
+JAR_VERSION = 1
+
+# Paths LinkedIn redirects to once the session is gone.
+_AUTH_REDIRECT_PATHS = ("/login", "/authwall", "/checkpoint", "/uas/login", "/signup")
+
+
+@dataclass(frozen=True)
+class SessionHealth:
+    """State of the saved session as far as the cookie jar can tell.
+
+    Attributes:
+        status: ``"ok"``, ``"expiring"`` (within the margin asked for),
+            ``"expired"`` or ``"missing"`` (no jar or no ``li_at`` cookie).
+        expires_at: Unix time the ``li_at`` cookie expires, if it has an expiry.
+    """
+
+    status: Literal["ok", "expiring", "expired", "missing"]
+    expires_at: float | None = None
+
+    @property
+    def ok(self) -> bool:
+        """True while the session cookie has not expired."""
+        return self.status in ("ok", "expiring")
 
 
 class LinkedInAuthenticator:
     """Manages LinkedIn authentication using session persistence."""
     
-    def __init__(self, session_file: Path = Path(".linkedin_session")):
+    def __init__(self, session_file: Path = SESSION_FILE):
         """Initialize authenticator with session file path."""
         self.session_file = session_file
         self.driver: Optional[uc.Chrome] = None
     
+    @property
+    def legacy_file(self) -> Path | None:
+        """Pickle jar written by older versions (``.linkedin_session`` for the default path)."""
+        if self.session_file.suffix != ".json":
+            return None
+        return self.session_file.with_suffix("")
+    
     def has_valid_session(self) -> bool:
-        """Check if we have a saved session file."""
-        return self.session_file.exists()
+        """Check if we have a saved session whose login cookie has not expired."""
+        return self.session_health().ok
+    
+    def session_health(self, margin: float = 0.0) -> SessionHealth:
+        """Read the ``li_at`` expiry from the cookie jar.
+
+        Args:
+            margin: Seconds before expiry from which the session counts as
+                ``"expiring"``.
+        """
+        try:
+            cookies = self.load_cookies()
+        except FileNotFoundError:
+            return SessionHealth("missing")
+        except (OSError, ValueError, pickle.UnpicklingError) as e:
+            logger.warning(f"Unreadable LinkedIn session file {self.session_file}: {e}")
+            return SessionHealth("missing")
+
+        login = next((c for c in cookies if c.get("name") == SESSION_COOKIE), None)
+        if login is None:
+            return SessionHealth("missing")
+        if login.get("expiry") is None:
+            return SessionHealth("ok")
+        expires_at = float(login["expiry"])
+        remaining = expires_at - time.time()
+        if remaining <= 0:
+            return SessionHealth("expired", expires_at)
+        return SessionHealth("expiring" if remaining < margin else "ok", expires_at)
     
     def authenticate(self) -> None:
         """One-time authentication flow - opens browser for manual login."""
+        import undetected_chromedriver as uc
+
         logger.info("Starting LinkedIn authentication flow...")
         
         # Create browser instance
@@ -51,9 +152,7 @@ class LinkedInAuthenticator:
             self._wait_for_login_completion()
             
             # Save session cookies
-            cookies = self.driver.get_cookies()
-            with open(self.session_file, 'wb') as f:
-                pickle.dump(cookies, f)
+            self.save_cookies(self.driver.get_cookies())
             
             logger.info("✅ Authentication successful! Session saved.")
             
@@ -64,6 +163,8 @@ class LinkedInAuthenticator:
     
     def get_authenticated_driver(self) -> uc.Chrome:
         """Get an authenticated Chrome driver using saved session."""
+        import undetected_chromedriver as uc
+
         if not self.has_valid_session():
             raise ValueError("No saved session found. Run authenticate() first.")
         
@@ -75,14 +176,18 @@ class LinkedInAuthenticator:
         options.add_argument("--disable-blink-features=AutomationControlled")
         options.add_argument("--disable-gpu")
         options.add_argument("--window-size=1920,1080")
+        # Skip images, media, fonts and ad/telemetry hosts the scrapers never read
+        policy = get_block_policy()
+        for argument in policy.chrome_arguments():
+            options.add_argument(argument)
         
         self.driver = uc.Chrome(options=options)
+        apply_to_driver(self.driver, policy)
         
         # Load saved cookies
         self.driver.get("https://www.linkedin.com")
         
-        with open(self.session_file, 'rb') as f:
-            cookies = pickle.load(f)
+        cookies = self.load_cookies()
         
         for cookie in cookies:
             try:
@@ -90,9 +195,10 @@ class LinkedInAuthenticator:
             except Exception as e:
                 logger.debug(f"Failed to add cookie: {e}")
         
-        # Refresh to apply cookies
+        # Refresh to apply cookies and wait for the page to settle
         self.driver.refresh()
-        time.sleep(2)
+        waited, ready = wait_until_settled(self.driver)
+        SCRAPE_METRICS.record("session", waited, 0.0, timed_out=not ready, baseline=2.0)
         
         logger.info("✅ Using saved LinkedIn session")
         # Detach driver from this authenticator instance to prevent
@@ -102,8 +208,44 @@ class LinkedInAuthenticator:
         self.driver = None  # Avoid auto-quit in __del__
         return driver_to_return
     
+    def save_cookies(self, cookies: list[dict[str, Any]]) -> None:
+        """Write *cookies* (Selenium ``get_cookies()`` format) to the JSON jar.
+
+        The file is replaced atomically and readable by the owner only.
+        """
+        jar = {"version": JAR_VERSION, "saved_at": time.time(), "cookies": cookies}
+        tmp = self.session_file.with_name(f"{self.session_file.name}.tmp")
+        tmp.write_text(json.dumps(jar, indent=2), encoding="utf-8")
+        tmp.chmod(0o600)
+        tmp.replace(self.session_file)
+    
+    def load_cookies(self) -> list[dict[str, Any]]:
+        """Return the saved session cookies (Selenium ``get_cookies()`` format).
+
+        A legacy pickle jar is converted to JSON (and removed) on first load.
+
+        Raises:
+            FileNotFoundError: No session has been saved.
+            ValueError: The jar is malformed or from an unknown version.
+        """
+        legacy = self.legacy_file
+        if not self.session_file.exists() and legacy is not None and legacy.exists():
+            with open(legacy, 'rb') as f:
+                cookies = pickle.load(f)
+            self.save_cookies(cookies)
+            legacy.unlink()
+            logger.info(f"Converted legacy session {legacy} to {self.session_file}")
+            return cookies
+
+        jar = json.loads(self.session_file.read_text(encoding="utf-8"))
+        if not isinstance(jar, dict) or jar.get("version") != JAR_VERSION:
+            raise ValueError(f"Unsupported session jar format in {self.session_file}")
+        return list(jar["cookies"])
+    
     def _wait_for_login_completion(self) -> None:
         """Wait for user to complete LinkedIn login."""
+        from selenium.webdriver.common.by import By
+
         max_wait = 300  # 5 minutes
         wait_time = 0
         
@@ -136,9 +278,10 @@ class LinkedInAuthenticator:
     
     def clear_session(self) -> None:
         """Clear saved session (forces re-authentication)."""
-        if self.session_file.exists():
-            self.session_file.unlink()
-            logger.info("Session cleared")
+        for path in (self.session_file, self.legacy_file):
+            if path is not None and path.exists():
+                path.unlink()
+                logger.info("Session cleared")
     
     def __del__(self):
         """Cleanup driver on destruction."""
@@ -151,9 +294,17 @@ class LinkedInAuthenticator:
 
 # Convenience functions for easy usage
 def authenticate_linkedin() -> None:
-    """One-time setup: authenticate with LinkedIn."""
+    """One-time setup: authenticate with LinkedIn.
+
+    Pooled drivers still carry the previous cookies, so the shared
+    :class:`DriverPool` is invalidated along with the session monitor.
+    """
     auth = LinkedInAuthenticator()
     auth.authenticate()
+    if _MONITOR is not None:
+        _MONITOR.reset()
+    if _POOL is not None:
+        _POOL.invalidate()
 
 
 def get_linkedin_driver() -> uc.Chrome:
@@ -166,3 +317,326 @@ def is_linkedin_authenticated() -> bool:
     """Check if LinkedIn session exists."""
     auth = LinkedInAuthenticator()
     return auth.has_valid_session()
+
+
+def load_session_cookies() -> list[dict[str, Any]]:
+    """Return the saved LinkedIn session cookies."""
+    auth = LinkedInAuthenticator()
+    return auth.load_cookies()
+
+
+# -----------------------------------------------------------------------------
+# Session monitoring
+# -----------------------------------------------------------------------------
+
+
+class SessionExpiredError(ValueError):
+    """Raised when LinkedIn signs a scraping browser out part-way through a run."""
+
+
+def is_auth_redirect(url: str) -> bool:
+    """Return True if *url* is one of LinkedIn's login, authwall or challenge pages."""
+    path = urlsplit(url).path.lower()
+    return any(path.startswith(prefix) for prefix in _AUTH_REDIRECT_PATHS)
+
+
+def _same_page(requested: str, landed: str) -> bool:
+    return urlsplit(requested).path.rstrip("/").lower() == urlsplit(landed).path.rstrip("/").lower()
+
+
+class SessionMonitor:
+    """Decides which navigations need a DOM probe for sign-in prompts.
+
+    Most page loads are settled from the landing URL alone: an auth redirect
+    means the session is gone, and a page that landed where it was sent means
+    it is still live. The probe is asked for only on suspicion – the browser
+    ended up somewhere else, the saved ``li_at`` cookie is expired or within
+    ``expiry_margin`` seconds of it, or no probe has confirmed the session for
+    ``interval`` seconds. The cookie jar is re-read at most once per interval.
+
+    Args:
+        authenticator: Source of the cookie jar (default: a fresh
+            :class:`LinkedInAuthenticator`).
+        interval: Seconds after which the session is re-probed regardless.
+        expiry_margin: Seconds before ``li_at`` expiry from which every
+            navigation is probed.
+
+    ``probes`` counts the navigations that needed the DOM probe and
+    ``skipped`` those settled without it.
+    """
+
+    def __init__(
+        self,
+        authenticator: LinkedInAuthenticator | None = None,
+        interval: float = SESSION_CHECK_INTERVAL,
+        expiry_margin: float = SESSION_EXPIRY_MARGIN,
+    ) -> None:
+        self._auth = authenticator or LinkedInAuthenticator()
+        self.interval = interval
+        self.expiry_margin = expiry_margin
+        self.probes = 0
+        self.skipped = 0
+        self._health: SessionHealth | None = None
+        self._health_read_at = 0.0
+        self._confirmed_at: float | None = None
+        self._lock = threading.Lock()
+
+    def assess(self, requested_url: str, landed_url: str) -> bool | None:
+        """Judge a navigation to *requested_url* that ended on *landed_url*.
+
+        Returns:
+            True if signed out, False if the session is live, or None when the
+            caller should probe the page and report back via :meth:`record_probe`.
+        """
+        if is_auth_redirect(landed_url):
+            with self._lock:
+                self._confirmed_at = None
+            return True
+
+        now = time.monotonic()
+        with self._lock:
+            if (
+                self._confirmed_at is not None
+                and now - self._confirmed_at <= self.interval
+                and _same_page(requested_url, landed_url)
+                and self._session_health(now).status == "ok"
+            ):
+                self.skipped += 1
+                return False
+            self.probes += 1
+            return None
+
+    def record_probe(self, signed_out: bool) -> None:
+        """Record the outcome of a DOM probe requested by :meth:`assess`."""
+        with self._lock:
+            self._confirmed_at = None if signed_out else time.monotonic()
+
+    def reset(self) -> None:
+        """Forget earlier confirmations and re-read the jar (e.g. after re-authentication)."""
+        with self._lock:
+            self._confirmed_at = None
+            self._health = None
+
+    def stats(self) -> dict[str, int]:
+        """Return how many navigations were probed and how many were not."""
+        with self._lock:
+            return {"probes": self.probes, "skipped": self.skipped}
+
+    def _session_health(self, now: float) -> SessionHealth:
+        # Caller holds ``self._lock``.
+        if self._health is None or now - self._health_read_at > self.interval:
+            self._health = self._auth.session_health(self.expiry_margin)
+            self._health_read_at = now
+        return self._health
+
+
+_MONITOR: SessionMonitor | None = None
+_MONITOR_LOCK = threading.Lock()
+
+
+def get_session_monitor() -> SessionMonitor:
+    """Return the process-wide :class:`SessionMonitor`, creating it on first use."""
+
+    global _MONITOR
+    with _MONITOR_LOCK:
+        if _MONITOR is None:
+            _MONITOR = SessionMonitor()
+        return _MONITOR
+
+
+# -----------------------------------------------------------------------------
+# Driver pool
+# -----------------------------------------------------------------------------
+
+
+class DriverPool:
+    """Bounded, thread-safe pool of pre-authenticated Chrome drivers.
+
+    Starting Chrome and replaying the session cookies costs several seconds,
+    so drivers are kept warm between requests. :meth:`checkout` hands out an
+    idle driver (after a cheap health check) or starts a new one while fewer
+    than ``size`` exist, otherwise it blocks until one is checked back in.
+    Drivers are quit and replaced after ``max_pages`` navigations to cap
+    Chrome's memory growth, and :meth:`invalidate` retires every driver
+    started before a re-authentication.
+
+    Args:
+        size: Maximum number of live drivers.
+        max_pages: Navigations after which a driver is recycled.
+        factory: Creates a ready-to-use driver (default: :func:`get_linkedin_driver`).
+    """
+
+    def __init__(
+        self,
+        size: int = DRIVER_POOL_SIZE,
+        max_pages: int = DRIVER_MAX_PAGES,
+        factory: Callable[[], Any] | None = None,
+    ) -> None:
+        self.size = max(1, size)
+        self.max_pages = max_pages
+        self._factory = factory or get_linkedin_driver
+        self._idle: list[Any] = []
+        self._pages: dict[int, int] = {}
+        self._generation: dict[int, int] = {}
+        self._current_generation = 0
+        self._live = 0
+        self._closed = False
+        self._cond = threading.Condition()
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def checkout(self, timeout: float | None = None) -> Any:
+        """Borrow a healthy driver, starting one if the pool has room.
+
+        Raises:
+            TimeoutError: No driver became available within *timeout* seconds.
+        """
+
+        while True:
+            with self._cond:
+                if self._closed:
+                    raise RuntimeError("DriverPool is closed")
+                if not self._cond.wait_for(lambda: self._idle or self._live < self.size, timeout):
+                    raise TimeoutError("Timed out waiting for a LinkedIn driver")
+                if self._idle:
+                    driver = self._idle.pop()
+                else:
+                    self._live += 1
+                    driver = None
+
+            if driver is None:
+                return self._start()
+            if _is_healthy(driver):
+                return driver
+            logger.info("Discarding unresponsive LinkedIn driver")
+            self._retire(driver)
+
+    def checkin(self, driver: Any, *, discard: bool = False) -> None:
+        """Return *driver* to the pool; quit it if discarded, stale or worn out."""
+
+        with self._cond:
+            worn_out = self._pages.get(id(driver), 0) >= self.max_pages
+            stale = self._generation.get(id(driver)) != self._current_generation
+            if not (discard or worn_out or stale or self._closed):
+                self._idle.append(driver)
+                self._cond.notify()
+                return
+
+        if worn_out:
+            logger.debug(f"Recycling LinkedIn driver after {self.max_pages} pages")
+        self._retire(driver)
+
+    @contextmanager
+    def driver(self, timeout: float | None = None) -> Iterator[Any]:
+        """Context manager around :meth:`checkout` / :meth:`checkin`."""
+
+        driver = self.checkout(timeout)
+        try:
+            yield driver
+        finally:
+            self.checkin(driver)
+
+    def grow(self, size: int) -> None:
+        """Raise the driver limit to at least *size* (never shrinks)."""
+
+        with self._cond:
+            if size > self.size:
+                self.size = size
+                self._cond.notify_all()
+
+    def record_page(self, driver: Any) -> None:
+        """Count one navigation against *driver*'s recycling budget."""
+
+        with self._cond:
+            self._pages[id(driver)] = self._pages.get(id(driver), 0) + 1
+
+    def invalidate(self) -> None:
+        """Retire every existing driver (e.g. after the session cookies changed).
+
+        Idle drivers are quit now; drivers in use are quit when checked in.
+        """
+
+        with self._cond:
+            self._current_generation += 1
+            idle, self._idle = self._idle, []
+        for driver in idle:
+            self._retire(driver)
+
+    def close(self) -> None:
+        """Quit idle drivers and refuse further checkouts. Idempotent."""
+
+        with self._cond:
+            self._closed = True
+        self.invalidate()
+
+    @property
+    def live(self) -> int:
+        """Number of drivers currently alive (idle or checked out)."""
+
+        with self._cond:
+            return self._live
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _start(self) -> Any:
+        try:
+            driver = self._factory()
+        except BaseException:
+            with self._cond:
+                self._live -= 1
+                self._cond.notify()
+            raise
+        with self._cond:
+            self._pages[id(driver)] = 0
+            self._generation[id(driver)] = self._current_generation
+        logger.debug(f"Started pooled LinkedIn driver ({self.live}/{self.size})")
+        return driver
+
+    def _retire(self, driver: Any) -> None:
+        with self._cond:
+            self._pages.pop(id(driver), None)
+            self._generation.pop(id(driver), None)
+            self._live -= 1
+            self._cond.notify()
+        try:
+            driver.quit()
+        except Exception as exc:  # noqa: BLE001
+            logger.debug(f"Error quitting LinkedIn driver: {exc}")
+
+
+def _is_healthy(driver: Any) -> bool:
+    """Cheap liveness probe – a crashed or closed browser raises here."""
+
+    try:
+        return bool(driver.window_handles) and driver.current_url is not None
+    except Exception:  # noqa: BLE001
+        return False
+
+
+_POOL: DriverPool | None = None
+_POOL_LOCK = threading.Lock()
+
+
+def get_driver_pool() -> DriverPool:
+    """Return the process-wide driver pool, creating it on first use."""
+
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None:
+            _POOL = DriverPool()
+            atexit.register(close_driver_pool)
+        return _POOL
+
+
+def close_driver_pool() -> None:
+    """Quit all pooled drivers. Safe to call when no pool was created."""
+
+    global _POOL
+    with _POOL_LOCK:
+        pool, _POOL = _POOL, None
+    if pool is not None:
+        pool.close()
@@ -9,7 +9,67 @@ This module currently supports two free/non-OpenAI options:
    Docs: https://openrouter.ai/docs
 
 An environment variable ``LLM_BACKEND`` determines which route to use. Allowed
-values: ``huggingface`` (default) or ``openrouter``.
+values: ``huggingface`` (default), ``huggingface-cpu`` or ``openrouter``.
+
+``huggingface-cpu`` is the GPU-less variant of the local backend: weights are
+loaded on the CPU (``HF_DEVICE``) with int8 dynamic quantisation by default
+(``HF_QUANTIZATION``: ``none``, ``int8`` or ``4bit``; 4-bit needs
+``bitsandbytes`` and falls back to int8 on the CPU, or to no quantisation on
+other devices, without it). CPU int8 models are loaded in bf16 and quantised
+one layer at a time, so a 7B model peaks at about 14 GB instead of the 28 GB
+of an fp32 load. A model may also carry its
+own setting as a suffix, e.g. ``HF_MODEL=mistralai/Mistral-7B-Instruct-v0.2:4bit``.
+Safetensors checkpoints are memory-mapped with ``low_cpu_mem_usage``, torch's
+intra-/inter-op thread pools are pinned to ``HF_NUM_THREADS`` /
+``HF_NUM_INTEROP_THREADS`` and each model runs one warm-up generation when it
+is loaded.
+
+Hugging Face models are loaded once per process and kept in a small LRU
+registry (see :class:`ModelRegistry`). ``HF_CACHE_MAX_GB`` caps the combined
+memory footprint of resident models (default: 16); call :func:`warmup` at
+start-up to pay the load cost before the first request arrives. Concurrent
+HF calls are coalesced by a :class:`MicroBatcher` into padded batches
+(``HF_BATCH_WINDOW_MS``, default: 20; ``HF_MAX_BATCH_SIZE``, default: 8);
+:func:`async_chat_many` is the convenience entry point for fan-out.
+
+Long system prompts are prefilled once per model: the ``past_key_values`` of
+the ``<s>[INST] {system}`` prefix are kept on the registry entry (LRU,
+``HF_PREFIX_CACHE_SIZE``, default: 8) and copied into each call, so only the
+variable user text is run through the model. The prompt is still tokenised
+whole, and the state is only reused if those ids begin with the prefix ids.
+It applies to streamed calls and single-prompt batches whose prefix has at
+least ``HF_PREFIX_MIN_CHARS`` characters (default: 256); ``HF_PREFIX_CACHE=0``
+turns it off.
+
+:func:`async_chat_stream` yields the reply incrementally (OpenRouter SSE or a
+HF ``TextIteratorStreamer``); ``async_chat(..., stop_when=...)`` uses it to
+stop generation as soon as the caller has what it needs.
+
+Every call passes through an :class:`AdaptiveLimiter` per backend and model: a
+token bucket plus a concurrency cap (``LLM_MAX_CONCURRENCY``) whose rate starts
+at ``LLM_RATE_LIMIT`` requests/s and adapts AIMD-style – additive increase on
+success up to ``LLM_MAX_RATE``, multiplicative decrease on HTTP 429 or when
+latency exceeds ``LLM_LATENCY_TARGET_S``. ``Retry-After`` is honoured.
+
+Each call is recorded in :data:`METRICS` (tokens, latency, time-to-first-token,
+queue wait, cache hit, error) and tagged with the calling agent's name – see
+:func:`calling_agent`. Inspect it with :func:`get_metrics` or write it out with
+:func:`export_metrics` (JSON lines, or Prometheus text for ``.prom`` files);
+``LLM_METRICS_PATH`` exports automatically at pipeline shutdown.
+
+OpenRouter calls share one long-lived ``aiohttp`` session per event loop
+(keep-alive, per-host connection limit, DNS cache). Call :func:`aclose` before
+the loop shuts down; :func:`sourceress.workflows.run_end_to_end` does this for
+you.
+
+Completions are memoised on disk (SQLite under ``SOURCERESS_CACHE_DIR``),
+keyed by a hash of backend, model, prompts and sampling parameters. Pass
+``cache=False`` to bypass it for a single call or set ``LLM_CACHE=0`` to turn
+it off; ``LLM_CACHE_TTL_HOURS`` (default: 168) and ``LLM_CACHE_MAX_MB``
+(default: 256) bound its age and size. :func:`cache_stats` reports hit/miss
+counters. The cache file is opened on first use, so ``SOURCERESS_CACHE_DIR``
+may be set after import; :func:`reset_response_cache` closes it so the next
+call picks up a new directory.
 
 Usage
 -----
@@ -20,33 +80,219 @@ Usage
 from __future__ import annotations
 
 import asyncio
+import copy
+import importlib.util
+import json
 import os
-from typing import Any, Literal
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable, Iterator, Literal, NamedTuple, Sequence
 
 import aiohttp
 from loguru import logger
 
+from .cache import SQLiteCache, default_cache_dir, make_key
+
 BACKEND = os.getenv("LLM_BACKEND", "huggingface").lower()
 HF_MODEL = os.getenv("HF_MODEL", "mistralai/Mistral-7B-Instruct-v0.2")
+HF_DEVICE = os.getenv("HF_DEVICE", "cpu" if BACKEND == "huggingface-cpu" else "auto")
+HF_QUANTIZATION = os.getenv(
+    "HF_QUANTIZATION", "int8" if BACKEND == "huggingface-cpu" else "none"
+).lower()
+HF_NUM_THREADS = int(os.getenv("HF_NUM_THREADS", "0"))  # 0 = torch default
+HF_NUM_INTEROP_THREADS = int(os.getenv("HF_NUM_INTEROP_THREADS", "0"))
 OPENROUTER_API_KEY = os.getenv("OPENROUTER_API_KEY")
 OPENROUTER_MODEL = os.getenv("OPENROUTER_MODEL", "mistralai/mistral-7b-instruct")
+OPENROUTER_BASE_URL = os.getenv("OPENROUTER_BASE_URL", "https://openrouter.ai/api/v1")
+OPENROUTER_MAX_CONNECTIONS = int(os.getenv("OPENROUTER_MAX_CONNECTIONS", "16"))
+HF_CACHE_MAX_BYTES = int(float(os.getenv("HF_CACHE_MAX_GB", "16")) * 1024**3)
+HF_BATCH_WINDOW = float(os.getenv("HF_BATCH_WINDOW_MS", "20")) / 1000
+HF_MAX_BATCH_SIZE = int(os.getenv("HF_MAX_BATCH_SIZE", "8"))
+HF_PREFIX_CACHE_ENABLED = os.getenv("HF_PREFIX_CACHE", "1").lower() not in {
+    "0",
+    "false",
+    "no",
+    "off",
+}
+HF_PREFIX_CACHE_SIZE = int(os.getenv("HF_PREFIX_CACHE_SIZE", "8"))
+HF_PREFIX_MIN_CHARS = int(os.getenv("HF_PREFIX_MIN_CHARS", "256"))
+LLM_CACHE_ENABLED = os.getenv("LLM_CACHE", "1").lower() not in {"0", "false", "no", "off"}
+LLM_CACHE_TTL = float(os.getenv("LLM_CACHE_TTL_HOURS", "168")) * 3600
+LLM_CACHE_MAX_BYTES = int(float(os.getenv("LLM_CACHE_MAX_MB", "256")) * 1024**2)
+LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "8"))
+LLM_RATE_LIMIT = float(os.getenv("LLM_RATE_LIMIT", "2"))
+LLM_MAX_RATE = float(os.getenv("LLM_MAX_RATE", "10"))
+LLM_LATENCY_TARGET = float(os.getenv("LLM_LATENCY_TARGET_S", "20"))
+LLM_THROTTLE_RETRIES = int(os.getenv("LLM_THROTTLE_RETRIES", "5"))
+LLM_METRICS_PATH = os.getenv("LLM_METRICS_PATH")
 
-__all__ = ["async_chat", "generate"]
+__all__ = [
+    "async_chat",
+    "async_chat_many",
+    "async_chat_stream",
+    "generate",
+    "warmup",
+    "aclose",
+    "cache_stats",
+    "reset_response_cache",
+    "calling_agent",
+    "export_metrics",
+    "get_metrics",
+    "get_limiter",
+    "AdaptiveLimiter",
+    "LLMCallRecord",
+    "LLMMetrics",
+    "MicroBatcher",
+    "ModelRegistry",
+    "RateLimitError",
+    "SessionManager",
+]
 
+_RESPONSE_CACHE: SQLiteCache | None = None
+_RESPONSE_CACHE_LOCK = threading.Lock()
 
-async def async_chat(system_prompt: str, user_prompt: str, **kwargs: Any) -> str:  # noqa: D401
+
+async def async_chat(
+    system_prompt: str,
+    user_prompt: str,
+    *,
+    cache: bool = True,
+    stop_when: Callable[[str], bool] | None = None,
+    **kwargs: Any,
+) -> str:  # noqa: D401
     """Generate a chat completion.
 
     Args:
         system_prompt: Role instruction passed to the model.
         user_prompt: User message.
+        cache: Serve/store the reply from the persistent response cache.
+        stop_when: Optional callback fed each streamed chunk; once it returns
+            ``True`` generation is stopped and the text so far is returned.
         **kwargs: Backend-specific overrides such as ``temperature`` or ``max_tokens``.
 
     Returns:
         The assistant's reply as a string.
     """
 
-    if BACKEND == "huggingface":
+    with _track("chat", kwargs) as stats:
+        params = {**kwargs, "stop_when": stop_when is not None}
+        key = _cache_key("chat", system_prompt, user_prompt, params) if cache else None
+        cached = _cache_lookup(key)
+        if cached is not None:
+            stats.cache_hit = True
+            return cached
+
+        if stop_when is None:
+            reply = await _chat_backend(system_prompt, user_prompt, stats=stats, **kwargs)
+        else:
+            chunks: list[str] = []
+            stream = _stream_backend(system_prompt, user_prompt, stats=stats, **kwargs)
+            try:
+                async for chunk in stream:
+                    stats.first_token()
+                    chunks.append(chunk)
+                    if stop_when(chunk):
+                        break
+            finally:
+                await stream.aclose()
+            reply = "".join(chunks).strip()
+
+        _cache_store(key, reply)
+        return reply
+
+
+async def async_chat_stream(
+    system_prompt: str, user_prompt: str, **kwargs: Any
+) -> AsyncIterator[str]:
+    """Stream a chat completion chunk by chunk.
+
+    Closing the iterator early (``break`` or ``aclose()``) stops generation on
+    the backend. Streamed replies bypass the response cache.
+
+    Args:
+        system_prompt: Role instruction passed to the model.
+        user_prompt: User message.
+        **kwargs: Backend-specific overrides such as ``temperature`` or ``max_new_tokens``.
+
+    Yields:
+        Text fragments in generation order.
+    """
+
+    with _track("stream", kwargs) as stats:
+        stream = _stream_backend(system_prompt, user_prompt, stats=stats, **kwargs)
+        try:
+            async for chunk in stream:
+                stats.first_token()
+                yield chunk
+        finally:
+            await stream.aclose()
+
+
+async def async_chat_many(
+    prompts: Sequence[tuple[str, str]], **kwargs: Any
+) -> list[str]:  # noqa: D401
+    """Generate chat completions for several ``(system_prompt, user_prompt)`` pairs.
+
+    Calls are issued concurrently; on the Hugging Face backend they are
+    coalesced into batched ``generate`` calls by the micro-batcher.
+
+    Args:
+        prompts: ``(system_prompt, user_prompt)`` pairs.
+        **kwargs: Forwarded to :func:`async_chat` for every pair.
+
+    Returns:
+        Replies in the same order as *prompts*.
+    """
+
+    return list(
+        await asyncio.gather(*(async_chat(system, user, **kwargs) for system, user in prompts))
+    )
+
+
+auto_backend_type = Literal["huggingface", "huggingface-cpu", "openrouter"]
+
+_HF_BACKENDS = {"huggingface", "huggingface-cpu"}
+
+
+async def generate(prompt: str, *, cache: bool = True, **kwargs: Any) -> str:  # noqa: D401
+    """Single-prompt generation helper (non-chat)."""
+
+    with _track("generate", kwargs) as stats:
+        key = _cache_key("generate", "", prompt, kwargs) if cache else None
+        cached = _cache_lookup(key)
+        if cached is not None:
+            stats.cache_hit = True
+            return cached
+
+        reply = await _generate_backend(prompt, stats=stats, **kwargs)
+        _cache_store(key, reply)
+        return reply
+
+
+def cache_stats() -> dict[str, int]:
+    """Return hit/miss counters and size of the persistent response cache."""
+
+    return _response_cache().stats()
+
+
+def reset_response_cache() -> None:
+    """Close the response cache; the next call reopens it under the current ``SOURCERESS_CACHE_DIR``."""
+
+    global _RESPONSE_CACHE
+    with _RESPONSE_CACHE_LOCK:
+        if _RESPONSE_CACHE is not None:
+            _RESPONSE_CACHE.close()
+        _RESPONSE_CACHE = None
+
+
+async def _chat_backend(system_prompt: str, user_prompt: str, **kwargs: Any) -> str:
+    if BACKEND in _HF_BACKENDS:
         return await _hf_chat(system_prompt, user_prompt, **kwargs)
     if BACKEND == "openrouter":
         return await _openrouter_chat(system_prompt, user_prompt, **kwargs)
@@ -54,13 +300,17 @@ async def async_chat(system_prompt: str, user_prompt: str, **kwargs: Any) -> str
     raise ValueError(f"Unsupported LLM_BACKEND: {BACKEND}")
 
 
-auto_backend_type = Literal["huggingface", "openrouter"]
+def _stream_backend(system_prompt: str, user_prompt: str, **kwargs: Any) -> AsyncIterator[str]:
+    if BACKEND in _HF_BACKENDS:
+        return _hf_chat_stream(system_prompt, user_prompt, **kwargs)
+    if BACKEND == "openrouter":
+        return _openrouter_chat_stream(system_prompt, user_prompt, **kwargs)
 
+    raise ValueError(f"Unsupported LLM_BACKEND: {BACKEND}")
 
-async def generate(prompt: str, **kwargs: Any) -> str:  # noqa: D401
-    """Single-prompt generation helper (non-chat)."""
 
-    if BACKEND == "huggingface":
+async def _generate_backend(prompt: str, **kwargs: Any) -> str:
+    if BACKEND in _HF_BACKENDS:
         return await _hf_generate(prompt, **kwargs)
     if BACKEND == "openrouter":
         return await _openrouter_generate(prompt, **kwargs)
@@ -68,36 +318,1106 @@ async def generate(prompt: str, **kwargs: Any) -> str:  # noqa: D401
     raise ValueError(f"Unsupported LLM_BACKEND: {BACKEND}")
 
 
+# -----------------------------------------------------------------------------
+# Persistent response cache
+# -----------------------------------------------------------------------------
+
+
+def _cache_key(
+    kind: str, system_prompt: str, user_prompt: str, kwargs: dict[str, Any]
+) -> str | None:
+    """Content-address a call; ``None`` when caching is disabled."""
+
+    if not LLM_CACHE_ENABLED:
+        return None
+    default_model = OPENROUTER_MODEL if BACKEND == "openrouter" else HF_MODEL
+    params = {k: v for k, v in kwargs.items() if k != "model"}
+    model = kwargs.get("model", default_model)
+    return make_key(kind, BACKEND, model, system_prompt, user_prompt, params)
+
+
+def _response_cache() -> SQLiteCache:
+    """Return the response cache, opened under ``SOURCERESS_CACHE_DIR`` on first use."""
+
+    global _RESPONSE_CACHE
+    with _RESPONSE_CACHE_LOCK:
+        if _RESPONSE_CACHE is None:
+            _RESPONSE_CACHE = SQLiteCache(
+                default_cache_dir() / "llm_cache.sqlite",
+                ttl=LLM_CACHE_TTL,
+                max_bytes=LLM_CACHE_MAX_BYTES,
+            )
+        return _RESPONSE_CACHE
+
+
+def _cache_lookup(key: str | None) -> str | None:
+    if key is None:
+        return None
+    try:
+        reply = _response_cache().get(key)
+    except Exception as exc:  # noqa: BLE001
+        logger.warning(f"LLM cache lookup failed: {exc}")
+        return None
+    if reply is not None:
+        logger.debug(f"LLM cache hit ({key[:12]})")
+    return reply
+
+
+def _cache_store(key: str | None, reply: str) -> None:
+    if key is None:
+        return
+    try:
+        _response_cache().set(key, reply)
+    except Exception as exc:  # noqa: BLE001
+        logger.warning(f"LLM cache write failed: {exc}")
+
+
+# -----------------------------------------------------------------------------
+# Instrumentation
+# -----------------------------------------------------------------------------
+
+_CURRENT_AGENT: ContextVar[str | None] = ContextVar("llm_calling_agent", default=None)
+
+
+@contextmanager
+def calling_agent(name: str) -> Iterator[None]:
+    """Tag LLM calls made inside this block with the agent *name*.
+
+    :class:`sourceress.agents.base.BaseAgent` wraps every ``run`` in this.
+    """
+
+    token = _CURRENT_AGENT.set(name)
+    try:
+        yield
+    finally:
+        _CURRENT_AGENT.reset(token)
+
+
+@dataclass(frozen=True)
+class LLMCallRecord:
+    """Measurements for a single LLM call (times in seconds)."""
+
+    timestamp: float
+    agent: str | None
+    backend: str
+    model: str
+    kind: str
+    latency: float
+    queue_wait: float
+    time_to_first_token: float | None
+    prompt_tokens: int | None
+    completion_tokens: int | None
+    cache_hit: bool
+    error: str | None
+
+
+@dataclass
+class _CallStats:
+    """Mutable per-call scratchpad filled in by the back-ends."""
+
+    started: float = field(default_factory=time.monotonic)
+    queue_wait: float = 0.0
+    time_to_first_token: float | None = None
+    prompt_tokens: int | None = None
+    completion_tokens: int | None = None
+    cache_hit: bool = False
+
+    def first_token(self) -> None:
+        if self.time_to_first_token is None:
+            self.time_to_first_token = time.monotonic() - self.started
+
+
+class LLMMetrics:
+    """In-process store of :class:`LLMCallRecord` with summary and export helpers.
+
+    Keeps the most recent ``max_records`` calls; thread-safe.
+    """
+
+    def __init__(self, max_records: int = 10_000) -> None:
+        self._records: deque[LLMCallRecord] = deque(maxlen=max_records)
+        self._lock = threading.Lock()
+
+    def record(self, record: LLMCallRecord) -> None:
+        with self._lock:
+            self._records.append(record)
+
+    def records(self) -> list[LLMCallRecord]:
+        """Snapshot of all retained records, oldest first."""
+        with self._lock:
+            return list(self._records)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._records.clear()
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """Aggregate the records per calling agent (``"unknown"`` if untagged)."""
+
+        grouped: dict[str, list[LLMCallRecord]] = {}
+        for record in self.records():
+            grouped.setdefault(record.agent or "unknown", []).append(record)
+
+        summary: dict[str, dict[str, float]] = {}
+        for agent, records in grouped.items():
+            latencies = sorted(record.latency for record in records)
+            ttfts = [r.time_to_first_token for r in records if r.time_to_first_token is not None]
+            summary[agent] = {
+                "calls": len(records),
+                "errors": sum(1 for r in records if r.error),
+                "cache_hits": sum(1 for r in records if r.cache_hit),
+                "prompt_tokens": sum(r.prompt_tokens or 0 for r in records),
+                "completion_tokens": sum(r.completion_tokens or 0 for r in records),
+                "latency_total": sum(latencies),
+                "latency_mean": sum(latencies) / len(latencies),
+                "latency_p95": latencies[max(0, int(len(latencies) * 0.95) - 1)],
+                "queue_wait_total": sum(r.queue_wait for r in records),
+                "ttft_mean": sum(ttfts) / len(ttfts) if ttfts else 0.0,
+            }
+        return summary
+
+    def to_prometheus(self) -> str:
+        """Render counters and latency sums in the Prometheus text format."""
+
+        series: dict[tuple[str, str, str], dict[str, float]] = {}
+        for r in self.records():
+            labels = (r.agent or "unknown", r.backend, r.model)
+            agg = series.setdefault(labels, dict.fromkeys(_PROMETHEUS_SERIES, 0.0))
+            agg["calls_total"] += 1
+            agg["errors_total"] += 1 if r.error else 0
+            agg["cache_hits_total"] += 1 if r.cache_hit else 0
+            agg["prompt_tokens_total"] += r.prompt_tokens or 0
+            agg["completion_tokens_total"] += r.completion_tokens or 0
+            agg["latency_seconds_sum"] += r.latency
+            agg["latency_seconds_count"] += 1
+            agg["queue_wait_seconds_sum"] += r.queue_wait
+            if r.time_to_first_token is not None:
+                agg["time_to_first_token_seconds_sum"] += r.time_to_first_token
+                agg["time_to_first_token_seconds_count"] += 1
+
+        lines: list[str] = []
+        for name, (metric_type, help_text) in _PROMETHEUS_SERIES.items():
+            lines.append(f"# HELP sourceress_llm_{name} {help_text}")
+            lines.append(f"# TYPE sourceress_llm_{name} {metric_type}")
+            for (agent, backend, model), agg in sorted(series.items()):
+                label_str = f'agent="{agent}",backend="{backend}",model="{model}"'
+                lines.append(f"sourceress_llm_{name}{{{label_str}}} {agg[name]:g}")
+        return "\n".join(lines) + "\n"
+
+    def export(self, path: Path | str) -> Path:
+        """Write the records to *path* – Prometheus text for ``.prom``/``.txt``, else JSON lines."""
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if path.suffix in {".prom", ".txt"}:
+            path.write_text(self.to_prometheus(), encoding="utf-8")
+        else:
+            with path.open("w", encoding="utf-8") as fh:
+                for record in self.records():
+                    fh.write(json.dumps(asdict(record)) + "\n")
+        return path
+
+
+_PROMETHEUS_SERIES: dict[str, tuple[str, str]] = {
+    "calls_total": ("counter", "LLM calls."),
+    "errors_total": ("counter", "LLM calls that raised."),
+    "cache_hits_total": ("counter", "LLM calls served from the response cache."),
+    "prompt_tokens_total": ("counter", "Prompt tokens sent."),
+    "completion_tokens_total": ("counter", "Completion tokens received."),
+    "latency_seconds_sum": ("counter", "Total wall time spent in LLM calls."),
+    "latency_seconds_count": ("counter", "Number of timed LLM calls."),
+    "queue_wait_seconds_sum": ("counter", "Time spent waiting for the limiter or a batch."),
+    "time_to_first_token_seconds_sum": ("counter", "Total time to first streamed token."),
+    "time_to_first_token_seconds_count": ("counter", "Number of streamed LLM calls."),
+}
+
+METRICS = LLMMetrics()
+
+
+def get_metrics() -> LLMMetrics:
+    """Return the process-wide LLM metrics store."""
+
+    return METRICS
+
+
+def export_metrics(path: Path | str) -> Path:
+    """Write :data:`METRICS` to *path* (see :meth:`LLMMetrics.export`)."""
+
+    return METRICS.export(path)
+
+
+@contextmanager
+def _track(kind: str, kwargs: dict[str, Any]) -> Iterator[_CallStats]:
+    """Time the enclosed call and append an :class:`LLMCallRecord` on exit."""
+
+    stats = _CallStats()
+    error: str | None = None
+    try:
+        yield stats
+    except Exception as exc:
+        error = type(exc).__name__
+        raise
+    finally:
+        default_model = OPENROUTER_MODEL if BACKEND == "openrouter" else HF_MODEL
+        METRICS.record(
+            LLMCallRecord(
+                timestamp=time.time(),
+                agent=_CURRENT_AGENT.get(),
+                backend=BACKEND,
+                model=kwargs.get("model", default_model),
+                kind=kind,
+                latency=time.monotonic() - stats.started,
+                queue_wait=stats.queue_wait,
+                time_to_first_token=stats.time_to_first_token,
+                prompt_tokens=stats.prompt_tokens,
+                completion_tokens=stats.completion_tokens,
+                cache_hit=stats.cache_hit,
+                error=error,
+            )
+        )
+
+
+def _count_tokens(tokenizer: Any, text: str) -> int | None:
+    try:
+        return len(tokenizer(text, add_special_tokens=False)["input_ids"])
+    except Exception:  # noqa: BLE001
+        return None
+
+
+# -----------------------------------------------------------------------------
+# Rate limiting & concurrency control
+# -----------------------------------------------------------------------------
+
+
+class RateLimitError(RuntimeError):
+    """Raised when a backend keeps answering HTTP 429 after all retries."""
+
+
+class AdaptiveLimiter:
+    """Token-bucket rate limiter with a concurrency cap and AIMD adaptation.
+
+    Args:
+        rate: Initial requests per second; ``None`` disables the bucket and
+            leaves only the concurrency cap.
+        max_concurrency: Maximum requests in flight.
+        max_rate: Ceiling for additive increase (defaults to *rate*).
+        min_rate: Floor for multiplicative decrease.
+        burst: Bucket capacity in requests (defaults to one second's worth).
+        additive_step: Requests/s added after each successful call.
+        backoff: Factor applied to the rate on HTTP 429.
+        latency_target: Seconds; slower successful calls shrink the rate by 10 %.
+
+    Use :meth:`slot` around each request and report the outcome with
+    :meth:`record_success` or :meth:`record_throttle`.
+    """
+
+    def __init__(
+        self,
+        *,
+        rate: float | None,
+        max_concurrency: int,
+        max_rate: float | None = None,
+        min_rate: float = 0.05,
+        burst: float | None = None,
+        additive_step: float = 0.1,
+        backoff: float = 0.5,
+        latency_target: float | None = None,
+    ) -> None:
+        self.rate = rate
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_rate = max_rate if max_rate is not None else rate
+        self.min_rate = min_rate
+        self.burst = burst if burst is not None else max(1.0, rate or 1.0)
+        self.additive_step = additive_step
+        self.backoff = backoff
+        self.latency_target = latency_target
+        self.throttled = 0
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._semaphore: asyncio.Semaphore | None = None
+        self._bucket_lock: asyncio.Lock | None = None
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[float]:
+        """Wait for a concurrency slot and a token; release the slot on exit.
+
+        Yields the number of seconds spent waiting.
+        """
+
+        semaphore, bucket_lock = self._primitives()
+        start = time.monotonic()
+        await semaphore.acquire()
+        try:
+            async with bucket_lock:
+                await self._take_token()
+            yield time.monotonic() - start
+        finally:
+            semaphore.release()
+
+    def record_success(self, latency: float) -> None:
+        """Additive increase – or a gentle decrease if *latency* is over target."""
+
+        if self.rate is None:
+            return
+        if self.latency_target is not None and latency > self.latency_target:
+            self.rate = max(self.min_rate, self.rate * 0.9)
+        else:
+            self.rate = min(self.max_rate or self.rate, self.rate + self.additive_step)
+
+    def record_throttle(self, retry_after: float | None = None) -> None:
+        """Multiplicative decrease and pause until *retry_after* seconds have passed."""
+
+        self.throttled += 1
+        if self.rate is not None:
+            self.rate = max(self.min_rate, self.rate * self.backoff)
+        delay = retry_after if retry_after is not None else 1.0 / (self.rate or 1.0)
+        self._blocked_until = max(self._blocked_until, time.monotonic() + delay)
+        self._tokens = min(self._tokens, 0.0)
+        logger.warning(f"LLM backend throttled; pausing {delay:.1f}s (rate now {self.rate})")
+
+    def _primitives(self) -> tuple[asyncio.Semaphore, asyncio.Lock]:
+        # asyncio primitives are bound to one loop; rebuild them if it changed.
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._semaphore is None or self._bucket_lock is None:
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._bucket_lock = asyncio.Lock()
+        return self._semaphore, self._bucket_lock
+
+    async def _take_token(self) -> None:
+        while True:
+            now = time.monotonic()
+            if now < self._blocked_until:
+                await asyncio.sleep(self._blocked_until - now)
+                continue
+            if self.rate is None:
+                return
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+            await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+_LIMITERS: dict[tuple[str, str], AdaptiveLimiter] = {}
+_LIMITERS_LOCK = threading.Lock()
+
+
+def get_limiter(backend: str, model: str) -> AdaptiveLimiter:
+    """Return the shared limiter for *backend* and *model*."""
+
+    with _LIMITERS_LOCK:
+        limiter = _LIMITERS.get((backend, model))
+        if limiter is None:
+            if backend == "huggingface":
+                # Local inference: no rate to respect, but keep enough
+                # concurrency for the micro-batcher to fill a batch.
+                limiter = AdaptiveLimiter(rate=None, max_concurrency=HF_MAX_BATCH_SIZE)
+            else:
+                limiter = AdaptiveLimiter(
+                    rate=LLM_RATE_LIMIT,
+                    max_rate=LLM_MAX_RATE,
+                    max_concurrency=LLM_MAX_CONCURRENCY,
+                    latency_target=LLM_LATENCY_TARGET,
+                )
+            _LIMITERS[(backend, model)] = limiter
+        return limiter
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    """Parse a ``Retry-After`` header (delta-seconds or HTTP date)."""
+
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
 # -----------------------------------------------------------------------------
 # Hugging Face implementation (runs in threadpool to avoid blocking event loop)
 # -----------------------------------------------------------------------------
 
 
-async def _hf_chat(system_prompt: str, user_prompt: str, **kwargs: Any) -> str:
+@dataclass
+class _LoadedModel:
+    """A resident model/tokenizer pair plus the pipelines built on top of it."""
+
+    model_id: str
+    tokenizer: Any
+    model: Any
+    footprint: int
+    pipelines: dict[tuple[tuple[str, Any], ...], Any] = field(default_factory=dict)
+    prefixes: OrderedDict[str, _PrefixState] = field(default_factory=OrderedDict)
+
+
+@dataclass(frozen=True)
+class _PrefixState:
+    """Token ids and prefilled KV-cache for a static prompt prefix."""
+
+    input_ids: Any
+    past_key_values: Any
+
 
-    from transformers import AutoModelForCausalLM, AutoTokenizer, pipeline
+class _SplitPrompt(NamedTuple):
+    """A formatted prompt split into its static prefix and variable suffix."""
 
-    def _run() -> str:
-        model_id = kwargs.get("model", HF_MODEL)
-        logger.debug("Loading HF model: %s", model_id)
-        tokenizer = AutoTokenizer.from_pretrained(model_id)
-        model = AutoModelForCausalLM.from_pretrained(model_id, device_map="auto")
-        chat_pipe = pipeline(
-            "text-generation",
-            model=model,
-            tokenizer=tokenizer,
+    prefix: str
+    suffix: str
+
+    @property
+    def text(self) -> str:
+        return self.prefix + self.suffix
+
+
+def _load_model(model_id: str) -> tuple[Any, Any]:
+    """Load tokenizer and weights for *model_id* (slow – seconds to minutes).
+
+    *model_id* may carry a ``:int8``/``:4bit``/``:none`` suffix overriding
+    ``HF_QUANTIZATION``; the registry keys models by this full spec.
+    """
+
+    from transformers import AutoModelForCausalLM, AutoTokenizer
+
+    repo_id, quantization = _split_model_spec(model_id)
+    quantization = _resolve_quantization(quantization)
+    if HF_DEVICE == "cpu":
+        _configure_cpu_threads()
+
+    logger.info(f"Loading HF model: {repo_id} (device={HF_DEVICE}, quantization={quantization})")
+    tokenizer = AutoTokenizer.from_pretrained(repo_id)
+    # Decoder-only models must be left-padded when prompts are batched.
+    if tokenizer.pad_token is None:
+        tokenizer.pad_token = tokenizer.eos_token
+    tokenizer.padding_side = "left"
+
+    # Safetensors shards are memory-mapped; low_cpu_mem_usage avoids
+    # materialising a second, randomly-initialised copy of the weights.
+    load_kwargs: dict[str, Any] = {"device_map": HF_DEVICE, "low_cpu_mem_usage": True}
+    dynamic_int8 = quantization == "int8" and HF_DEVICE == "cpu"
+    if dynamic_int8:
+        import torch
+
+        # bf16 (2 bytes per parameter) rather than the fp32 default.
+        load_kwargs["torch_dtype"] = torch.bfloat16
+    elif quantization != "none":
+        load_kwargs["quantization_config"] = _bitsandbytes_config(quantization)
+
+    model = AutoModelForCausalLM.from_pretrained(repo_id, **load_kwargs)
+    if dynamic_int8:
+        model = _quantize_dynamic_int8(model)
+    model.eval()
+    _warm_up(tokenizer, model)
+    return tokenizer, model
+
+
+_QUANTIZATIONS = {"none", "int8", "4bit"}
+
+
+def _split_model_spec(model_id: str) -> tuple[str, str]:
+    """Split ``"org/model:4bit"`` into the repo id and its quantisation."""
+
+    repo_id, _, quantization = model_id.partition(":")
+    return repo_id, (quantization or HF_QUANTIZATION).lower()
+
+
+def _resolve_quantization(quantization: str) -> str:
+    """Validate *quantization* and downgrade it to what this host supports."""
+
+    if quantization not in _QUANTIZATIONS:
+        raise ValueError(
+            f"Unsupported HF quantization {quantization!r}; expected one of {sorted(_QUANTIZATIONS)}"
+        )
+    if quantization != "none" and importlib.util.find_spec("bitsandbytes") is None:
+        # Only the CPU has a bitsandbytes-free int8 path (dynamic quantisation).
+        fallback = "int8" if HF_DEVICE == "cpu" else "none"
+        if quantization != fallback:
+            logger.warning(
+                f"bitsandbytes is not installed – falling back from {quantization} to {fallback} quantization"
+            )
+        return fallback
+    return quantization
+
+
+def _bitsandbytes_config(quantization: str) -> Any:
+    import torch
+    from transformers import BitsAndBytesConfig
+
+    if quantization == "4bit":
+        return BitsAndBytesConfig(
+            load_in_4bit=True,
+            bnb_4bit_quant_type="nf4",
+            bnb_4bit_compute_dtype=torch.bfloat16,
+        )
+    return BitsAndBytesConfig(load_in_8bit=True)
+
+
+def _quantize_dynamic_int8(model: Any) -> Any:
+    """Swap ``nn.Linear`` layers for int8 dynamically-quantised ones (CPU only).
+
+    Each layer is widened to fp32 and quantised on its own, so a model loaded
+    in bf16 never holds more than one fp32 layer at a time.
+    """
+
+    import torch
+
+    linears = [(name, m) for name, m in model.named_modules() if isinstance(m, torch.nn.Linear)]
+    for name, linear in linears:
+        parent_name, _, child = name.rpartition(".")
+        parent = model.get_submodule(parent_name) if parent_name else model
+        # quantize_dynamic swaps children only, hence the one-layer wrapper.
+        wrapper = torch.nn.Sequential(linear.float())
+        torch.ao.quantization.quantize_dynamic(wrapper, {torch.nn.Linear}, dtype=torch.qint8, inplace=True)
+        setattr(parent, child, wrapper[0])
+    # Quantised layers take fp32 activations; the embeddings and norms left
+    # in bf16 are small enough to widen.
+    return model.float()
+
+
+_THREADS_CONFIGURED = False
+
+
+def _configure_cpu_threads() -> None:
+    """Pin torch's thread pools once per process (``HF_NUM_*THREADS``)."""
+
+    global _THREADS_CONFIGURED
+    if _THREADS_CONFIGURED:
+        return
+    _THREADS_CONFIGURED = True
+
+    import torch
+
+    if HF_NUM_THREADS > 0:
+        torch.set_num_threads(HF_NUM_THREADS)
+    if HF_NUM_INTEROP_THREADS > 0:
+        try:
+            torch.set_num_interop_threads(HF_NUM_INTEROP_THREADS)
+        except RuntimeError as exc:  # already started parallel work
+            logger.warning(f"Could not set inter-op threads: {exc}")
+    logger.debug(
+        f"torch threads: intra-op={torch.get_num_threads()}, "
+        f"inter-op={torch.get_num_interop_threads()}"
+    )
+
+
+def _warm_up(tokenizer: Any, model: Any) -> None:
+    """Run a one-token generation so the first real call skips kernel/page-in setup."""
+
+    try:
+        inputs = tokenizer("Hello", return_tensors="pt").to(model.device)
+        model.generate(**inputs, max_new_tokens=1, pad_token_id=tokenizer.pad_token_id)
+    except Exception as exc:  # noqa: BLE001
+        logger.warning(f"HF warm-up generation failed: {exc}")
+
+
+def _build_pipeline(tokenizer: Any, model: Any, **settings: Any) -> Any:
+    """Wrap an already-loaded model in a ``text-generation`` pipeline."""
+
+    from transformers import pipeline
+
+    return pipeline("text-generation", model=model, tokenizer=tokenizer, **settings)
+
+
+def _prefill(tokenizer: Any, model: Any, prefix: str) -> _PrefixState:
+    """Run *prefix* through *model* once and keep its ``past_key_values``."""
+
+    import torch
+
+    input_ids = tokenizer(prefix, return_tensors="pt").input_ids.to(model.device)
+    with torch.no_grad():
+        output = model(input_ids=input_ids, use_cache=True)
+    return _PrefixState(input_ids=input_ids, past_key_values=output.past_key_values)
+
+
+def _memory_footprint(model: Any) -> int:
+    """Size of *model*'s parameters and buffers in bytes (0 when unknown)."""
+
+    try:
+        return int(model.get_memory_footprint())
+    except Exception:  # noqa: BLE001
+        return 0
+
+
+def _memory_in_use() -> int | None:
+    """Bytes currently held on ``HF_DEVICE`` by this process, ``None`` if unknown.
+
+    GPU loads are measured with ``torch.cuda.memory_allocated``, CPU loads with
+    the process' resident set size. Returns ``None`` without torch.
+    """
+
+    try:
+        import torch
+    except ImportError:
+        return None
+    try:
+        if HF_DEVICE != "cpu" and torch.cuda.is_available():
+            return int(torch.cuda.memory_allocated())
+        with open("/proc/self/statm", encoding="ascii") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except Exception:  # noqa: BLE001
+        return None
+
+
+def _measured_footprint(model: Any, before: int | None) -> int:
+    """Footprint of a freshly loaded *model*, measured rather than estimated.
+
+    ``get_memory_footprint`` only sums parameters and buffers, so it misses
+    int8 packed weights (which are neither) and quantisation state. The memory
+    the load actually took – allocated bytes after loading, quantising and
+    warming up, minus *before* – covers those; the larger of the two is used.
+    Concurrent loads of other models can inflate the difference, which only
+    errs towards evicting early.
+    """
+
+    footprint = _memory_footprint(model)
+    after = _memory_in_use()
+    if before is not None and after is not None:
+        footprint = max(footprint, after - before)
+    return footprint
+
+
+class ModelRegistry:
+    """Process-wide LRU cache of loaded Hugging Face models and pipelines.
+
+    Models are keyed by model id; pipelines are keyed by model id *and*
+    generation settings so that differently-configured callers share the same
+    weights. Each model's footprint is measured once it has loaded (see
+    :func:`_measured_footprint`). When the combined footprint exceeds ``max_bytes`` the least
+    recently used models are evicted (the model just requested is never
+    evicted, even if it alone exceeds the ceiling).
+
+    All methods are thread-safe – they are called from ``asyncio.to_thread``
+    workers. Concurrent requests for a model that is still loading wait for
+    the first load instead of loading it again.
+    """
+
+    def __init__(self, max_bytes: int = HF_CACHE_MAX_BYTES) -> None:
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, _LoadedModel] = OrderedDict()
+        self._load_locks: dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def get_model(self, model_id: str) -> _LoadedModel:
+        """Return the resident entry for *model_id*, loading it on first use."""
+
+        with self._lock:
+            entry = self._touch(model_id)
+            if entry is not None:
+                return entry
+            load_lock = self._load_locks.setdefault(model_id, threading.Lock())
+
+        with load_lock:
+            with self._lock:
+                entry = self._touch(model_id)
+                if entry is not None:
+                    return entry
+
+            before = _memory_in_use()
+            tokenizer, model = _load_model(model_id)
+            entry = _LoadedModel(
+                model_id=model_id,
+                tokenizer=tokenizer,
+                model=model,
+                footprint=_measured_footprint(model, before),
+            )
+            logger.info(f"Loaded HF model {model_id} ({entry.footprint / 1024**2:.0f} MB)")
+
+            with self._lock:
+                self._entries[model_id] = entry
+                self._load_locks.pop(model_id, None)
+                self._evict_over_budget(keep=model_id)
+
+        return entry
+
+    def get_pipeline(self, model_id: str, **settings: Any) -> Any:
+        """Return a ``text-generation`` pipeline for *model_id* and *settings*."""
+
+        entry = self.get_model(model_id)
+        key = tuple(sorted(settings.items()))
+        with self._lock:
+            chat_pipe = entry.pipelines.get(key)
+            if chat_pipe is None:
+                chat_pipe = _build_pipeline(entry.tokenizer, entry.model, **settings)
+                entry.pipelines[key] = chat_pipe
+        return chat_pipe
+
+    def get_prefix(self, model_id: str, prefix: str) -> _PrefixState:
+        """Return the prefilled KV-cache of *prefix* on *model_id*, computing it once.
+
+        The returned cache is shared – callers must copy ``past_key_values``
+        before handing it to ``generate`` (which extends it in place).
+        """
+
+        entry = self.get_model(model_id)
+        with self._lock:
+            state = entry.prefixes.get(prefix)
+            if state is not None:
+                entry.prefixes.move_to_end(prefix)
+                return state
+
+        # Prefill outside the lock; a concurrent duplicate is harmless.
+        state = _prefill(entry.tokenizer, entry.model, prefix)
+        with self._lock:
+            entry.prefixes[prefix] = state
+            while len(entry.prefixes) > HF_PREFIX_CACHE_SIZE:
+                entry.prefixes.popitem(last=False)
+        return state
+
+    def evict(self, model_id: str) -> bool:
+        """Drop *model_id* from the registry. Returns ``True`` if it was resident."""
+
+        with self._lock:
+            return self._entries.pop(model_id, None) is not None
+
+    def clear(self) -> None:
+        """Drop every resident model."""
+
+        with self._lock:
+            self._entries.clear()
+
+    @property
+    def total_bytes(self) -> int:
+        """Combined footprint of all resident models."""
+
+        with self._lock:
+            return sum(entry.footprint for entry in self._entries.values())
+
+    def __contains__(self, model_id: object) -> bool:
+        with self._lock:
+            return model_id in self._entries
+
+    # ------------------------------------------------------------------
+    # Internal helpers (caller must hold ``self._lock``)
+    # ------------------------------------------------------------------
+
+    def _touch(self, model_id: str) -> _LoadedModel | None:
+        entry = self._entries.get(model_id)
+        if entry is not None:
+            self._entries.move_to_end(model_id)
+        return entry
+
+    def _evict_over_budget(self, keep: str) -> None:
+        total = sum(entry.footprint for entry in self._entries.values())
+        for model_id in list(self._entries):
+            if total <= self.max_bytes:
+                break
+            if model_id == keep:
+                continue
+            evicted = self._entries.pop(model_id)
+            total -= evicted.footprint
+            logger.info(f"Evicted HF model {model_id} ({evicted.footprint / 1024**2:.0f} MB)")
+
+        if total > self.max_bytes:
+            logger.warning(
+                f"HF model {keep} alone exceeds the cache ceiling "
+                f"({total / 1024**3:.1f} GB > {self.max_bytes / 1024**3:.1f} GB)"
+            )
+
+
+_REGISTRY = ModelRegistry()
+
+
+def warmup(model_id: str | None = None) -> None:
+    """Load *model_id* (default: ``HF_MODEL``) into the registry ahead of time.
+
+    Blocking; call it from start-up code or via ``asyncio.to_thread``.
+    """
+
+    _REGISTRY.get_model(model_id or HF_MODEL)
+
+
+class _Completion(NamedTuple):
+    """A generated reply with its token counts (``None`` when unknown)."""
+
+    text: str
+    prompt_tokens: int | None = None
+    completion_tokens: int | None = None
+
+
+@dataclass
+class _PendingPrompt:
+    prompt: Any
+    future: asyncio.Future[_Completion]
+    submitted_at: float = field(default_factory=time.monotonic)
+    started_at: float | None = None
+
+
+class MicroBatcher:
+    """Coalesce concurrent HF generations into batched pipeline calls.
+
+    Prompts submitted within ``window`` seconds of each other that share a
+    model and generation settings are padded into a single batched
+    ``generate`` call (flushed early once ``max_batch_size`` is reached). Each
+    caller awaits only its own result; a failing batch fails all its callers.
+    """
+
+    def __init__(
+        self, window: float = HF_BATCH_WINDOW, max_batch_size: int = HF_MAX_BATCH_SIZE
+    ) -> None:
+        self.window = window
+        self.max_batch_size = max(1, max_batch_size)
+        self._pending: dict[tuple[Any, ...], list[_PendingPrompt]] = {}
+        self._timers: dict[tuple[Any, ...], asyncio.TimerHandle] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def submit(
+        self, model_id: str, prompt: Any, *, stats: _CallStats | None = None, **settings: Any
+    ) -> str:
+        """Queue *prompt* for the next batch and wait for its completion.
+
+        Token counts are taken on the worker thread and copied into *stats*.
+        """
+
+        loop = asyncio.get_running_loop()
+        key = (model_id, tuple(sorted(settings.items())))
+        future: asyncio.Future[_Completion] = loop.create_future()
+        pending = _PendingPrompt(prompt, future)
+        batch = self._pending.setdefault(key, [])
+        batch.append(pending)
+
+        if len(batch) >= self.max_batch_size:
+            self._flush(key)
+        elif len(batch) == 1:
+            self._timers[key] = loop.call_later(self.window, self._flush, key)
+
+        try:
+            completion = await future
+        finally:
+            if stats is not None and pending.started_at is not None:
+                stats.queue_wait += pending.started_at - pending.submitted_at
+        if stats is not None:
+            stats.prompt_tokens = completion.prompt_tokens
+            stats.completion_tokens = completion.completion_tokens
+        return completion.text
+
+    def _flush(self, key: tuple[Any, ...]) -> None:
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+        batch = self._pending.pop(key, [])
+        if not batch:
+            return
+        task = asyncio.ensure_future(self._run_batch(key, batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(self, key: tuple[Any, ...], batch: list[_PendingPrompt]) -> None:
+        model_id, settings = key[0], dict(key[1])
+        prompts = [pending.prompt for pending in batch]
+        started_at = time.monotonic()
+        for pending in batch:
+            pending.started_at = started_at
+        logger.debug(f"Running HF batch of {len(prompts)} prompt(s) on {model_id}")
+        try:
+            outputs = await asyncio.to_thread(_hf_generate_batch, model_id, prompts, settings)
+            results = list(zip(batch, outputs, strict=True))
+        except Exception as exc:  # noqa: BLE001
+            for pending in batch:
+                if not pending.future.done():
+                    pending.future.set_exception(exc)
+            return
+
+        for pending, output in results:
+            if not pending.future.done():
+                pending.future.set_result(output)
+
+
+def _hf_generate_batch(
+    model_id: str, prompts: list[_SplitPrompt], settings: dict[str, Any]
+) -> list[_Completion]:
+    """Run *prompts* through one (padded) pipeline call – blocking.
+
+    A lone prompt with a long system prefix skips the pipeline and decodes
+    from the cached prefix KV-state instead. Tokens are counted here, with the
+    tokenizer that just ran, so the event loop never has to look the model up
+    again (an evicted model would be reloaded on the loop).
+    """
+
+    if len(prompts) == 1 and _use_prefix_cache(prompts[0]):
+        replies = [_hf_generate_with_prefix(model_id, prompts[0], settings)]
+        tokenizer = _REGISTRY.get_model(model_id).tokenizer
+    else:
+        chat_pipe = _REGISTRY.get_pipeline(model_id, **settings)
+        texts = [prompt.text for prompt in prompts]
+        outputs = chat_pipe(texts, batch_size=len(texts), return_full_text=False)
+        replies = [output[0]["generated_text"].strip() for output in outputs]
+        tokenizer = chat_pipe.tokenizer
+    return [
+        _Completion(reply, _count_tokens(tokenizer, prompt.text), _count_tokens(tokenizer, reply))
+        for prompt, reply in zip(prompts, replies, strict=True)
+    ]
+
+
+def _hf_generate_with_prefix(
+    model_id: str, prompt: _SplitPrompt, settings: dict[str, Any]
+) -> str:
+    """Generate a single reply reusing the prefilled system prefix – blocking."""
+
+    import torch
+
+    entry = _REGISTRY.get_model(model_id)
+    inputs = _generation_inputs(model_id, prompt)
+    gen_kwargs: dict[str, Any] = {
+        "max_new_tokens": settings.get("max_new_tokens", 256),
+        "do_sample": settings.get("do_sample", False),
+        "pad_token_id": entry.tokenizer.pad_token_id,
+    }
+    if gen_kwargs["do_sample"]:
+        gen_kwargs["temperature"] = settings.get("temperature", 0.7)
+
+    with torch.no_grad():
+        output = entry.model.generate(**inputs, **gen_kwargs)
+    new_tokens = output[0, inputs["input_ids"].shape[-1] :]
+    return entry.tokenizer.decode(new_tokens, skip_special_tokens=True).strip()
+
+
+def _generation_inputs(model_id: str, prompt: _SplitPrompt) -> dict[str, Any]:
+    """Model inputs for *prompt*, seeded with the cached prefix when worthwhile – blocking."""
+
+    entry = _REGISTRY.get_model(model_id)
+    encoded = dict(entry.tokenizer(prompt.text, return_tensors="pt").to(entry.model.device))
+    if not _use_prefix_cache(prompt):
+        return encoded
+
+    # The full prompt is tokenised as a whole: merges across the prefix/suffix
+    # seam can differ from encoding the two halves apart, so the cached state
+    # is only reused when the full ids really start with the prefix ids.
+    state = _REGISTRY.get_prefix(model_id, prompt.prefix)
+    if not _starts_with(encoded["input_ids"], state.input_ids):
+        logger.debug("Prompt tokens diverge inside the cached prefix; encoding without it")
+        return encoded
+    return {
+        **encoded,
+        # generate() appends to the cache in place; keep the shared copy pristine.
+        "past_key_values": copy.deepcopy(state.past_key_values),
+    }
+
+
+def _starts_with(input_ids: Any, prefix_ids: Any) -> bool:
+    """True if *input_ids* extend *prefix_ids* by at least one token."""
+
+    length = prefix_ids.shape[-1]
+    if input_ids.shape[-1] <= length:
+        return False
+    return bool((input_ids[..., :length] == prefix_ids.to(input_ids.device)).all())
+
+
+def _use_prefix_cache(prompt: _SplitPrompt) -> bool:
+    return HF_PREFIX_CACHE_ENABLED and len(prompt.prefix) >= HF_PREFIX_MIN_CHARS
+
+
+def _format_prompt(system_prompt: str, user_prompt: str) -> _SplitPrompt:
+    # Concatenate system + user prompt – many instruct models expect \n<eos> style separator.
+    # The split point lets the static system part be prefilled once and reused.
+    return _SplitPrompt(f"<s>[INST] {system_prompt} \n\n", f"{user_prompt} [/INST]")
+
+
+_BATCHER = MicroBatcher()
+
+
+async def _hf_chat(
+    system_prompt: str, user_prompt: str, *, stats: _CallStats | None = None, **kwargs: Any
+) -> str:
+    stats = stats or _CallStats()
+    model_id = kwargs.get("model", HF_MODEL)
+    temperature = kwargs.get("temperature", 0.7)
+    prompt = _format_prompt(system_prompt, user_prompt)
+    logger.debug(f"Prompting HF model ({len(prompt.text)} chars)")
+    async with get_limiter("huggingface", model_id).slot() as waited:
+        stats.queue_wait += waited
+        reply = await _BATCHER.submit(
+            model_id,
+            prompt,
+            stats=stats,
             max_new_tokens=kwargs.get("max_new_tokens", 256),
-            temperature=kwargs.get("temperature", 0.7),
-            do_sample=kwargs.get("temperature", 0.7) > 0,
+            temperature=temperature,
+            do_sample=temperature > 0,
         )
-        # Concatenate system + user prompt – many instruct models expect \n<eos> style separator.
-        full_prompt = f"<s>[INST] {system_prompt} \n\n{user_prompt} [/INST]"
-        logger.debug("Prompting HF model (%d chars)", len(full_prompt))
-        output = chat_pipe(full_prompt)[0]["generated_text"]
-        # Drop the prompt part from output if the pipeline returns it.
-        return output.replace(full_prompt, "", 1).strip()
+    return reply
+
+
+_STREAM_END = object()
 
-    return await asyncio.to_thread(_run)
+
+async def _hf_chat_stream(
+    system_prompt: str, user_prompt: str, *, stats: _CallStats | None = None, **kwargs: Any
+) -> AsyncIterator[str]:
+    from transformers import StoppingCriteria, StoppingCriteriaList, TextIteratorStreamer
+
+    class _StopOnEvent(StoppingCriteria):
+        def __init__(self, event: threading.Event) -> None:
+            self.event = event
+
+        def __call__(self, input_ids: Any, scores: Any, **_: Any) -> bool:
+            return self.event.is_set()
+
+    model_id = kwargs.get("model", HF_MODEL)
+    stats = stats or _CallStats()
+    # The slot is held until generate() has returned, so streamed calls count
+    # against the same concurrency cap as batched ones.
+    async with get_limiter("huggingface", model_id).slot() as waited:
+        stats.queue_wait += waited
+        entry = await asyncio.to_thread(_REGISTRY.get_model, model_id)
+        temperature = kwargs.get("temperature", 0.7)
+        stop = threading.Event()
+        streamer = TextIteratorStreamer(entry.tokenizer, skip_prompt=True, skip_special_tokens=True)
+        inputs = await asyncio.to_thread(
+            _generation_inputs, model_id, _format_prompt(system_prompt, user_prompt)
+        )
+        stats.prompt_tokens = int(inputs["input_ids"].shape[-1])
+
+        gen_kwargs: dict[str, Any] = {
+            **inputs,
+            "streamer": streamer,
+            "max_new_tokens": kwargs.get("max_new_tokens", 256),
+            "do_sample": temperature > 0,
+            "stopping_criteria": StoppingCriteriaList([_StopOnEvent(stop)]),
+        }
+        if temperature > 0:
+            gen_kwargs["temperature"] = temperature
+
+        failure: list[BaseException] = []
+
+        def _generate() -> None:
+            try:
+                entry.model.generate(**gen_kwargs)
+            except BaseException as exc:  # noqa: BLE001 – re-raised in the consumer
+                failure.append(exc)
+            finally:
+                # generate() ends the streamer itself, except when it raises; a
+                # second end() only queues a stop signal nobody reads.
+                streamer.end()
+
+        worker = threading.Thread(target=_generate, daemon=True)
+        worker.start()
+        loop = asyncio.get_running_loop()
+        chunks: list[str] = []
+        try:
+            while True:
+                chunk = await loop.run_in_executor(None, next, streamer, _STREAM_END)
+                if chunk is _STREAM_END:
+                    break
+                if chunk:
+                    chunks.append(chunk)
+                    yield chunk
+            if failure:
+                raise failure[0]
+        finally:
+            # Ends generate() at the next token if the consumer stopped early.
+            stop.set()
+            await asyncio.to_thread(worker.join)
+            stats.completion_tokens = _count_tokens(entry.tokenizer, "".join(chunks))
 
 
 async def _hf_generate(prompt: str, **kwargs: Any) -> str:
@@ -110,7 +1430,78 @@ async def _hf_generate(prompt: str, **kwargs: Any) -> str:
 # -----------------------------------------------------------------------------
 
 
-async def _openrouter_chat(system_prompt: str, user_prompt: str, **kwargs: Any) -> str:
+class SessionManager:
+    """Lazily-created ``aiohttp`` session shared by all OpenRouter calls.
+
+    A single session per event loop keeps TCP/TLS connections alive between
+    completions instead of paying a fresh handshake per call. The connector
+    caps connections per host and caches DNS lookups.
+
+    Sessions are bound to the loop that created them; if the running loop
+    changes (e.g. successive ``asyncio.run`` calls) a new session is opened.
+    """
+
+    def __init__(
+        self,
+        *,
+        limit_per_host: int = OPENROUTER_MAX_CONNECTIONS,
+        keepalive_timeout: float = 30.0,
+        dns_ttl: int = 300,
+        total_timeout: float = 60.0,
+    ) -> None:
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.dns_ttl = dns_ttl
+        self.total_timeout = total_timeout
+        self._session: aiohttp.ClientSession | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    async def get(self) -> aiohttp.ClientSession:
+        """Return the shared session for the running loop, creating it on demand."""
+
+        loop = asyncio.get_running_loop()
+        if self._session is not None and not self._session.closed and self._loop is loop:
+            return self._session
+
+        if self._session is not None and not self._session.closed:
+            # Owned by a loop that is gone or different – it cannot be closed from here.
+            logger.debug("Discarding aiohttp session bound to a different event loop")
+
+        connector = aiohttp.TCPConnector(
+            limit_per_host=self.limit_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            use_dns_cache=True,
+            ttl_dns_cache=self.dns_ttl,
+        )
+        self._session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=self.total_timeout),
+        )
+        self._loop = loop
+        return self._session
+
+    async def close(self) -> None:
+        """Close the shared session (safe to call repeatedly)."""
+
+        session, self._session, self._loop = self._session, None, None
+        if session is not None and not session.closed:
+            await session.close()
+
+
+_SESSIONS = SessionManager()
+
+
+async def aclose() -> None:
+    """Release pooled network resources held by this module."""
+
+    await _SESSIONS.close()
+
+
+def _openrouter_request(
+    system_prompt: str, user_prompt: str, kwargs: dict[str, Any]
+) -> tuple[dict[str, Any], dict[str, str]]:
+    """Build the OpenRouter ``(payload, headers)`` pair for a chat completion."""
+
     if not OPENROUTER_API_KEY:
         raise EnvironmentError("OPENROUTER_API_KEY not set")
 
@@ -127,19 +1518,84 @@ async def _openrouter_chat(system_prompt: str, user_prompt: str, **kwargs: Any)
         "Content-Type": "application/json",
         "Authorization": f"Bearer {OPENROUTER_API_KEY}",
     }
+    return payload, headers
+
+
+@asynccontextmanager
+async def _openrouter_response(
+    payload: dict[str, Any], headers: dict[str, str], stats: _CallStats
+) -> AsyncIterator[aiohttp.ClientResponse]:
+    """POST a completion request through the limiter, retrying on HTTP 429."""
+
+    limiter = get_limiter("openrouter", payload["model"])
+    session = await _SESSIONS.get()
+    for _ in range(LLM_THROTTLE_RETRIES + 1):
+        async with limiter.slot() as waited:
+            stats.queue_wait += waited
+            start = time.monotonic()
+            async with session.post(
+                f"{OPENROUTER_BASE_URL}/chat/completions",
+                json=payload,
+                headers=headers,
+            ) as resp:
+                if resp.status == 429:
+                    limiter.record_throttle(_parse_retry_after(resp.headers.get("Retry-After")))
+                    continue
+                resp.raise_for_status()
+                yield resp
+            limiter.record_success(time.monotonic() - start)
+            return
+
+    raise RateLimitError(
+        f"OpenRouter still rate-limiting {payload['model']} after {LLM_THROTTLE_RETRIES} retries"
+    )
+
+
+async def _openrouter_chat(
+    system_prompt: str, user_prompt: str, *, stats: _CallStats | None = None, **kwargs: Any
+) -> str:
+    stats = stats or _CallStats()
+    payload, headers = _openrouter_request(system_prompt, user_prompt, kwargs)
+
+    logger.debug(f"Calling OpenRouter model {payload['model']}")
+    async with _openrouter_response(payload, headers, stats) as resp:
+        data = await resp.json()
+    _record_usage(stats, data.get("usage"))
+    # OpenRouter returns OpenAI-style choices list
+    return data["choices"][0]["message"]["content"].strip()
+
+
+async def _openrouter_chat_stream(
+    system_prompt: str, user_prompt: str, *, stats: _CallStats | None = None, **kwargs: Any
+) -> AsyncIterator[str]:
+    stats = stats or _CallStats()
+    payload, headers = _openrouter_request(system_prompt, user_prompt, kwargs)
+    payload["stream"] = True
+
+    logger.debug(f"Streaming OpenRouter model {payload['model']}")
+    async with _openrouter_response(payload, headers, stats) as resp:
+        # Server-sent events: ``data: {...}`` lines, ``: comment`` keep-alives, ``data: [DONE]``.
+        async for raw_line in resp.content:
+            line = raw_line.decode("utf-8").strip()
+            if not line.startswith("data:"):
+                continue
+            data = line[len("data:"):].strip()
+            if data == "[DONE]":
+                break
+            event = json.loads(data)
+            _record_usage(stats, event.get("usage"))
+            choices = event.get("choices") or [{}]
+            delta = choices[0].get("delta", {}).get("content")
+            if delta:
+                yield delta
+
+
+def _record_usage(stats: _CallStats, usage: dict[str, Any] | None) -> None:
+    """Copy OpenAI-style ``usage`` token counts into *stats*."""
 
-    logger.debug("Calling OpenRouter model %s", payload["model"])
-    async with aiohttp.ClientSession() as session:
-        async with session.post(
-            "https://openrouter.ai/api/v1/chat/completions",
-            json=payload,
-            headers=headers,
-            timeout=aiohttp.ClientTimeout(total=60),
-        ) as resp:
-            resp.raise_for_status()
-            data = await resp.json()
-            # OpenRouter returns OpenAI-style choices list
-            return data["choices"][0]["message"]["content"].strip()
+    if usage:
+        stats.prompt_tokens = usage.get("prompt_tokens", stats.prompt_tokens)
+        stats.completion_tokens = usage.get("completion_tokens", stats.completion_tokens)
 
 
 async def _openrouter_generate(prompt: str, **kwargs: Any) -> str:
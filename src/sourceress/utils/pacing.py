@@ -0,0 +1,316 @@
+"""Event-driven page readiness and human-like pacing for the LinkedIn scrapers.
+
+Instead of sleeping a fixed 2–4 s after every page load and scroll, the
+scrapers wait until the page has *settled*: the ready selector (if any) is
+present, ``document.readyState`` is ``complete`` and neither a DOM mutation
+(``MutationObserver``) nor a finished network request (resource timing
+entries) has been seen for ``SCRAPER_QUIET_MS``. A page that is already idle
+returns after one quiet window; a slow one is waited on up to
+``SCRAPER_READY_TIMEOUT_S``.
+
+Human-like jitter is a separate concern handled by :class:`PacingPolicy`: a
+random pause between ``SCRAPER_PACING_MIN_S`` and ``SCRAPER_PACING_MAX_S``
+drawn from a per-session budget (``SCRAPER_PACING_BUDGET_S``). Once the budget
+is spent, pages are no longer padded; ``reset()`` starts a new session. Each
+sourcing run (:class:`~sourceress.agents.linkedin_sourcer.LinkedInSourcer`)
+resets :data:`PACING` once, so every search and profile visit of the run,
+including concurrent fan-out queries, draws from the same budget.
+
+Every settled page is recorded in :data:`SCRAPE_METRICS`. Pages that replace
+one of the original scraper's fixed sleeps also record that sleep as their
+baseline, and :meth:`ScrapeMetrics.summary` reports the time saved on those
+pages only; waits with no fixed-sleep predecessor (result-page fetches in
+``pages`` mode, the Playwright engine) carry no baseline.
+:func:`sourceress.workflows.shutdown` logs the summary.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from loguru import logger
+
+__all__ = [
+    "PACING",
+    "SCRAPE_METRICS",
+    "LEGACY_SLEEP_S",
+    "PacingPolicy",
+    "ScrapeMetrics",
+    "get_scrape_metrics",
+    "settle",
+    "settle_async",
+    "wait_until_settled",
+    "wait_until_settled_async",
+]
+
+# ---------------------------------------------------------------------------
+# Configuration
+# ---------------------------------------------------------------------------
+
+QUIET_MS = int(os.getenv("SCRAPER_QUIET_MS", "500"))
+READY_TIMEOUT = float(os.getenv("SCRAPER_READY_TIMEOUT_S", "10"))
+PACING_MIN = float(os.getenv("SCRAPER_PACING_MIN_S", "0.3"))
+PACING_MAX = float(os.getenv("SCRAPER_PACING_MAX_S", "1.2"))
+PACING_BUDGET = float(os.getenv("SCRAPER_PACING_BUDGET_S", "120"))
+
+#: Mean of the ``random.uniform(2, 4)`` sleep each settle point used to pay.
+LEGACY_SLEEP_S = 3.0
+
+# Resolves (via the async-script callback, last argument) with
+# ``{ready, waited}`` once the page has been quiet for ``quietMs``.
+_SETTLE_JS = """
+const [selector, quietMs, timeoutMs, done] = arguments;
+const start = performance.now();
+let last = start;
+let resources = performance.getEntriesByType('resource').length;
+const observer = new MutationObserver(() => { last = performance.now(); });
+observer.observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+const tick = () => {
+    const now = performance.now();
+    const count = performance.getEntriesByType('resource').length;
+    if (count !== resources) { resources = count; last = now; }
+    const ready = document.readyState === 'complete'
+        && (!selector || document.querySelector(selector) !== null);
+    if ((ready && now - last >= quietMs) || now - start >= timeoutMs) {
+        observer.disconnect();
+        done({ready: ready, waited: (now - start) / 1000});
+    } else {
+        setTimeout(tick, 50);
+    }
+};
+tick();
+"""
+
+# Playwright has no async-script callback; hand the body a Promise resolver.
+_SETTLE_PLAYWRIGHT_JS = (
+    "(args) => new Promise((resolve) => "
+    f"(function () {{ {_SETTLE_JS} }}).apply(null, [...args, resolve]))"
+)
+
+
+# ---------------------------------------------------------------------------
+# Pacing
+# ---------------------------------------------------------------------------
+
+
+class PacingPolicy:
+    """Random human-like pauses drawn from a per-session time budget.
+
+    Args:
+        min_delay: Shortest pause in seconds.
+        max_delay: Longest pause in seconds.
+        budget: Total seconds of pauses allowed per session (``0`` disables
+            pacing, ``None`` means unbounded).
+
+    Thread-safe: concurrent scrapers share one budget.
+    """
+
+    def __init__(
+        self,
+        min_delay: float = PACING_MIN,
+        max_delay: float = PACING_MAX,
+        budget: float | None = PACING_BUDGET,
+    ) -> None:
+        self.min_delay = max(0.0, min_delay)
+        self.max_delay = max(self.min_delay, max_delay)
+        self.budget = budget
+        self.spent = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def remaining(self) -> float | None:
+        """Seconds of budget left (``None`` when unbounded)."""
+        if self.budget is None:
+            return None
+        return max(0.0, self.budget - self.spent)
+
+    def next_delay(self) -> float:
+        """Draw the next pause and charge it to the budget (may be ``0``)."""
+        with self._lock:
+            delay = random.uniform(self.min_delay, self.max_delay)
+            if self.budget is not None:
+                delay = min(delay, max(0.0, self.budget - self.spent))
+            self.spent += delay
+            return delay
+
+    def pause(self) -> float:
+        """Sleep for :meth:`next_delay` seconds and return the pause taken."""
+        delay = self.next_delay()
+        if delay:
+            time.sleep(delay)
+        return delay
+
+    async def apause(self) -> float:
+        """Async variant of :meth:`pause`."""
+        delay = self.next_delay()
+        if delay:
+            await asyncio.sleep(delay)
+        return delay
+
+    def reset(self) -> None:
+        """Start a new session with the full budget."""
+        with self._lock:
+            self.spent = 0.0
+
+
+# ---------------------------------------------------------------------------
+# Metrics
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class _Totals:
+    pages: int = 0
+    timeouts: int = 0
+    ready_wait: float = 0.0
+    paced: float = 0.0
+    baseline: float = 0.0
+    # Readiness waits and pacing of the pages that have a baseline.
+    compared: float = 0.0
+
+
+class ScrapeMetrics:
+    """Per-kind totals of readiness waits and pacing, against the old fixed sleeps.
+
+    Thread-safe. ``kind`` is a free-form label such as ``"search"`` or
+    ``"profile"``.
+    """
+
+    def __init__(self) -> None:
+        self._totals: dict[str, _Totals] = {}
+        self._lock = threading.Lock()
+
+    def record(
+        self,
+        kind: str,
+        ready_wait: float,
+        paced: float,
+        *,
+        timed_out: bool = False,
+        baseline: float | None = None,
+    ) -> None:
+        """Add one page; *baseline* is the fixed sleep it replaced, if any."""
+        with self._lock:
+            totals = self._totals.setdefault(kind, _Totals())
+            totals.pages += 1
+            totals.timeouts += 1 if timed_out else 0
+            totals.ready_wait += ready_wait
+            totals.paced += paced
+            if baseline is not None:
+                totals.baseline += baseline
+                totals.compared += ready_wait + paced
+
+    def reset(self) -> None:
+        with self._lock:
+            self._totals.clear()
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """Aggregate per kind; ``time_saved`` is the fixed-sleep baseline minus the
+        time waited on the pages that have one."""
+        with self._lock:
+            snapshot = {kind: _Totals(**vars(t)) for kind, t in self._totals.items()}
+        return {
+            kind: {
+                "pages": t.pages,
+                "timeouts": t.timeouts,
+                "ready_wait_total": t.ready_wait,
+                "paced_total": t.paced,
+                "baseline_total": t.baseline,
+                "time_saved": t.baseline - t.compared,
+            }
+            for kind, t in snapshot.items()
+        }
+
+
+#: Process-wide pacing policy and metrics shared by every scraper.
+PACING = PacingPolicy()
+SCRAPE_METRICS = ScrapeMetrics()
+
+
+def get_scrape_metrics() -> ScrapeMetrics:
+    """Return the process-wide :class:`ScrapeMetrics`."""
+    return SCRAPE_METRICS
+
+
+# ---------------------------------------------------------------------------
+# Readiness
+# ---------------------------------------------------------------------------
+
+
+def wait_until_settled(
+    driver: Any,
+    selector: str | None = None,
+    quiet_ms: int = QUIET_MS,
+    timeout: float = READY_TIMEOUT,
+) -> tuple[float, bool]:
+    """Block until the Selenium *driver*'s page is quiet.
+
+    Returns:
+        ``(seconds waited, ready)``; ``ready`` is False when *timeout* expired.
+    """
+    start = time.perf_counter()
+    try:
+        driver.set_script_timeout(timeout + 5)
+        result = driver.execute_async_script(_SETTLE_JS, selector, quiet_ms, timeout * 1000)
+    except Exception as exc:  # noqa: BLE001
+        logger.debug(f"Readiness probe failed: {exc}")
+        return time.perf_counter() - start, False
+    return time.perf_counter() - start, bool(isinstance(result, dict) and result.get("ready"))
+
+
+async def wait_until_settled_async(
+    page: Any,
+    selector: str | None = None,
+    quiet_ms: int = QUIET_MS,
+    timeout: float = READY_TIMEOUT,
+) -> tuple[float, bool]:
+    """Playwright equivalent of :func:`wait_until_settled`."""
+    start = time.perf_counter()
+    try:
+        result = await page.evaluate(_SETTLE_PLAYWRIGHT_JS, [selector, quiet_ms, timeout * 1000])
+    except Exception as exc:  # noqa: BLE001
+        logger.debug(f"Readiness probe failed: {exc}")
+        return time.perf_counter() - start, False
+    return time.perf_counter() - start, bool(isinstance(result, dict) and result.get("ready"))
+
+
+def settle(
+    driver: Any,
+    kind: str,
+    selector: str | None = None,
+    *,
+    timeout: float = READY_TIMEOUT,
+    baseline: float | None = None,
+) -> bool:
+    """Wait for readiness, apply the pacing policy and record the cost.
+
+    Pass *baseline* only where this wait replaced a fixed sleep (its mean
+    duration, e.g. :data:`LEGACY_SLEEP_S`).
+
+    Returns whether the page became ready before *timeout*.
+    """
+    waited, ready = wait_until_settled(driver, selector, timeout=timeout)
+    paced = PACING.pause()
+    SCRAPE_METRICS.record(kind, waited, paced, timed_out=not ready, baseline=baseline)
+    return ready
+
+
+async def settle_async(
+    page: Any,
+    kind: str,
+    selector: str | None = None,
+    *,
+    timeout: float = READY_TIMEOUT,
+    baseline: float | None = None,
+) -> bool:
+    """Async (Playwright) variant of :func:`settle`."""
+    waited, ready = await wait_until_settled_async(page, selector, timeout=timeout)
+    paced = await PACING.apause()
+    SCRAPE_METRICS.record(kind, waited, paced, timed_out=not ready, baseline=baseline)
+    return ready
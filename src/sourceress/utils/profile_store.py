@@ -0,0 +1,247 @@
+"""Persistent store of scraped LinkedIn profile data with per-field freshness.
+
+Candidates recur across job descriptions and reruns. :class:`ProfileStore`
+keeps the latest value of every profile field – from search cards and from
+:func:`~.scraping.enrich_profile` – keyed by
+:func:`~.identity.canonical_profile_url`, each stamped with when it was seen.
+A field is *fresh* while its age is below its TTL (:data:`DEFAULT_FIELD_TTLS`,
+scaled by ``PROFILE_STORE_TTL_SCALE``); the scrapers only revisit profiles
+whose fields have gone stale.
+
+The store lives in ``profiles.sqlite`` under ``SOURCERESS_CACHE_DIR``;
+``PROFILE_STORE=0`` turns it off.
+
+Usage
+-----
+>>> store = ProfileStore(default_cache_dir() / "profiles.sqlite")
+>>> store.put("https://uk.linkedin.com/in/jane/", {"name": "Jane", "title": "CTO"}, source="search")
+>>> store.get("https://www.linkedin.com/in/jane", ("name", "title"))
+{'name': 'Jane', 'title': 'CTO'}
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Iterable, Mapping, Sequence
+
+from loguru import logger
+
+from .cache import default_cache_dir
+from .identity import canonical_profile_url
+
+__all__ = [
+    "CARD_FIELDS",
+    "DEFAULT_FIELD_TTLS",
+    "PROFILE_FIELDS",
+    "ProfileStore",
+    "get_profile_store",
+]
+
+_DAY = 24 * 3600
+
+#: Fields :func:`~.scraping.search_linkedin` reads from a result card.
+CARD_FIELDS = ("name", "title", "location")
+
+#: Fields :func:`~.scraping.enrich_profile` reads from a profile page.
+PROFILE_FIELDS = ("name", "title", "location", "summary", "skills", "experience")
+
+#: Seconds each field stays fresh. Headlines and locations change with job
+#: moves; names and the long-form sections much less often.
+DEFAULT_FIELD_TTLS: dict[str, float] = {
+    "name": 90 * _DAY,
+    "title": 7 * _DAY,
+    "location": 14 * _DAY,
+    "summary": 30 * _DAY,
+    "skills": 30 * _DAY,
+    "experience": 14 * _DAY,
+}
+
+PROFILE_STORE_ENABLED = os.getenv("PROFILE_STORE", "1").lower() not in {"0", "false", "no", "off"}
+PROFILE_STORE_TTL_SCALE = float(os.getenv("PROFILE_STORE_TTL_SCALE", "1"))
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS profile_fields (
+    url TEXT NOT NULL,
+    field TEXT NOT NULL,
+    value TEXT NOT NULL,
+    source TEXT NOT NULL,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (url, field)
+)
+"""
+
+
+class ProfileStore:
+    """SQLite-backed field store keyed by canonical profile URL.
+
+    Args:
+        path: SQLite file; parent directories are created on first use.
+        ttls: Per-field freshness in seconds (default: :data:`DEFAULT_FIELD_TTLS`
+            scaled by ``PROFILE_STORE_TTL_SCALE``). Fields without a TTL never
+            go stale.
+
+    The connection is opened lazily and shared between threads behind a lock.
+    ``hits`` and ``misses`` count :meth:`get` lookups since construction.
+    """
+
+    def __init__(self, path: Path | str, *, ttls: Mapping[str, float] | None = None) -> None:
+        self.path = Path(path)
+        self.ttls = dict(
+            ttls
+            if ttls is not None
+            else {field: ttl * PROFILE_STORE_TTL_SCALE for field, ttl in DEFAULT_FIELD_TTLS.items()}
+        )
+        self.hits = 0
+        self.misses = 0
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def get(self, url: str, fields: Sequence[str] = PROFILE_FIELDS) -> dict[str, Any] | None:
+        """Return *fields* for *url* if every one of them is stored and fresh, else ``None``."""
+        found = self.get_many([url], fields)
+        return found.get(url)
+
+    def get_many(
+        self, urls: Iterable[str], fields: Sequence[str] = PROFILE_FIELDS
+    ) -> dict[str, dict[str, Any]]:
+        """Batch :meth:`get`: map each URL (as given) whose *fields* are all fresh to its values."""
+        urls = list(urls)
+        fresh = self.fresh_fields(urls)
+        result: dict[str, dict[str, Any]] = {}
+        for url in urls:
+            values = fresh.get(url, {})
+            if all(field in values for field in fields):
+                result[url] = {field: values[field] for field in fields}
+                self.hits += 1
+            else:
+                self.misses += 1
+        return result
+
+    def fresh_fields(self, urls: Iterable[str]) -> dict[str, dict[str, Any]]:
+        """Return whichever fields are still fresh for each URL (as given)."""
+        by_key: dict[str, list[str]] = {}
+        for url in urls:
+            by_key.setdefault(canonical_profile_url(url), []).append(url)
+        if not by_key:
+            return {}
+
+        now = time.time()
+        keys = list(by_key)
+        rows: list[tuple[str, str, str, float]] = []
+        with self._lock:
+            conn = self._connect()
+            # Stay well below SQLite's bound-parameter limit.
+            for start in range(0, len(keys), 500):
+                chunk = keys[start : start + 500]
+                rows.extend(
+                    conn.execute(
+                        "SELECT url, field, value, updated_at FROM profile_fields "
+                        f"WHERE url IN ({','.join('?' * len(chunk))})",
+                        chunk,
+                    )
+                )
+
+        result: dict[str, dict[str, Any]] = {}
+        for key, field, value, updated_at in rows:
+            ttl = self.ttls.get(field)
+            if ttl is not None and now - updated_at > ttl:
+                continue
+            decoded = json.loads(value)
+            for url in by_key[key]:
+                result.setdefault(url, {})[field] = decoded
+        return result
+
+    def put(self, url: str, data: Mapping[str, Any], *, source: str) -> None:
+        """Record the fields in *data* for *url* as seen now.
+
+        Only fields with a TTL entry (see :attr:`ttls`) are kept; other keys
+        such as ``linkedin_url`` or ``error`` are ignored.
+        """
+        self.put_many([(url, data)], source=source)
+
+    def put_many(self, items: Iterable[tuple[str, Mapping[str, Any]]], *, source: str) -> None:
+        """Batch :meth:`put` in a single transaction."""
+        now = time.time()
+        rows = [
+            (canonical_profile_url(url), field, json.dumps(value), source, now)
+            for url, data in items
+            for field, value in data.items()
+            if field in self.ttls
+        ]
+        if not rows:
+            return
+        with self._lock:
+            conn = self._connect()
+            conn.executemany(
+                "INSERT OR REPLACE INTO profile_fields (url, field, value, source, updated_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+            conn.commit()
+
+    def delete(self, url: str) -> None:
+        """Forget everything stored for *url*."""
+        with self._lock:
+            conn = self._connect()
+            conn.execute("DELETE FROM profile_fields WHERE url = ?", (canonical_profile_url(url),))
+            conn.commit()
+
+    def clear(self) -> None:
+        """Remove every profile and reset the counters."""
+        with self._lock:
+            conn = self._connect()
+            conn.execute("DELETE FROM profile_fields")
+            conn.commit()
+        self.hits = self.misses = 0
+
+    def stats(self) -> dict[str, int]:
+        """Return hit/miss counters plus the number of stored profiles."""
+        with self._lock:
+            (profiles,) = self._connect().execute(
+                "SELECT COUNT(DISTINCT url) FROM profile_fields"
+            ).fetchone()
+        return {"hits": self.hits, "misses": self.misses, "profiles": profiles}
+
+    def close(self) -> None:
+        """Close the underlying connection (reopened on next use)."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # ------------------------------------------------------------------
+    # Internal helpers (caller must hold ``self._lock``)
+    # ------------------------------------------------------------------
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(_SCHEMA)
+            logger.debug(f"Opened profile store {self.path}")
+        return self._conn
+
+
+_STORE: ProfileStore | None = None
+_STORE_LOCK = threading.Lock()
+
+
+def get_profile_store() -> ProfileStore | None:
+    """Return the process-wide store, or ``None`` when ``PROFILE_STORE=0``."""
+    global _STORE
+    if not PROFILE_STORE_ENABLED:
+        return None
+    with _STORE_LOCK:
+        if _STORE is None:
+            _STORE = ProfileStore(default_cache_dir() / "profiles.sqlite")
+        return _STORE
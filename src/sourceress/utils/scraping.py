@@ -1,161 +1,233 @@
 # sourceress/src/sourceress/utils/scraping.py
 
-"""LinkedIn scraping utilities using undetected_chromedriver for consistency with authentication."""
+"""LinkedIn scraping utilities using undetected_chromedriver for consistency with authentication.
+
+Selenium is imported inside the functions that drive the browser so that
+importing this module (e.g. via :mod:`sourceress.utils.linkedin_api`) stays cheap.
+
+Pages are read as soon as they have settled (see :mod:`.pacing`) rather than
+after fixed sleeps; human-like jitter comes from the shared pacing policy.
+With ``SCRAPER_SNAPSHOT_DIR`` set, the HTML of every page read is also saved
+for offline parsing (see :mod:`.snapshots`).
+
+Enrichment is served from the persistent :mod:`.profile_store` while a
+profile's fields are fresh; only stale or unknown profiles are visited.
+
+Browsers are borrowed from the shared :class:`~.linkedin_auth.DriverPool`, so
+Chrome start-up and cookie replay are paid once per pooled driver rather than
+once per search or profile.
+
+``SCRAPER_BACKEND=playwright`` switches the ``*_async`` entry points to
+:class:`PlaywrightScraper`: one headless Chromium driven natively from the
+event loop, with a cheap browser context (seeded with the saved session
+cookies) per page instead of a thread per browser. The synchronous functions
+always use Selenium.
+"""
 
 from __future__ import annotations
 
 import asyncio
-import random
+import math
+import os
 import time
-from typing import Any, List
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable, List, Literal, Sequence
 from urllib.parse import quote
 
 from loguru import logger
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import NoSuchElementException
 
-from .linkedin_auth import get_linkedin_driver, is_linkedin_authenticated, authenticate_linkedin
+from . import snapshots
+from .gazetteer import get_gazetteer
+from .linkedin_auth import (
+    SessionExpiredError,
+    authenticate_linkedin,
+    get_driver_pool,
+    get_session_monitor,
+    is_auth_redirect,
+    is_linkedin_authenticated,
+    load_session_cookies,
+)
+from .pacing import LEGACY_SLEEP_S, settle, settle_async
+from .profile_store import PROFILE_FIELDS, get_profile_store
+from .resource_blocking import route_context
+
+if TYPE_CHECKING:
+    from playwright.async_api import Browser, Page, Playwright
 
 # Updated selectors for LinkedIn people-search result cards (August-2025)
 PROFILE_CARD = "[data-chameleon-result-urn]"
 PROFILE_LINK = "a[href*='/in/']"
-
-
-def search_linkedin(query: str, max_results: int = 50, auto_authenticate: bool = False) -> List[dict[str, Any]]:
+PROFILE_PANEL = ".pv-text-details__left-panel"
+
+# Returns ``[{href, text}]`` for result cards not returned before (marked with
+# a data attribute) and then scrolls to load more, so each scroll step costs a
+# single round-trip and never re-reads earlier cards.
+_COLLECT_CARDS_JS = """
+const [cardSelector, linkSelector] = arguments;
+const cards = document.querySelectorAll(cardSelector + ':not([data-sourceress-seen])');
+const batch = Array.from(cards, (card) => {
+    card.setAttribute('data-sourceress-seen', '1');
+    const link = card.querySelector(linkSelector);
+    return {href: link ? link.href : null, text: card.innerText || ''};
+});
+window.scrollBy(0, document.body.scrollHeight);
+return batch;
+"""
+
+# Pulls every field of a profile page in a single round-trip. Missing
+# elements come back as ``null``.
+_EXTRACT_PROFILE_JS = """
+const text = (selector, root = document) => {
+    const el = root.querySelector(selector);
+    return el ? el.innerText.trim() : null;
+};
+const all = (selector) => Array.from(document.querySelectorAll(selector));
+return {
+    name: text('h1.text-heading-xlarge'),
+    title: text('div.text-body-medium'),
+    location: text('span.text-body-small.inline'),
+    summary: text('div.pv-shared-text-with-see-more'),
+    skills: all('span.pv-skill-category-entity__name').slice(0, 10).map((el) => el.innerText.trim()),
+    experience: all('div.pv-entity__summary-info').slice(0, 5)
+        .map((el) => ({title: text('h3', el), company: text('p.pv-entity__secondary-title', el)}))
+        .filter((exp) => exp.title !== null && exp.company !== null),
+};
+"""
+
+#: Default number of profiles enriched in parallel by :func:`enrich_profiles`.
+ENRICH_CONCURRENCY = int(os.getenv("LINKEDIN_ENRICH_CONCURRENCY", "3"))
+
+#: ``scroll`` (default) or ``pages`` – how :func:`search_linkedin` walks the results.
+SEARCH_MODE = os.getenv("LINKEDIN_SEARCH_MODE", "scroll").lower()
+
+#: Result pages fetched in parallel in ``pages`` mode.
+SEARCH_PAGE_CONCURRENCY = int(os.getenv("LINKEDIN_SEARCH_PAGE_CONCURRENCY", "3"))
+
+#: LinkedIn shows 10 people per result page and at most 100 pages.
+RESULTS_PER_PAGE = 10
+MAX_SEARCH_PAGES = 100
+
+#: ``selenium`` (default) or ``playwright`` – engine behind the ``*_async`` functions.
+SCRAPER_BACKEND = os.getenv("SCRAPER_BACKEND", "selenium").lower()
+
+#: Maximum pages the Playwright engine keeps open at once.
+PLAYWRIGHT_MAX_PAGES = int(os.getenv("PLAYWRIGHT_MAX_PAGES", "16"))
+
+#: Receives each profile as soon as its card is parsed; returning ``False``
+#: stops the search early.
+CardCallback = Callable[[dict[str, Any]], bool | None]
+AsyncCardCallback = Callable[[dict[str, Any]], Awaitable[bool | None]]
+
+
+def _navigate(driver: Any, url: str) -> None:
+    """Load *url* and count the page against the driver's recycling budget."""
+    driver.get(url)
+    get_driver_pool().record_page(driver)
+
+
+def _search_url(query: str, page: int = 1) -> str:
+    url = f"https://www.linkedin.com/search/results/people/?keywords={quote(query)}"
+    return url if page <= 1 else f"{url}&page={page}"
+
+
+def search_linkedin(
+    query: str,
+    max_results: int = 50,
+    auto_authenticate: bool = False,
+    mode: Literal["scroll", "pages"] | None = None,
+    page_concurrency: int | None = None,
+    on_card: CardCallback | None = None,
+) -> List[dict[str, Any]]:
     """Search LinkedIn and return profile dictionaries using authenticated session.
 
     Args:
         query: Search query string.
         max_results: Maximum number of profiles to return.
         auto_authenticate: If True, automatically authenticate if no session exists.
+        mode: ``"scroll"`` scrolls the first result page; ``"pages"`` fetches
+            the ``&page=N`` result pages in parallel on pooled drivers
+            (default: ``LINKEDIN_SEARCH_MODE``).
+        page_concurrency: Result pages loaded at once in ``pages`` mode
+            (default: ``LINKEDIN_SEARCH_PAGE_CONCURRENCY``).
+        on_card: Called with each profile as soon as it is parsed, from the
+            calling thread; returning ``False`` stops the search.
 
     Returns:
         A list of dicts with profile data.
     """
+
     logger.info(f"Searching LinkedIn for: {query} (max {max_results} results)")
 
     # Check authentication status
-    if not is_linkedin_authenticated():
-        if auto_authenticate:
-            logger.info("No LinkedIn session found. Starting authentication flow...")
-            authenticate_linkedin()
-        else:
-            raise ValueError(
-                "No LinkedIn session found. Please authenticate first:\n"
-                "1. Run: python tests/test_linkedin_auth.py\n"
-                "2. Or call search_linkedin() with auto_authenticate=True"
-            )
+    _ensure_session(auto_authenticate, "search_linkedin")
 
-    # Get authenticated driver from linkedin_auth
-    driver = get_linkedin_driver()
+    # Borrow an authenticated driver from the shared pool
+    pool = get_driver_pool()
+    driver = pool.checkout()
 
     try:
         # Navigate to LinkedIn People Search
-        search_url = f"https://www.linkedin.com/search/results/people/?keywords={quote(query)}"
+        search_url = _search_url(query)
         logger.info(f"Navigating to: {search_url}")
-        driver.get(search_url)
+        _navigate(driver, search_url)
 
         # Check if we're still authenticated (session might have expired)
-        if _is_signed_out(driver):
+        if _session_lost(driver, search_url):
             logger.warning("LinkedIn session appears to have expired")
+            # Every pooled driver carries the expired cookies.
+            pool.invalidate()
             if auto_authenticate:
                 logger.info("Attempting to re-authenticate...")
-                driver.quit()
+                pool.checkin(driver, discard=True)
+                driver = None
                 authenticate_linkedin()
-                driver = get_linkedin_driver()
-                driver.get(search_url)
+                driver = pool.checkout()
+                _navigate(driver, search_url)
             else:
-                raise ValueError(
+                raise SessionExpiredError(
                     "LinkedIn session expired. Please re-authenticate:\n"
                     "1. Run: python tests/test_linkedin_auth.py\n"
                     "2. Or call search_linkedin() with auto_authenticate=True"
                 )
 
-        # Wait for search results to render – poll until at least one result
-        # element is present. LinkedIn sometimes loads results lazily so we
-        # use a lambda with a longer timeout instead of a static locator.
-        def _results_present(d):
-            return len(d.find_elements(By.CSS_SELECTOR, PROFILE_CARD)) > 0
-
-        try:
-            WebDriverWait(driver, 20).until(_results_present)
-        except Exception as wait_err:  # TimeoutException or others
-            logger.warning(f"Results did not appear within timeout: {wait_err}. Continuing anyway.")
-
-        # Debug: log number of cards detected right after wait
-        initial_count = len(driver.find_elements(By.CSS_SELECTOR, PROFILE_CARD))
-        logger.debug(f"Initial profile card count: {initial_count}")
+        # Wait for search results to render and the page to go quiet.
+        # LinkedIn sometimes loads results lazily so we allow a longer timeout.
+        if not settle(driver, "search", PROFILE_CARD, timeout=20, baseline=LEGACY_SLEEP_S):
+            logger.warning("Results did not appear within timeout. Continuing anyway.")
 
-        # Random delay to appear more human
-        time.sleep(random.uniform(2, 4))
+        if (mode or SEARCH_MODE) == "pages":
+            profiles = _collect_pages(
+                driver, query, max_results, page_concurrency or SEARCH_PAGE_CONCURRENCY, on_card
+            )
+            logger.info(f"Successfully collected {len(profiles)} profiles")
+            return profiles
 
         profiles = []
         seen_links: set[str] = set()
+        scrolled = False
 
-        # Scroll and collect profiles
+        # Collect and scroll – one script round-trip per scroll step, returning
+        # only the cards that have not been harvested yet.
         while len(profiles) < max_results:
-            profile_containers = driver.find_elements(By.CSS_SELECTOR, PROFILE_CARD)
-
-            for container in profile_containers:
-                try:
-                    # Find profile link within container
-                    profile_link = container.find_element(By.CSS_SELECTOR, PROFILE_LINK)
-                    href = profile_link.get_attribute("href")
-                    if not href or href in seen_links:
-                        continue
-                    seen_links.add(href)
-                    
-                    # Parse structured text from container
-                    container_text = container.text
-                    lines = [line.strip() for line in container_text.split('\n') if line.strip()]
-                    
-                    if len(lines) < 2:
-                        continue
-                    
-                    # Extract name (first line, clean up "View profile" text)
-                    name = lines[0].replace("View", "").replace("profile", "").replace("'s", "").strip()
-                    
-                    # Find job title and location from remaining lines
-                    title = ""
-                    location = ""
-                    
-                    for line in lines[1:]:
-                        # Skip connection info lines
-                        if line.startswith("•") or "degree connection" in line or "mutual connection" in line:
-                            continue
-                        if line in ["Connect", "Message", "Follow"]:
-                            continue
-                            
-                        # Job title usually contains @ or job keywords
-                        if ("@" in line or 
-                            any(keyword in line.lower() for keyword in ["developer", "engineer", "manager", "analyst", "scientist", "designer", "consultant", "director", "lead", "senior", "junior"])):
-                            if not title:  # Take the first job title line
-                                title = line
-                                # Clean up "Current:" or "Past:" prefixes
-                                title = title.replace("Current: ", "").replace("Past: ", "")
-                        
-                        # Location usually contains place names
-                        elif (any(keyword in line for keyword in ["London", "New York", "San Francisco", "Area", "UK", "US", "United", "Greater", "Metropolitan", "City", "State"]) 
-                              and "@" not in line and not location):
-                            location = line
-                    
-                    # Use the data as LinkedIn provides it
-                    if name and len(name) > 1:
-                        profiles.append({
-                            "name": name,
-                            "linkedin_url": href.split("?")[0],
-                            "title": title,
-                            "location": location,
-                            "summary": "",
-                            "skills": [],
-                        })
-                        logger.debug(f"Collected: {name} - {title}")
-                        
-                except Exception as e:
-                    logger.debug(f"Error parsing profile container: {e}")
+            new_cards = driver.execute_script(_COLLECT_CARDS_JS, PROFILE_CARD, PROFILE_LINK) or []
+            logger.debug(f"Harvested {len(new_cards)} new profile cards")
+
+            for card in new_cards:
+                href = card.get("href")
+                if not href or href in seen_links:
+                    continue
+                seen_links.add(href)
+
+                profile = _parse_card(href, card.get("text") or "")
+                if profile is None:
                     continue
+                profiles.append(profile)
+                logger.debug(f"Collected: {profile['name']} - {profile['title']}")
+                if on_card is not None and on_card(profile) is False:
+                    logger.info(f"Search stopped by caller after {len(profiles)} profiles")
+                    return profiles
 
                 if len(profiles) >= max_results:
                     break
@@ -163,36 +235,250 @@ def search_linkedin(query: str, max_results: int = 50, auto_authenticate: bool =
             if len(profiles) >= max_results:
                 break
 
-            # Scroll further and wait before checking for new results
-            driver.execute_script("window.scrollBy(0, document.body.scrollHeight);")
-            time.sleep(random.uniform(2, 4))
-            
-            # Stop if scrolling didn't add new containers
-            new_count = len(driver.find_elements(By.CSS_SELECTOR, PROFILE_CARD))
-            if new_count == len(seen_links):
+            # Stop if the last scroll didn't add new cards
+            if scrolled and not new_cards:
                 logger.info("Reached end of results")
                 break
 
+            # The script already scrolled; wait for new results to settle
+            scrolled = True
+            settle(driver, "scroll", baseline=LEGACY_SLEEP_S)
+
+        _capture("search", search_url, driver)
         logger.info(f"Successfully collected {len(profiles)} profiles")
         return profiles[:max_results]
 
+    except SessionExpiredError:
+        # Not a short result set: the caller must re-authenticate.
+        raise
+
     except Exception as e:
         logger.error(f"LinkedIn search failed: {e}")
         return []
 
     finally:
-        driver.quit()
+        if driver is not None:
+            pool.checkin(driver)
+
+
+def _collect_pages(
+    first_page_driver: Any,
+    query: str,
+    max_results: int,
+    concurrency: int,
+    on_card: CardCallback | None = None,
+) -> List[dict[str, Any]]:
+    """Harvest result pages 1, 2, 3, … with up to *concurrency* pages in flight.
+
+    Page 1 is read from the driver that already loaded it. Later pages are
+    fetched on other pooled drivers and merged in page order, deduplicated by
+    URL. Fetching stops at the first empty page, once *max_results* unique
+    profiles are in hand or when *on_card* returns ``False``; pages still
+    queued are cancelled. A :class:`~.linkedin_auth.SessionExpiredError` from
+    any page is re-raised rather than read as the end of the results.
+    """
+
+    profiles: list[dict[str, Any]] = []
+    seen_links: set[str] = set()
+
+    def _merge(cards: list[dict[str, Any]]) -> bool:
+        """Add *cards*; return True while more profiles are wanted."""
+        for card in cards:
+            href = card.get("href")
+            if not href or href in seen_links:
+                continue
+            seen_links.add(href)
+            profile = _parse_card(href, card.get("text") or "")
+            if profile is not None:
+                profiles.append(profile)
+                if on_card is not None and on_card(profile) is False:
+                    return False
+                if len(profiles) >= max_results:
+                    return False
+        return True
+
+    if not _merge(_harvest_cards(first_page_driver)):
+        return profiles
+
+    concurrency = max(1, concurrency)
+    # The page-1 driver stays checked out until we return.
+    get_driver_pool().grow(concurrency + 1)
+    executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="search-page")
+    pending: deque[Future[list[dict[str, Any]]]] = deque()
+    next_page = 2
+    start = time.perf_counter()
+
+    def _submit() -> None:
+        nonlocal next_page
+        if next_page <= MAX_SEARCH_PAGES:
+            pending.append(executor.submit(_fetch_search_page, query, next_page))
+            next_page += 1
+
+    try:
+        for _ in range(min(concurrency, math.ceil(max_results / RESULTS_PER_PAGE))):
+            _submit()
+        while pending:
+            cards = pending.popleft().result()
+            if not cards:
+                logger.info("Reached end of results")
+                break
+            if not _merge(cards):
+                break
+            _submit()
+    finally:
+        # Don't wait for in-flight pages we no longer need.
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    logger.debug(
+        f"Fetched {next_page - 1 - len(pending)} result pages in "
+        f"{time.perf_counter() - start:.1f}s (concurrency={concurrency})"
+    )
+    return profiles
+
+
+def _fetch_search_page(query: str, page: int) -> list[dict[str, Any]]:
+    """Load result page *page* on a pooled driver and return its raw cards.
+
+    An empty list means the page has no results (or could not be read).
+
+    Raises:
+        SessionExpiredError: LinkedIn signed the driver out, so the page says
+            nothing about where the results end.
+    """
+
+    pool = get_driver_pool()
+    try:
+        with pool.driver() as driver:
+            url = _search_url(query, page)
+            _navigate(driver, url)
+            if _session_lost(driver, url):
+                # Every pooled driver carries the expired cookies.
+                pool.invalidate()
+                raise SessionExpiredError(f"LinkedIn session expired while loading result page {page}")
+            if not settle(driver, "search", PROFILE_CARD):
+                return []  # no results – past the last page
+            return _harvest_cards(driver)
+    except SessionExpiredError:
+        raise
+    except Exception as e:
+        logger.warning(f"Failed to load result page {page}: {e}")
+        return []
+
+
+def _harvest_cards(driver: Any, max_passes: int = 3) -> list[dict[str, Any]]:
+    """Collect every card on the current result page, scrolling to render lazy ones."""
+
+    cards: list[dict[str, Any]] = []
+    for attempt in range(max_passes):
+        batch = driver.execute_script(_COLLECT_CARDS_JS, PROFILE_CARD, PROFILE_LINK) or []
+        if not batch and attempt:
+            break
+        cards.extend(batch)
+        settle(driver, "scroll")
+    _capture("search", driver.current_url, driver)
+    return cards
+
+
+def _capture(kind: snapshots.SnapshotKind, url: str, driver: Any) -> None:
+    """Save the driver's current page when snapshot capture is on."""
+    if not snapshots.SNAPSHOT_DIR:
+        return
+    try:
+        snapshots.save_snapshot(kind, url, driver.page_source)
+    except Exception as e:  # noqa: BLE001
+        logger.warning(f"Failed to save {kind} snapshot of {url}: {e}")
+
+
+async def _capture_async(kind: snapshots.SnapshotKind, url: str, page: Page) -> None:
+    """Playwright variant of :func:`_capture`."""
+    if not snapshots.SNAPSHOT_DIR:
+        return
+    try:
+        await asyncio.to_thread(snapshots.save_snapshot, kind, url, await page.content())
+    except Exception as e:  # noqa: BLE001
+        logger.warning(f"Failed to save {kind} snapshot of {url}: {e}")
+
+
+def _parse_card(href: str, text: str) -> dict[str, Any] | None:
+    """Turn a search result card's link and visible text into a profile dict.
+
+    Returns ``None`` when the card does not contain a usable name.
+    """
+    lines = [line.strip() for line in text.split('\n') if line.strip()]
+    if len(lines) < 2:
+        return None
+
+    # Extract name (first line, clean up "View profile" text)
+    name = lines[0].replace("View", "").replace("profile", "").replace("'s", "").strip()
+
+    # Find job title and location from remaining lines (see :mod:`.gazetteer`)
+    classify = get_gazetteer().classify
+    title = ""
+    location = ""
+
+    for line in lines[1:]:
+        # Skip connection info lines
+        if line.startswith("•") or "degree connection" in line or "mutual connection" in line:
+            continue
+        if line in ["Connect", "Message", "Follow"]:
+            continue
+
+        # Job title contains @ or a title term; location names a place
+        kind = classify(line)
+        if kind == "title":
+            if not title:  # Take the first job title line
+                # Clean up "Current:" or "Past:" prefixes
+                title = line.replace("Current: ", "").replace("Past: ", "")
+
+        elif kind == "location" and not location:
+            location = line
+
+    # Use the data as LinkedIn provides it
+    if not name or len(name) <= 1:
+        return None
+    return {
+        "name": name,
+        "linkedin_url": href.split("?")[0],
+        "title": title,
+        "location": location,
+        "summary": "",
+        "skills": [],
+    }
+
+
+def _session_lost(driver: Any, url: str) -> bool:
+    """Return True if the navigation to *url* shows the session has ended.
+
+    The landing URL and the saved cookie expiry settle most navigations (see
+    :class:`~.linkedin_auth.SessionMonitor`); the DOM probe
+    :func:`_is_signed_out` only runs on suspicion.
+    """
+    monitor = get_session_monitor()
+    try:
+        landed = str(driver.current_url or "")
+    except Exception:  # noqa: BLE001
+        landed = ""
+    signed_out = monitor.assess(url, landed)
+    if signed_out is None:
+        signed_out = _is_signed_out(driver)
+        monitor.record_probe(signed_out)
+    return signed_out
 
 
 def _is_signed_out(driver) -> bool:
     """Check if the current page indicates we're signed out.
 
+    This scans the whole DOM; call it through :func:`_session_lost`.
+
     Args:
         driver: Selenium WebDriver instance
 
     Returns:
         True if signed out, False if still authenticated
     """
+
+    from selenium.webdriver.common.by import By
+
     try:
         # Check for sign-in elements
         sign_in_buttons = driver.find_elements(By.CSS_SELECTOR, "a[href*='login'], button[data-tracking-control-name='public_profile_v3_web_login_button']")
@@ -203,7 +489,7 @@ def _is_signed_out(driver) -> bool:
 
         # Check current URL
         current_url = driver.current_url
-        is_login_page = "login" in current_url or "authwall" in current_url
+        is_login_page = is_auth_redirect(current_url)
 
         logger.debug(f"Sign-in check: buttons={len(sign_in_buttons)}, text={len(sign_in_text)}, challenge={len(auth_challenge)}, login_page={is_login_page}")
 
@@ -214,46 +500,52 @@ def _is_signed_out(driver) -> bool:
         return False
 
 
-def enrich_profile(profile_url: str, auto_authenticate: bool = False) -> dict[str, Any]:
+def enrich_profile(
+    profile_url: str, auto_authenticate: bool = False, cache: bool = True, *, lookup: bool = True
+) -> dict[str, Any]:
     """Enrich a profile by visiting its individual page.
 
     Args:
         profile_url: LinkedIn profile URL
         auto_authenticate: If True, automatically authenticate if no session exists.
+        cache: Serve fresh data from the profile store instead of visiting the
+            page, and record what is scraped.
+        lookup: Check the profile store before visiting. Batch callers that
+            have already found *profile_url* stale pass ``False``.
 
     Returns:
         Dictionary with enriched profile data
     """
+
+    if cache and lookup and (stored := _stored_profiles([profile_url]).get(profile_url)) is not None:
+        logger.info(f"Serving stored profile: {profile_url}")
+        return stored
+
     logger.info(f"Enriching profile: {profile_url}")
 
     # Check authentication status
-    if not is_linkedin_authenticated():
-        if auto_authenticate:
-            logger.info("No LinkedIn session found. Starting authentication flow...")
-            authenticate_linkedin()
-        else:
-            raise ValueError(
-                "No LinkedIn session found. Please authenticate first:\n"
-                "1. Run: python tests/test_linkedin_auth.py\n"
-                "2. Or call enrich_profile() with auto_authenticate=True"
-            )
+    _ensure_session(auto_authenticate, "enrich_profile")
 
-    # Get authenticated driver
-    driver = get_linkedin_driver()
+    # Borrow an authenticated driver from the shared pool
+    pool = get_driver_pool()
+    driver = pool.checkout()
 
     try:
         # Navigate to profile page
-        driver.get(profile_url)
+        _navigate(driver, profile_url)
 
         # Check if we're still authenticated
-        if _is_signed_out(driver):
+        if _session_lost(driver, profile_url):
             logger.warning("LinkedIn session appears to have expired")
+            # Every pooled driver carries the expired cookies.
+            pool.invalidate()
             if auto_authenticate:
                 logger.info("Attempting to re-authenticate...")
-                driver.quit()
+                pool.checkin(driver, discard=True)
+                driver = None
                 authenticate_linkedin()
-                driver = get_linkedin_driver()
-                driver.get(profile_url)
+                driver = pool.checkout()
+                _navigate(driver, profile_url)
             else:
                 raise ValueError(
                     "LinkedIn session expired. Please re-authenticate:\n"
@@ -262,23 +554,14 @@ def enrich_profile(profile_url: str, auto_authenticate: bool = False) -> dict[st
                 )
 
         # Wait for profile to load
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.CLASS_NAME, "pv-text-details__left-panel"))
-        )
+        if not settle(driver, "profile", PROFILE_PANEL, baseline=LEGACY_SLEEP_S):
+            raise TimeoutError("Profile page did not load within timeout")
+        _capture("profile", profile_url, driver)
 
-        # Random delay
-        time.sleep(random.uniform(2, 4))
-
-        # Extract detailed profile information
-        profile_data = {
-            "linkedin_url": profile_url,
-            "name": _extract_profile_name(driver),
-            "title": _extract_profile_title(driver),
-            "location": _extract_profile_location(driver),
-            "summary": _extract_profile_summary(driver),
-            "skills": _extract_profile_skills(driver),
-            "experience": _extract_profile_experience(driver),
-        }
+        # Extract detailed profile information in one round-trip
+        profile_data = {"linkedin_url": profile_url, **_extract_profile(driver)}
+        if cache:
+            _store_profile(profile_data)
 
         logger.info(f"Successfully enriched profile for: {profile_data['name']}")
         return profile_data
@@ -288,75 +571,195 @@ def enrich_profile(profile_url: str, auto_authenticate: bool = False) -> dict[st
         return {"linkedin_url": profile_url, "error": str(e)}
 
     finally:
-        driver.quit()
+        if driver is not None:
+            pool.checkin(driver)
 
 
-def _extract_profile_name(driver) -> str:
-    """Extract name from profile page."""
-    try:
-        name_elem = driver.find_element(By.CSS_SELECTOR, "h1.text-heading-xlarge")
-        return name_elem.text.strip()
-    except NoSuchElementException:
-        return "Unknown"
+def enrich_profiles(
+    urls: Sequence[str],
+    concurrency: int | None = None,
+    auto_authenticate: bool = False,
+    cache: bool = True,
+) -> List[dict[str, Any]]:
+    """Enrich many profiles in parallel, one pooled browser per worker.
 
+    Args:
+        urls: LinkedIn profile URLs.
+        concurrency: Maximum number of profiles loaded at once
+            (default: ``LINKEDIN_ENRICH_CONCURRENCY``). The driver pool is grown
+            to match.
+        auto_authenticate: If True, automatically authenticate if no session exists.
+        cache: Serve profiles that are fresh in the profile store without a
+            browser; only the rest are visited.
 
-def _extract_profile_title(driver) -> str:
-    """Extract title/headline from profile page."""
-    try:
-        title_elem = driver.find_element(By.CSS_SELECTOR, "div.text-body-medium")
-        return title_elem.text.strip()
-    except NoSuchElementException:
-        return "Unknown"
+    Returns:
+        One dict per URL, in input order. Failed profiles carry an ``error``
+        key (see :func:`enrich_profile`) instead of aborting the batch.
+    """
 
+    if not urls:
+        return []
+    results, pending = _split_stored(urls, cache)
+    if not pending:
+        return results
+    concurrency = max(1, min(concurrency or ENRICH_CONCURRENCY, len(pending)))
+    _ensure_session(auto_authenticate, "enrich_profiles")
+    get_driver_pool().grow(concurrency)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="enrich") as executor:
+        scraped = list(
+            executor.map(lambda i: _enrich_or_error(urls[i], auto_authenticate, cache), pending)
+        )
+    _log_throughput(scraped, time.perf_counter() - start, concurrency)
+    for i, result in zip(pending, scraped, strict=True):
+        results[i] = result
+    return results
 
-def _extract_profile_location(driver) -> str:
-    """Extract location from profile page."""
-    try:
-        location_elem = driver.find_element(By.CSS_SELECTOR, "span.text-body-small.inline")
-        return location_elem.text.strip()
-    except NoSuchElementException:
-        return "Unknown"
 
+async def enrich_profiles_async(
+    urls: Sequence[str],
+    concurrency: int | None = None,
+    auto_authenticate: bool = False,
+    cache: bool = True,
+) -> List[dict[str, Any]]:
+    """Async variant of :func:`enrich_profiles`, bounded by a semaphore."""
 
-def _extract_profile_summary(driver) -> str:
-    """Extract summary/about section from profile page."""
+    if not urls:
+        return []
+    results, pending = await asyncio.to_thread(_split_stored, urls, cache)
+    if not pending:
+        return results
+    concurrency = max(1, min(concurrency or ENRICH_CONCURRENCY, len(pending)))
+    if SCRAPER_BACKEND == "playwright":
+        scraper = get_playwright_scraper()
+        scraped = await scraper.enrich_many(
+            [urls[i] for i in pending],
+            concurrency,
+            auto_authenticate=auto_authenticate,
+            cache=cache,
+            lookup=False,
+        )
+    else:
+        _ensure_session(auto_authenticate, "enrich_profiles_async")
+        get_driver_pool().grow(concurrency)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _one(url: str) -> dict[str, Any]:
+            async with semaphore:
+                return await asyncio.to_thread(_enrich_or_error, url, auto_authenticate, cache)
+
+        start = time.perf_counter()
+        scraped = await asyncio.gather(*(_one(urls[i]) for i in pending))
+        _log_throughput(scraped, time.perf_counter() - start, concurrency)
+    for i, result in zip(pending, scraped, strict=True):
+        results[i] = result
+    return results
+
+
+def _stored_profiles(urls: Sequence[str]) -> dict[str, dict[str, Any]]:
+    """Look up *urls* in the profile store; map those fully fresh to enrichment dicts."""
+    store = get_profile_store()
+    if store is None:
+        return {}
     try:
-        summary_elem = driver.find_element(By.CSS_SELECTOR, "div.pv-shared-text-with-see-more")
-        return summary_elem.text.strip()
-    except NoSuchElementException:
-        return ""
+        found = store.get_many(urls, PROFILE_FIELDS)
+    except Exception as e:  # noqa: BLE001
+        logger.warning(f"Profile store lookup failed: {e}")
+        return {}
+    return {url: {"linkedin_url": url, **fields} for url, fields in found.items()}
 
 
-def _extract_profile_skills(driver) -> List[str]:
-    """Extract skills from profile page."""
+def _store_profile(profile_data: dict[str, Any]) -> None:
+    """Record a successfully scraped profile.
+
+    Pages that did not render are skipped. Fields that still hold the
+    :data:`_UNKNOWN` placeholder are left out, so they are scraped again
+    instead of being served as fresh.
+    """
+    store = get_profile_store()
+    if store is None or "error" in profile_data or profile_data.get("name") == _UNKNOWN:
+        return
+    fields = {key: value for key, value in profile_data.items() if value != _UNKNOWN}
     try:
-        skills_elements = driver.find_elements(By.CSS_SELECTOR, "span.pv-skill-category-entity__name")
-        return [skill.text.strip() for skill in skills_elements[:10]]  # Limit to top 10
-    except NoSuchElementException:
-        return []
+        store.put(profile_data["linkedin_url"], fields, source="profile")
+    except Exception as e:  # noqa: BLE001
+        logger.warning(f"Failed to store profile {profile_data['linkedin_url']}: {e}")
+
+
+def _split_stored(
+    urls: Sequence[str], cache: bool
+) -> tuple[list[dict[str, Any]], list[int]]:
+    """Fill stored profiles into an ``urls``-aligned list; return it and the indices still to scrape."""
+    stored = _stored_profiles(urls) if cache else {}
+    results: list[dict[str, Any]] = [stored.get(url, {}) for url in urls]
+    pending = [i for i, url in enumerate(urls) if url not in stored]
+    if stored:
+        logger.info(f"Serving {len(urls) - len(pending)}/{len(urls)} profiles from the profile store")
+    return results, pending
+
+
+def _ensure_session(auto_authenticate: bool, caller: str) -> None:
+    """Fail fast (once per batch) when no LinkedIn session exists."""
+    if is_linkedin_authenticated():
+        return
+    if auto_authenticate:
+        logger.info("No LinkedIn session found. Starting authentication flow...")
+        authenticate_linkedin()
+        return
+    raise ValueError(
+        "No LinkedIn session found. Please authenticate first:\n"
+        "1. Run: python tests/test_linkedin_auth.py\n"
+        f"2. Or call {caller}() with auto_authenticate=True"
+    )
+
+
+def _enrich_or_error(url: str, auto_authenticate: bool, cache: bool = True) -> dict[str, Any]:
+    """Scrape a profile :func:`_split_stored` found stale; failures become error dicts."""
+    try:
+        return enrich_profile(url, auto_authenticate=auto_authenticate, cache=cache, lookup=False)
+    except Exception as e:  # noqa: BLE001
+        logger.error(f"Failed to enrich profile {url}: {e}")
+        return {"linkedin_url": url, "error": str(e)}
 
 
-def _extract_profile_experience(driver) -> List[dict[str, str]]:
-    """Extract experience entries from profile page."""
-    try:
-        experience_elements = driver.find_elements(By.CSS_SELECTOR, "div.pv-entity__summary-info")
-        experiences = []
+def _log_throughput(results: Sequence[dict[str, Any]], elapsed: float, concurrency: int) -> None:
+    failed = sum(1 for result in results if "error" in result)
+    logger.info(
+        f"Enriched {len(results) - failed}/{len(results)} profiles in {elapsed:.1f}s "
+        f"({len(results) / max(elapsed, 1e-9):.2f} profiles/s, concurrency={concurrency}, "
+        f"failed={failed})"
+    )
 
-        for exp_elem in experience_elements[:5]:  # Limit to top 5
-            try:
-                title_elem = exp_elem.find_element(By.CSS_SELECTOR, "h3")
-                company_elem = exp_elem.find_element(By.CSS_SELECTOR, "p.pv-entity__secondary-title")
-
-                experiences.append({
-                    "title": title_elem.text.strip(),
-                    "company": company_elem.text.strip(),
-                })
-            except NoSuchElementException:
-                continue
 
-        return experiences
-    except NoSuchElementException:
-        return []
+def _extract_profile(driver) -> dict[str, Any]:
+    """Extract name, headline, location, summary, skills and experience from a profile page."""
+    data = driver.execute_script(_EXTRACT_PROFILE_JS)
+    return _parse_profile(data if isinstance(data, dict) else {})
+
+
+# Stands in for a name, title or location the page did not show.
+_UNKNOWN = "Unknown"
+
+
+def _parse_profile(data: dict[str, Any]) -> dict[str, Any]:
+    """Apply the defaults used for profile fields that were not found on the page."""
+
+    def _text(key: str, default: str) -> str:
+        value = data.get(key)
+        return value if isinstance(value, str) else default
+
+    return {
+        "name": _text("name", _UNKNOWN),
+        "title": _text("title", _UNKNOWN),
+        "location": _text("location", _UNKNOWN),
+        "summary": _text("summary", ""),
+        "skills": list(data.get("skills") or []),
+        "experience": [
+            {"title": exp["title"], "company": exp["company"]}
+            for exp in data.get("experience") or []
+        ],
+    }
 
 
 def test_linkedin_search() -> bool:
@@ -385,14 +788,403 @@ def test_linkedin_search() -> bool:
         return False
 
 
-# Async wrapper for compatibility (if needed)
-async def search_linkedin_async(query: str, max_results: int = 50, auto_authenticate: bool = False) -> List[dict[str, Any]]:
-    """Async wrapper for LinkedIn search."""
+# Async entry points – Playwright when SCRAPER_BACKEND=playwright, else Selenium in a thread
+async def search_linkedin_async(
+    query: str,
+    max_results: int = 50,
+    auto_authenticate: bool = False,
+    on_card: AsyncCardCallback | None = None,
+) -> List[dict[str, Any]]:
+    """Async LinkedIn search (see :func:`search_linkedin`).
+
+    *on_card* is awaited on the event loop for each parsed profile; with the
+    Selenium engine the scraping thread waits for it, so a slow callback
+    slows the scroll down rather than piling up results. If *on_card* raises,
+    the search stops and the exception is re-raised here rather than being
+    taken for a failed search.
+
+    Each Selenium search runs on a thread of its own, outside the loop's
+    default executor: the thread blocks on *on_card*, which may itself need
+    a default-executor thread (``asyncio.to_thread``), so concurrent searches
+    sharing that pool could occupy every worker and deadlock.
+    """
+    errors: list[Exception] = []
+    guarded: AsyncCardCallback | None = None
+    if on_card is not None:
+
+        async def guarded(profile: dict[str, Any]) -> bool | None:
+            try:
+                return await on_card(profile)
+            except Exception as exc:  # noqa: BLE001
+                errors.append(exc)
+                return False
+
+    if SCRAPER_BACKEND == "playwright":
+        profiles = await get_playwright_scraper().search(query, max_results, auto_authenticate, guarded)
+    else:
+        loop = asyncio.get_running_loop()
+        callback: CardCallback | None = None
+        if guarded is not None:
+
+            def callback(profile: dict[str, Any]) -> bool | None:
+                return asyncio.run_coroutine_threadsafe(guarded(profile), loop).result()
+
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="linkedin-search")
+        try:
+            profiles = await loop.run_in_executor(
+                executor, lambda: search_linkedin(query, max_results, auto_authenticate, on_card=callback)
+            )
+        finally:
+            executor.shutdown(wait=False)
+    if errors:
+        raise errors[0]
+    return profiles
+
+
+async def enrich_profile_async(
+    profile_url: str, auto_authenticate: bool = False, cache: bool = True
+) -> dict[str, Any]:
+    """Async profile enrichment (see :func:`enrich_profile`)."""
+    if SCRAPER_BACKEND == "playwright":
+        return await get_playwright_scraper().enrich(profile_url, auto_authenticate, cache)
     loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(None, search_linkedin, query, max_results, auto_authenticate)
+    return await loop.run_in_executor(None, enrich_profile, profile_url, auto_authenticate, cache)
+
+
+# -----------------------------------------------------------------------------
+# Playwright engine
+# -----------------------------------------------------------------------------
+
+
+def _as_function(script: str) -> str:
+    """Adapt a Selenium ``execute_script`` body (``arguments``/``return``) for ``page.evaluate``."""
+    return f"(args) => (function () {{{script}}}).apply(null, args)"
+
+
+# Same signals as :func:`_is_signed_out`, evaluated in one round-trip.
+_SIGNED_OUT_JS = """
+() => Boolean(
+    document.querySelector(
+        "a[href*='login'], "
+        + "button[data-tracking-control-name='public_profile_v3_web_login_button'], "
+        + "div[data-test-id='challenge-page']"
+    )
+    || document.evaluate(
+        "//*[contains(text(), 'Sign in')]", document, null,
+        XPathResult.FIRST_ORDERED_NODE_TYPE, null
+    ).singleNodeValue
+)
+"""
+
+_SAME_SITE = {"lax": "Lax", "strict": "Strict", "none": "None"}
+
+
+def _to_playwright_cookie(cookie: dict[str, Any]) -> dict[str, Any]:
+    """Convert a Selenium cookie dict into the shape ``BrowserContext.add_cookies`` expects."""
+    converted: dict[str, Any] = {
+        "name": cookie["name"],
+        "value": cookie["value"],
+        "domain": cookie.get("domain") or ".linkedin.com",
+        "path": cookie.get("path") or "/",
+        "secure": bool(cookie.get("secure", False)),
+        "httpOnly": bool(cookie.get("httpOnly", False)),
+    }
+    if cookie.get("expiry") is not None:
+        converted["expires"] = float(cookie["expiry"])
+    same_site = _SAME_SITE.get(str(cookie.get("sameSite", "")).lower())
+    if same_site:
+        converted["sameSite"] = same_site
+    return converted
+
+
+class PlaywrightScraper:
+    """Natively async LinkedIn scraper on a single shared Chromium.
+
+    Each search or profile visit runs in its own browser context seeded with
+    the saved session cookies and routed through the resource-blocking policy
+    (see :mod:`.resource_blocking`); contexts are cheap, so one event loop can
+    drive many pages concurrently (bounded by ``max_pages``). The browser is
+    launched on first use; call :meth:`close` (or use ``async with``) to stop
+    it. Results match :func:`search_linkedin` / :func:`enrich_profile`.
 
+    Args:
+        max_pages: Maximum number of pages open at once.
+        headless: Launch Chromium without a window.
+    """
 
-async def enrich_profile_async(profile_url: str, auto_authenticate: bool = False) -> dict[str, Any]:
-    """Async wrapper for profile enrichment."""
-    loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(None, enrich_profile, profile_url, auto_authenticate)
+    def __init__(self, max_pages: int = PLAYWRIGHT_MAX_PAGES, headless: bool = True) -> None:
+        self.max_pages = max(1, max_pages)
+        self.headless = headless
+        self._playwright: Playwright | None = None
+        self._browser: Browser | None = None
+        self._cookies: list[dict[str, Any]] | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._start_lock = asyncio.Lock()
+        self._semaphore = asyncio.Semaphore(self.max_pages)
+
+    async def __aenter__(self) -> PlaywrightScraper:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    async def start(self) -> None:
+        """Launch the browser and load the session cookies (idempotent)."""
+        self._bind_loop()
+        async with self._start_lock:
+            if self._browser is not None:
+                return
+            from playwright.async_api import async_playwright
+
+            self._cookies = [_to_playwright_cookie(c) for c in load_session_cookies()]
+            self._playwright = await async_playwright().start()
+            self._browser = await self._playwright.chromium.launch(
+                headless=self.headless,
+                args=["--disable-blink-features=AutomationControlled"],
+            )
+            logger.info(f"Started Playwright Chromium (max {self.max_pages} concurrent pages)")
+
+    async def close(self) -> None:
+        """Close the browser and stop Playwright (idempotent)."""
+        self._bind_loop()
+        async with self._start_lock:
+            browser, self._browser = self._browser, None
+            playwright, self._playwright = self._playwright, None
+            if browser is not None:
+                await browser.close()
+            if playwright is not None:
+                await playwright.stop()
+        # The next use may come from another event loop (e.g. a second asyncio.run).
+        self._loop = None
+        self._start_lock = asyncio.Lock()
+        self._semaphore = asyncio.Semaphore(self.max_pages)
+
+    def _bind_loop(self) -> None:
+        """Tie the lock, semaphore and browser to the running event loop.
+
+        Asyncio primitives and Playwright objects only work on the loop that
+        first used them. When the scraper is reused from a new loop, the
+        primitives are recreated and a browser left over from the old loop –
+        which cannot be closed from here – is dropped and relaunched.
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+        if self._loop is not None:
+            if self._browser is not None:
+                logger.warning("Playwright browser belongs to a finished event loop – relaunching")
+            self._browser = None
+            self._playwright = None
+            self._start_lock = asyncio.Lock()
+            self._semaphore = asyncio.Semaphore(self.max_pages)
+        self._loop = loop
+
+    async def reload_cookies(self) -> None:
+        """Re-read the session file, e.g. after re-authentication."""
+        self._cookies = [_to_playwright_cookie(c) for c in load_session_cookies()]
+
+    # ------------------------------------------------------------------
+    # Scraping API
+    # ------------------------------------------------------------------
+
+    async def search(
+        self,
+        query: str,
+        max_results: int = 50,
+        auto_authenticate: bool = False,
+        on_card: AsyncCardCallback | None = None,
+    ) -> List[dict[str, Any]]:
+        """Async equivalent of :func:`search_linkedin`."""
+        logger.info(f"Searching LinkedIn for: {query} (max {max_results} results)")
+        await asyncio.to_thread(_ensure_session, auto_authenticate, "search_linkedin")
+        search_url = f"https://www.linkedin.com/search/results/people/?keywords={quote(query)}"
+        try:
+            async with self._authenticated_page(search_url, auto_authenticate, "search_linkedin") as page:
+                if not await settle_async(page, "search", PROFILE_CARD, timeout=20):
+                    logger.warning("Results did not appear within timeout. Continuing anyway.")
+
+                profiles: list[dict[str, Any]] = []
+                seen_links: set[str] = set()
+                scrolled = False
+                stopped = False
+                while len(profiles) < max_results and not stopped:
+                    new_cards = await page.evaluate(
+                        _as_function(_COLLECT_CARDS_JS), [PROFILE_CARD, PROFILE_LINK]
+                    ) or []
+                    for card in new_cards:
+                        href = card.get("href")
+                        if not href or href in seen_links:
+                            continue
+                        seen_links.add(href)
+                        profile = _parse_card(href, card.get("text") or "")
+                        if profile is not None:
+                            profiles.append(profile)
+                            if on_card is not None and await on_card(profile) is False:
+                                stopped = True
+                                break
+                        if len(profiles) >= max_results:
+                            break
+                    if stopped or len(profiles) >= max_results or (scrolled and not new_cards):
+                        break
+                    scrolled = True
+                    await settle_async(page, "scroll")
+                await _capture_async("search", search_url, page)
+
+            logger.info(f"Successfully collected {len(profiles)} profiles")
+            return profiles[:max_results]
+
+        except Exception as e:
+            logger.error(f"LinkedIn search failed: {e}")
+            return []
+
+    async def enrich(
+        self,
+        profile_url: str,
+        auto_authenticate: bool = False,
+        cache: bool = True,
+        *,
+        lookup: bool = True,
+    ) -> dict[str, Any]:
+        """Async equivalent of :func:`enrich_profile`."""
+        if cache and lookup:
+            stored = (await asyncio.to_thread(_stored_profiles, [profile_url])).get(profile_url)
+            if stored is not None:
+                logger.info(f"Serving stored profile: {profile_url}")
+                return stored
+        logger.info(f"Enriching profile: {profile_url}")
+        await asyncio.to_thread(_ensure_session, auto_authenticate, "enrich_profile")
+        try:
+            async with self._authenticated_page(profile_url, auto_authenticate, "enrich_profile") as page:
+                if not await settle_async(page, "profile", PROFILE_PANEL):
+                    raise TimeoutError("Profile page did not load within timeout")
+                await _capture_async("profile", profile_url, page)
+                data = await page.evaluate(_as_function(_EXTRACT_PROFILE_JS), [])
+
+            fields = _parse_profile(data if isinstance(data, dict) else {})
+            profile_data = {"linkedin_url": profile_url, **fields}
+            if cache:
+                await asyncio.to_thread(_store_profile, profile_data)
+            logger.info(f"Successfully enriched profile for: {profile_data['name']}")
+            return profile_data
+
+        except Exception as e:
+            logger.error(f"Failed to enrich profile {profile_url}: {e}")
+            return {"linkedin_url": profile_url, "error": str(e)}
+
+    async def enrich_many(
+        self,
+        urls: Sequence[str],
+        concurrency: int | None = None,
+        auto_authenticate: bool = False,
+        cache: bool = True,
+        *,
+        lookup: bool = True,
+    ) -> List[dict[str, Any]]:
+        """Enrich *urls* concurrently (see :func:`enrich_profiles`).
+
+        *lookup* is passed on to :meth:`enrich`; :func:`enrich_profiles_async`
+        has already served the fresh profiles and passes ``False``.
+        """
+        if not urls:
+            return []
+        concurrency = max(1, min(concurrency or self.max_pages, len(urls)))
+        await asyncio.to_thread(_ensure_session, auto_authenticate, "enrich_profiles_async")
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _one(url: str) -> dict[str, Any]:
+            async with semaphore:
+                return await self.enrich(url, auto_authenticate, cache, lookup=lookup)
+
+        start = time.perf_counter()
+        results = await asyncio.gather(*(_one(url) for url in urls))
+        _log_throughput(results, time.perf_counter() - start, concurrency)
+        return list(results)
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    @asynccontextmanager
+    async def _page(self) -> AsyncIterator[Page]:
+        """Open a page in a fresh, cookie-seeded context; dispose of both on exit."""
+        await self.start()
+        assert self._browser is not None
+        async with self._semaphore:
+            context = await self._browser.new_context(viewport={"width": 1920, "height": 1080})
+            try:
+                await route_context(context)
+                await context.add_cookies(self._cookies or [])
+                yield await context.new_page()
+            finally:
+                await context.close()
+
+    @asynccontextmanager
+    async def _authenticated_page(
+        self, url: str, auto_authenticate: bool, caller: str
+    ) -> AsyncIterator[Page]:
+        """Navigate to *url* with the session, re-authenticating once if it has expired."""
+        async with self._page() as page:
+            await page.goto(url)
+            if not await _page_session_lost(page, url):
+                yield page
+                return
+
+        logger.warning("LinkedIn session appears to have expired")
+        if not auto_authenticate:
+            raise ValueError(
+                "LinkedIn session expired. Please re-authenticate:\n"
+                "1. Run: python tests/test_linkedin_auth.py\n"
+                f"2. Or call {caller}() with auto_authenticate=True"
+            )
+        logger.info("Attempting to re-authenticate...")
+        await asyncio.to_thread(authenticate_linkedin)
+        get_driver_pool().invalidate()
+        await self.reload_cookies()
+        async with self._page() as page:
+            await page.goto(url)
+            yield page
+
+
+async def _page_session_lost(page: Page, url: str) -> bool:
+    """Playwright counterpart of :func:`_session_lost`."""
+    monitor = get_session_monitor()
+    signed_out = monitor.assess(url, page.url)
+    if signed_out is None:
+        signed_out = await _page_signed_out(page)
+        monitor.record_probe(signed_out)
+    return signed_out
+
+
+async def _page_signed_out(page: Page) -> bool:
+    """Playwright counterpart of :func:`_is_signed_out`."""
+    try:
+        if is_auth_redirect(page.url):
+            return True
+        return bool(await page.evaluate(_SIGNED_OUT_JS))
+    except Exception as e:
+        logger.debug(f"Error checking sign-out status: {e}")
+        return False
+
+
+_PLAYWRIGHT_SCRAPER: PlaywrightScraper | None = None
+
+
+def get_playwright_scraper() -> PlaywrightScraper:
+    """Return the process-wide :class:`PlaywrightScraper`, creating it on first use."""
+    global _PLAYWRIGHT_SCRAPER
+    if _PLAYWRIGHT_SCRAPER is None:
+        _PLAYWRIGHT_SCRAPER = PlaywrightScraper()
+    return _PLAYWRIGHT_SCRAPER
+
+
+async def close_playwright_scraper() -> None:
+    """Stop the shared Playwright browser, if one was started."""
+    global _PLAYWRIGHT_SCRAPER
+    scraper, _PLAYWRIGHT_SCRAPER = _PLAYWRIGHT_SCRAPER, None
+    if scraper is not None:
+        await scraper.close()
@@ -0,0 +1,295 @@
+"""Cache of LinkedIn search results keyed on the canonical boolean query.
+
+Job descriptions from one role family tend to produce the same search, often
+spelled differently – operands in another order, other casing, redundant
+parentheses. :func:`canonical_query` parses LinkedIn's boolean syntax (quoted
+phrases, ``AND``/``OR``/``NOT``, parentheses, implicit ``AND``) and prints it
+back in one normal form, and :class:`SearchCache` stores the ordered result
+cards of each ``(canonical query, result count)`` pair.
+
+Entries younger than ``SEARCH_CACHE_TTL_HOURS`` (default: 24) are served as
+is. Older ones, up to ``SEARCH_CACHE_STALE_HOURS`` (default: 168), are still
+served immediately while a background thread re-runs the search and replaces
+them (stale-while-revalidate); past that they are misses. At most
+``SEARCH_CACHE_MAX_REFRESHES`` (default: 2) refreshes run at once; further
+stale hits are served without one. :func:`sourceress.workflows.shutdown` waits
+up to ``SEARCH_CACHE_REFRESH_WAIT_S`` (default: 30) for running refreshes
+before the browsers close. The cache lives in ``search_cache.sqlite`` under
+``SOURCERESS_CACHE_DIR``, holds at most ``SEARCH_CACHE_MAX_ENTRIES``
+(default: 2000) searches, and ``SEARCH_CACHE=0`` turns it off.
+
+Usage
+-----
+>>> canonical_query('("Django" OR python) AND "Senior  Engineer"')
+'"senior engineer" AND ("django" OR python)'
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+from loguru import logger
+
+from .cache import SQLiteCache, default_cache_dir, make_key
+
+__all__ = ["CachedSearch", "SearchCache", "canonical_query", "get_search_cache"]
+
+SEARCH_CACHE_ENABLED = os.getenv("SEARCH_CACHE", "1").lower() not in {"0", "false", "no", "off"}
+SEARCH_CACHE_TTL = float(os.getenv("SEARCH_CACHE_TTL_HOURS", "24")) * 3600
+SEARCH_CACHE_MAX_STALE = float(os.getenv("SEARCH_CACHE_STALE_HOURS", "168")) * 3600
+SEARCH_CACHE_MAX_ENTRIES = int(os.getenv("SEARCH_CACHE_MAX_ENTRIES", "2000"))
+SEARCH_CACHE_MAX_REFRESHES = int(os.getenv("SEARCH_CACHE_MAX_REFRESHES", "2"))
+SEARCH_CACHE_REFRESH_WAIT = float(os.getenv("SEARCH_CACHE_REFRESH_WAIT_S", "30"))
+
+# -----------------------------------------------------------------------------
+# Query normalisation
+# -----------------------------------------------------------------------------
+
+_QUERY_TOKEN = re.compile(r'"[^"]*"|\(|\)|[^\s()"]+')
+_OPERATORS = {"AND", "OR", "NOT"}
+
+
+class _ParseError(ValueError):
+    pass
+
+
+class _Parser:
+    """Recursive-descent parser for LinkedIn boolean search strings.
+
+    Precedence follows LinkedIn: ``NOT`` binds tightest, then ``AND``
+    (explicit or implied by juxtaposition), then ``OR``. Nodes are tuples
+    ``(op, children)`` or plain term strings.
+    """
+
+    def __init__(self, query: str) -> None:
+        self.tokens = _QUERY_TOKEN.findall(query)
+        self.pos = 0
+
+    def parse(self) -> Any:
+        node = self._or()
+        if self.pos != len(self.tokens):
+            raise _ParseError(f"unexpected {self.tokens[self.pos]!r}")
+        return node
+
+    def _peek(self) -> str | None:
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else None
+
+    def _or(self) -> Any:
+        children = [self._and()]
+        while self._peek() == "OR":
+            self.pos += 1
+            children.append(self._and())
+        return ("OR", children) if len(children) > 1 else children[0]
+
+    def _and(self) -> Any:
+        children = [self._not()]
+        while (token := self._peek()) is not None and token not in {"OR", ")"}:
+            if token == "AND":
+                self.pos += 1
+            children.append(self._not())
+        return ("AND", children) if len(children) > 1 else children[0]
+
+    def _not(self) -> Any:
+        if self._peek() == "NOT":
+            self.pos += 1
+            return ("NOT", [self._not()])
+        return self._primary()
+
+    def _primary(self) -> Any:
+        token = self._peek()
+        if token is None or token in _OPERATORS or token == ")":
+            raise _ParseError(f"expected a term, got {token!r}")
+        self.pos += 1
+        if token == "(":
+            node = self._or()
+            if self._peek() != ")":
+                raise _ParseError("unbalanced parenthesis")
+            self.pos += 1
+            return node
+        if token.startswith('"'):
+            return '"' + " ".join(token[1:-1].lower().split()) + '"'
+        return token.lower()
+
+
+def _render(node: Any, parent: str | None = None) -> str:
+    if isinstance(node, str):
+        return node
+    op, children = node
+    if op == "NOT":
+        return f"NOT {_render(children[0], op)}"
+    # Flatten nested groups of the same operator, then order and de-duplicate.
+    flat: list[Any] = []
+    for child in children:
+        flat.extend(child[1] if isinstance(child, tuple) and child[0] == op else [child])
+    parts = sorted({_render(child, op) for child in flat})
+    if len(parts) == 1:
+        return parts[0]
+    text = f" {op} ".join(parts)
+    return f"({text})" if parent is not None else text
+
+
+def canonical_query(query: str) -> str:
+    """Return one normal form for equivalent LinkedIn boolean queries.
+
+    Terms are lower-cased and whitespace-collapsed, operands of ``AND`` and
+    ``OR`` sorted and de-duplicated, and only the parentheses precedence
+    needs are kept. Queries that do not parse are only case- and
+    whitespace-normalised.
+    """
+    try:
+        return _render(_Parser(query).parse())
+    except _ParseError:
+        return " ".join(query.lower().split())
+
+
+# -----------------------------------------------------------------------------
+# Result cache
+# -----------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class CachedSearch:
+    """Result cards of one cached search, in search order, and their age in seconds."""
+
+    cards: list[dict[str, Any]]
+    age: float
+    stale: bool
+
+
+class SearchCache:
+    """Stale-while-revalidate store for search result cards.
+
+    Args:
+        path: SQLite file; parent directories are created on first use.
+        ttl: Seconds an entry is served without revalidation.
+        max_stale: Seconds an entry is served at all (with a background refresh).
+        max_entries: Maximum number of searches kept (least recently used go first).
+        max_refreshes: Background refreshes allowed to run at once.
+
+    ``hits``, ``stale_hits`` and ``misses`` count :meth:`lookup` outcomes.
+    """
+
+    def __init__(
+        self,
+        path: Path | str,
+        *,
+        ttl: float = SEARCH_CACHE_TTL,
+        max_stale: float = SEARCH_CACHE_MAX_STALE,
+        max_entries: int | None = SEARCH_CACHE_MAX_ENTRIES,
+        max_refreshes: int = SEARCH_CACHE_MAX_REFRESHES,
+    ) -> None:
+        self.ttl = ttl
+        self.max_stale = max(ttl, max_stale)
+        self.max_refreshes = max(0, max_refreshes)
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self._cache = SQLiteCache(path, ttl=self.max_stale, max_entries=max_entries)
+        self._refreshing: dict[str, threading.Thread] = {}
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def key(query: str, limit: int) -> str:
+        """Cache key for *limit* results of *query* (any spelling of it)."""
+        return make_key("linkedin-search", canonical_query(query), limit)
+
+    def lookup(self, query: str, limit: int) -> CachedSearch | None:
+        """Return the cached cards for *query*, or ``None`` if missing or too old."""
+        entry = self._cache.get_entry(self.key(query, limit))
+        if entry is None or entry.age > self.max_stale:
+            self.misses += 1
+            return None
+        stale = entry.age > self.ttl
+        if stale:
+            self.stale_hits += 1
+        else:
+            self.hits += 1
+        return CachedSearch(cards=entry.value["cards"], age=entry.age, stale=stale)
+
+    def store(self, query: str, limit: int, cards: list[dict[str, Any]]) -> None:
+        """Record the ordered result *cards* of *query*. Empty results are not cached."""
+        if not cards:
+            return
+        self._cache.set(
+            self.key(query, limit),
+            {"query": query, "urls": [card.get("linkedin_url") for card in cards], "cards": cards},
+        )
+
+    def revalidate(self, query: str, limit: int, search: Callable[[], list[dict[str, Any]]]) -> bool:
+        """Re-run *search* in a background thread and store its result.
+
+        At most one refresh per key, and ``max_refreshes`` in total, run at a
+        time; returns False if none was started.
+        """
+        key = self.key(query, limit)
+
+        def _refresh() -> None:
+            try:
+                self.store(query, limit, search())
+                logger.debug(f"Revalidated cached search: {query}")
+            except Exception as e:  # noqa: BLE001
+                logger.warning(f"Background search refresh failed: {e}")
+            finally:
+                with self._lock:
+                    self._refreshing.pop(key, None)
+
+        with self._lock:
+            if key in self._refreshing or len(self._refreshing) >= self.max_refreshes:
+                return False
+            thread = threading.Thread(target=_refresh, name="search-revalidate", daemon=True)
+            self._refreshing[key] = thread
+        thread.start()
+        return True
+
+    def wait(self, timeout: float | None = None) -> int:
+        """Wait up to *timeout* seconds for running refreshes; return how many are still running."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            threads = list(self._refreshing.values())
+        for thread in threads:
+            thread.join(None if deadline is None else max(0.0, deadline - time.monotonic()))
+        with self._lock:
+            return len(self._refreshing)
+
+    def clear(self) -> None:
+        """Remove every entry and reset the counters."""
+        self._cache.clear()
+        self.hits = self.stale_hits = self.misses = 0
+
+    def stats(self) -> dict[str, int]:
+        """Return lookup counters plus the number of cached searches."""
+        return {
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "entries": len(self._cache),
+        }
+
+    def close(self) -> None:
+        """Close the underlying connection (reopened on next use)."""
+        self._cache.close()
+
+
+_SEARCH_CACHE: SearchCache | None = None
+_SEARCH_CACHE_LOCK = threading.Lock()
+
+
+def get_search_cache() -> SearchCache | None:
+    """Return the process-wide cache, or ``None`` when ``SEARCH_CACHE=0``."""
+    global _SEARCH_CACHE
+    if not SEARCH_CACHE_ENABLED:
+        return None
+    with _SEARCH_CACHE_LOCK:
+        if _SEARCH_CACHE is None:
+            _SEARCH_CACHE = SearchCache(default_cache_dir() / "search_cache.sqlite")
+        return _SEARCH_CACHE
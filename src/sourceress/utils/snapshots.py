@@ -0,0 +1,288 @@
+"""Offline HTML snapshots of LinkedIn pages and a browser-free parser for them.
+
+Capture
+-------
+Set ``SCRAPER_SNAPSHOT_DIR`` and the scrapers save the HTML of every search
+result page and profile they read, gzip-compressed, under
+``<dir>/<kind>/<timestamp>-<hash>.html.gz`` (``kind`` is ``search`` or
+``profile``). The first line of each file is an HTML comment carrying the
+page URL and capture time.
+
+Replay
+------
+:func:`parse_search_html` and :func:`parse_profile_html` extract the same
+dicts as :func:`~.scraping.search_linkedin` / :func:`~.scraping.enrich_profile`
+from saved HTML using ``lxml`` (``pip install sourceress[snapshots]``). The
+card and field heuristics are shared with the live scraper, so a snapshot
+corpus doubles as a regression fixture. :func:`parse_snapshots` fans a
+directory out over a process pool for backfills and benchmarks.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterator, Literal, Sequence
+from urllib.parse import urljoin
+
+from loguru import logger
+
+if TYPE_CHECKING:
+    from lxml.etree import XPath, _Element
+
+__all__ = [
+    "Snapshot",
+    "SNAPSHOT_DIR",
+    "iter_snapshots",
+    "load_snapshot",
+    "parse_profile_html",
+    "parse_search_html",
+    "parse_snapshot",
+    "parse_snapshots",
+    "save_snapshot",
+]
+
+#: Directory snapshots are written to; capture is off when unset.
+SNAPSHOT_DIR = os.getenv("SCRAPER_SNAPSHOT_DIR") or None
+
+#: Worker processes used by :func:`parse_snapshots` (default: CPU count).
+PARSE_WORKERS = int(os.getenv("SNAPSHOT_PARSE_WORKERS", "0")) or os.cpu_count() or 1
+
+SnapshotKind = Literal["search", "profile"]
+
+_HEADER_PREFIX = "<!-- sourceress-snapshot "
+_HEADER_SUFFIX = " -->"
+_BASE_URL = "https://www.linkedin.com"
+
+# XPath equivalents of the selectors used by ``_COLLECT_CARDS_JS`` and
+# ``_EXTRACT_PROFILE_JS`` in :mod:`.scraping`.
+_CARD_XPATH = "//*[@data-chameleon-result-urn]"
+_CARD_LINK_XPATH = ".//a[contains(@href, '/in/')]"
+
+
+def _class_xpath(tag: str, *classes: str, root: str = "//") -> str:
+    tests = "".join(
+        f"[contains(concat(' ', normalize-space(@class), ' '), ' {cls} ')]" for cls in classes
+    )
+    return f"{root}{tag}{tests}"
+
+
+_PROFILE_XPATHS = {
+    "name": _class_xpath("h1", "text-heading-xlarge"),
+    "title": _class_xpath("div", "text-body-medium"),
+    "location": _class_xpath("span", "text-body-small", "inline"),
+    "summary": _class_xpath("div", "pv-shared-text-with-see-more"),
+}
+_SKILL_XPATH = _class_xpath("span", "pv-skill-category-entity__name")
+_EXPERIENCE_XPATH = _class_xpath("div", "pv-entity__summary-info")
+_EXPERIENCE_COMPANY_XPATH = _class_xpath("p", "pv-entity__secondary-title", root=".//")
+
+# Elements that start a new line in ``innerText``.
+_BLOCK_TAGS = frozenset(
+    {
+        "address", "article", "aside", "blockquote", "dd", "div", "dl", "dt",
+        "figcaption", "figure", "footer", "form", "h1", "h2", "h3", "h4", "h5",
+        "h6", "header", "hr", "li", "main", "nav", "ol", "p", "pre", "section",
+        "table", "tr", "ul",
+    }
+)
+_SKIP_TAGS = frozenset({"script", "style", "template", "noscript"})
+
+
+# ---------------------------------------------------------------------------
+# Capture
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """A saved page: its kind, URL, capture time (epoch seconds) and HTML."""
+
+    kind: str
+    url: str
+    captured_at: float
+    html: str
+
+
+def save_snapshot(
+    kind: SnapshotKind, url: str, html: str, directory: Path | str | None = None
+) -> Path:
+    """Gzip *html* to ``<directory>/<kind>/`` and return the file path.
+
+    Args:
+        kind: ``"search"`` or ``"profile"``.
+        url: Page URL, stored in the file header.
+        html: Full page source.
+        directory: Snapshot root (default: ``SCRAPER_SNAPSHOT_DIR``).
+    """
+    root = Path(directory or SNAPSHOT_DIR or "snapshots")
+    captured_at = time.time()
+    digest = hashlib.sha256(url.encode("utf-8")).hexdigest()[:12]
+    stamp = time.strftime("%Y%m%dT%H%M%S", time.gmtime(captured_at))
+    path = root / kind / f"{stamp}-{digest}.html.gz"
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    meta = json.dumps({"kind": kind, "url": url, "captured_at": captured_at})
+    with gzip.open(path, "wt", encoding="utf-8", compresslevel=6) as fh:
+        fh.write(f"{_HEADER_PREFIX}{meta}{_HEADER_SUFFIX}\n")
+        fh.write(html)
+    logger.debug(f"Saved {kind} snapshot of {url} to {path}")
+    return path
+
+
+def load_snapshot(path: Path | str) -> Snapshot:
+    """Read a snapshot written by :func:`save_snapshot`."""
+    with gzip.open(path, "rt", encoding="utf-8") as fh:
+        header, _, html = fh.read().partition("\n")
+    if not (header.startswith(_HEADER_PREFIX) and header.endswith(_HEADER_SUFFIX)):
+        raise ValueError(f"{path} is not a sourceress snapshot")
+    meta = json.loads(header[len(_HEADER_PREFIX) : -len(_HEADER_SUFFIX)])
+    return Snapshot(kind=meta["kind"], url=meta["url"], captured_at=meta["captured_at"], html=html)
+
+
+def iter_snapshots(directory: Path | str, kind: SnapshotKind | None = None) -> Iterator[Path]:
+    """Yield snapshot files under *directory* (optionally one *kind*) in name order."""
+    root = Path(directory)
+    pattern = f"{kind}/*.html.gz" if kind else "*/*.html.gz"
+    yield from sorted(root.glob(pattern))
+
+
+# ---------------------------------------------------------------------------
+# Parsing
+# ---------------------------------------------------------------------------
+
+
+def _inner_text(element: _Element) -> str:
+    """Approximate the browser's ``innerText``: one line per block, whitespace collapsed."""
+
+    parts: list[str] = []
+
+    def _walk(el: _Element) -> None:
+        tag = el.tag.lower() if isinstance(el.tag, str) else None
+        if tag is not None and tag not in _SKIP_TAGS and el.get("hidden") is None:
+            block = tag in _BLOCK_TAGS
+            if block or tag == "br":
+                parts.append("\n")
+            if el.text:
+                parts.append(el.text)
+            for child in el:
+                _walk(child)
+                if child.tail:
+                    parts.append(child.tail)
+            if block:
+                parts.append("\n")
+
+    _walk(element)
+    lines = (" ".join(line.split()) for line in "".join(parts).split("\n"))
+    return "\n".join(line for line in lines if line)
+
+
+# Plain ``etree`` elements (no ``lxml.html`` class lookup) and precompiled
+# XPath expressions keep the per-page cost low.
+@lru_cache(maxsize=1)
+def _html_parser() -> Any:
+    from lxml import etree
+
+    return etree.HTMLParser(remove_comments=True)
+
+
+@lru_cache(maxsize=None)
+def _xpath(expression: str) -> XPath:
+    from lxml import etree
+
+    return etree.XPath(expression)
+
+
+def _document(html: str) -> _Element:
+    from lxml import etree
+
+    return etree.fromstring(html or "<html></html>", _html_parser())
+
+
+def parse_search_html(html: str, base_url: str = _BASE_URL) -> list[dict[str, Any]]:
+    """Extract the profile dicts :func:`~.scraping.search_linkedin` would return.
+
+    Cards without a usable name are skipped and repeated profile links are
+    kept once, as in the live scraper.
+    """
+    from .scraping import _parse_card
+
+    profiles: list[dict[str, Any]] = []
+    seen_links: set[str] = set()
+    card_links = _xpath(_CARD_LINK_XPATH)
+    for card in _xpath(_CARD_XPATH)(_document(html)):
+        links = card_links(card)
+        if not links:
+            continue
+        href = urljoin(base_url, links[0].get("href", ""))
+        if href in seen_links:
+            continue
+        seen_links.add(href)
+        profile = _parse_card(href, _inner_text(card))
+        if profile is not None:
+            profiles.append(profile)
+    return profiles
+
+
+def parse_profile_html(html: str, url: str) -> dict[str, Any]:
+    """Extract the dict :func:`~.scraping.enrich_profile` would return for *url*."""
+    from .scraping import _parse_profile
+
+    doc = _document(html)
+
+    def _first_text(xpath: str, root: _Element = doc) -> str | None:
+        found = _xpath(xpath)(root)
+        return _inner_text(found[0]).strip() if found else None
+
+    data: dict[str, Any] = {field: _first_text(xpath) for field, xpath in _PROFILE_XPATHS.items()}
+    data["skills"] = [_inner_text(el).strip() for el in _xpath(_SKILL_XPATH)(doc)[:10]]
+    experience = []
+    for el in _xpath(_EXPERIENCE_XPATH)(doc)[:5]:
+        title = _first_text(".//h3", el)
+        company = _first_text(_EXPERIENCE_COMPANY_XPATH, el)
+        if title is not None and company is not None:
+            experience.append({"title": title, "company": company})
+    data["experience"] = experience
+    return {"linkedin_url": url, **_parse_profile(data)}
+
+
+def parse_snapshot(path: Path | str) -> dict[str, Any]:
+    """Parse one snapshot file.
+
+    Returns:
+        ``{"path", "kind", "url", "data"}`` where ``data`` is a list of
+        profile dicts for search pages and a single profile dict otherwise.
+    """
+    snapshot = load_snapshot(path)
+    if snapshot.kind == "search":
+        data: Any = parse_search_html(snapshot.html)
+    else:
+        data = parse_profile_html(snapshot.html, snapshot.url)
+    return {"path": str(path), "kind": snapshot.kind, "url": snapshot.url, "data": data}
+
+
+def parse_snapshots(
+    paths: Sequence[Path | str], workers: int | None = None, chunksize: int = 32
+) -> list[dict[str, Any]]:
+    """Parse many snapshots, in input order, across a process pool.
+
+    Args:
+        paths: Snapshot files (see :func:`iter_snapshots`).
+        workers: Worker processes (default: ``SNAPSHOT_PARSE_WORKERS`` or the
+            CPU count); ``1`` parses in the calling process.
+        chunksize: Files handed to a worker per task.
+    """
+    if not paths:
+        return []
+    workers = max(1, min(workers or PARSE_WORKERS, len(paths)))
+    if workers == 1:
+        return [parse_snapshot(path) for path in paths]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(parse_snapshot, paths, chunksize=chunksize))
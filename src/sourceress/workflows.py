@@ -4,6 +4,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import Any
 
 from crewai import Crew
@@ -16,6 +17,7 @@ from sourceress.agents import (
     ExcelWriter,
 )
 from sourceress.tasks import create_all_tasks
+from sourceress.utils import linkedin_auth, llm, pacing, scraping, search_cache
 from sourceress.utils.logging import logger
 
 
@@ -104,5 +106,53 @@ async def run_end_to_end(jd_text: str, **kwargs: Any) -> str:
     Returns:
         Path to the generated Excel artefact.
     """
-    # TODO: Switch to run_end_to_end_crewai once Task 10 is complete
-    return await run_end_to_end_manual(jd_text, **kwargs) 
\ No newline at end of file
+    try:
+        # TODO: Switch to run_end_to_end_crewai once Task 10 is complete
+        return await run_end_to_end_manual(jd_text, **kwargs)
+    finally:
+        await shutdown()
+
+
+async def shutdown() -> None:
+    """Release process-wide resources (pooled HTTP sessions, browsers, …).
+
+    Also writes the LLM call metrics to ``LLM_METRICS_PATH`` when it is set and
+    logs the LLM usage and scrape wait summaries.
+    """
+
+    await llm.aclose()
+    searches = search_cache.get_search_cache()
+    if searches is not None:
+        # Background refreshes still hold a browser; let them finish first.
+        running = await asyncio.to_thread(searches.wait, search_cache.SEARCH_CACHE_REFRESH_WAIT)
+        if running:
+            logger.warning(f"Abandoning {running} search cache refreshes still running at shutdown")
+    await asyncio.to_thread(linkedin_auth.close_driver_pool)
+    await scraping.close_playwright_scraper()
+    if llm.LLM_METRICS_PATH:
+        path = llm.export_metrics(llm.LLM_METRICS_PATH)
+        logger.info(f"LLM metrics written to {path}")
+    for agent, stats in llm.get_metrics().summary().items():
+        logger.info(
+            f"LLM usage [{agent}]: {stats['calls']} calls, "
+            f"{stats['prompt_tokens']}+{stats['completion_tokens']} tokens, "
+            f"mean latency {stats['latency_mean']:.2f}s, "
+            f"queue wait {stats['queue_wait_total']:.2f}s"
+        )
+    for kind, stats in pacing.get_scrape_metrics().summary().items():
+        logger.info(
+            f"Scrape waits [{kind}]: {stats['pages']} pages, "
+            f"ready {stats['ready_wait_total']:.1f}s + paced {stats['paced_total']:.1f}s, "
+            f"saved {stats['time_saved']:.1f}s vs fixed sleeps ({stats['timeouts']} timeouts)"
+        )
+    checks = linkedin_auth.get_session_monitor().stats()
+    if checks["probes"] or checks["skipped"]:
+        logger.info(
+            f"Session checks: {checks['probes']} DOM probes, "
+            f"{checks['skipped']} navigations settled from URL and cookie expiry"
+        )
+    if searches is not None and (searches.hits or searches.stale_hits or searches.misses):
+        logger.info(
+            f"Search cache: {searches.hits} fresh hits, {searches.stale_hits} stale hits "
+            f"(refreshed in background), {searches.misses} misses"
+        ) 
\ No newline at end of file
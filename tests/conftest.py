@@ -0,0 +1,105 @@
+"""Shared pytest fixtures."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from typing import Iterator
+
+import pytest
+
+from sourceress.utils import identity, llm, profile_store, search_cache
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache_dir(tmp_path, monkeypatch):
+    """Point ``SOURCERESS_CACHE_DIR`` at a per-test directory with fresh stores.
+
+    The persistent stores are process-wide singletons opened under the cache
+    directory on first use; resetting them keeps one test's profiles, merged
+    identities and cached searches out of the next.
+    """
+    monkeypatch.setenv("SOURCERESS_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(profile_store, "_STORE", None)
+    monkeypatch.setattr(identity, "_INDEX", None)
+    monkeypatch.setattr(search_cache, "_SEARCH_CACHE", None)
+    llm.reset_response_cache()
+    yield
+    for store in (profile_store._STORE, identity._INDEX, search_cache._SEARCH_CACHE):
+        if store is not None:
+            store.close()
+    llm.reset_response_cache()
+
+
+class Concurrency:
+    """Records how many calls of a threaded fake overlap."""
+
+    def __init__(self) -> None:
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def track(self, position: int) -> Iterator[None]:
+        """Count one call to item *position*; later items sleep less and finish first."""
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            time.sleep(0.05 - (position % 5) * 0.008)
+            yield
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+@pytest.fixture
+def concurrency() -> Concurrency:
+    """A fresh :class:`Concurrency` probe for fakes that should run in parallel."""
+    return Concurrency()
+
+
+class FakeSearch:
+    """Stands in for ``search_linkedin_async``, emitting cards through ``on_card``.
+
+    Args:
+        results: Cards (or profile slugs) per query; a plain list serves every query.
+        delay: Seconds to sleep between cards.
+    """
+
+    def __init__(self, results: dict[str, list] | list, delay: float = 0.0) -> None:
+        self.results = results
+        self.delay = delay
+        self.emitted: Counter[str] = Counter()
+
+    @staticmethod
+    def card(slug: str) -> dict:
+        """A search-result card for ``/in/<slug>``, named after the slug."""
+        return {
+            "name": slug.replace("-", " ").title(),
+            "linkedin_url": f"https://www.linkedin.com/in/{slug}?trk=search",
+            "title": "Dev",
+        }
+
+    @property
+    def total(self) -> int:
+        """Cards emitted across all queries."""
+        return sum(self.emitted.values())
+
+    async def __call__(self, query, max_results=50, auto_authenticate=False, on_card=None):
+        cards = self.results if isinstance(self.results, list) else self.results[query]
+        for card in cards[:max_results]:
+            self.emitted[query] += 1
+            if await on_card(card if isinstance(card, dict) else self.card(card)) is False:
+                break
+            await asyncio.sleep(self.delay)
+        return []
+
+
+@pytest.fixture
+def fake_search() -> type[FakeSearch]:
+    """The :class:`FakeSearch` factory."""
+    return FakeSearch
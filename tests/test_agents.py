@@ -182,7 +182,7 @@ class TestLinkedInSourcer:
             )
         ]
         
-        with patch("sourceress.agents.linkedin_sourcer.fetch_profiles") as mock_fetch:
+        with patch("sourceress.agents.linkedin_sourcer.fetch_profiles_async") as mock_fetch:
             mock_fetch.return_value = sample_candidates
             
             result = await agent.run(sample_job_description)
@@ -221,7 +221,7 @@ class TestLinkedInSourcer:
             )
         ]
         
-        with patch("sourceress.agents.linkedin_sourcer.fetch_profiles") as mock_fetch:
+        with patch("sourceress.agents.linkedin_sourcer.fetch_profiles_async") as mock_fetch:
             mock_fetch.return_value = duplicate_candidates
             
             result = await agent.run(sample_job_description)
@@ -235,7 +235,7 @@ class TestLinkedInSourcer:
         """Test graceful handling when LinkedIn API fails."""
         agent = LinkedInSourcer()
         
-        with patch("sourceress.agents.linkedin_sourcer.fetch_profiles") as mock_fetch:
+        with patch("sourceress.agents.linkedin_sourcer.fetch_profiles_async") as mock_fetch:
             mock_fetch.side_effect = Exception("LinkedIn API unavailable")
             
             result = await agent.run(sample_job_description)
@@ -453,7 +453,7 @@ class TestIntegration:
             )
         ]
         
-        with patch("sourceress.agents.linkedin_sourcer.fetch_profiles") as mock_fetch:
+        with patch("sourceress.agents.linkedin_sourcer.fetch_profiles_async") as mock_fetch:
             mock_fetch.return_value = sample_candidates
             
             sourcing_result = await sourcer_agent.run(job_description)
@@ -487,7 +487,7 @@ class TestIntegration:
         
         # Test LinkedIn Sourcer with API failure
         sourcer_agent = LinkedInSourcer()
-        with patch("sourceress.agents.linkedin_sourcer.fetch_profiles") as mock_fetch:
+        with patch("sourceress.agents.linkedin_sourcer.fetch_profiles_async") as mock_fetch:
             mock_fetch.side_effect = Exception("LinkedIn API rate limited")
             
             sourcing_result = await sourcer_agent.run(jd_result.job_description)
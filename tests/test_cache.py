@@ -0,0 +1,77 @@
+"""Unit tests for :mod:`sourceress.utils.cache`."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import patch
+
+from sourceress.utils.cache import SQLiteCache, make_key
+
+
+class TestSQLiteCache:
+    """Test suite for the SQLite-backed key/value cache."""
+
+    def test_roundtrip_and_counters(self, tmp_path: Path) -> None:
+        """Values round-trip through JSON and lookups are counted."""
+        cache = SQLiteCache(tmp_path / "cache.sqlite")
+
+        assert cache.get("missing") is None
+        cache.set("key", {"reply": "hello", "tokens": [1, 2]})
+        assert cache.get("key") == {"reply": "hello", "tokens": [1, 2]}
+
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["entries"] == 1
+
+    def test_persists_across_instances(self, tmp_path: Path) -> None:
+        """A new cache object on the same file sees earlier writes."""
+        SQLiteCache(tmp_path / "cache.sqlite").set("key", "value")
+        assert SQLiteCache(tmp_path / "cache.sqlite").get("key") == "value"
+
+    def test_ttl_expiry(self, tmp_path: Path) -> None:
+        """Entries older than the TTL are treated as misses."""
+        cache = SQLiteCache(tmp_path / "cache.sqlite", ttl=60)
+
+        with patch("sourceress.utils.cache.time.time", return_value=1_000.0):
+            cache.set("key", "value")
+        with patch("sourceress.utils.cache.time.time", return_value=1_030.0):
+            assert cache.get("key") == "value"
+        with patch("sourceress.utils.cache.time.time", return_value=1_100.0):
+            assert cache.get("key") is None
+            entry = cache.get_entry("key")
+
+        assert entry is not None
+        assert entry.age == 100.0
+
+    def test_max_entries_evicts_least_recently_used(self, tmp_path: Path) -> None:
+        """Only the most recently used entries survive the entry cap."""
+        cache = SQLiteCache(tmp_path / "cache.sqlite", max_entries=2)
+
+        for i, key in enumerate(["a", "b", "c"]):
+            with patch("sourceress.utils.cache.time.time", return_value=float(i)):
+                if key == "c":
+                    cache.get("a")  # refresh "a" before inserting "c"
+                cache.set(key, key)
+
+        assert cache.get("a") == "a"
+        assert cache.get("b") is None
+        assert cache.get("c") == "c"
+
+    def test_max_bytes_evicts_oldest(self, tmp_path: Path) -> None:
+        """Total serialised size is kept under the byte budget."""
+        cache = SQLiteCache(tmp_path / "cache.sqlite", max_bytes=25)
+
+        for i in range(3):
+            with patch("sourceress.utils.cache.time.time", return_value=float(i)):
+                cache.set(f"key-{i}", "x" * 8)  # 10 bytes once JSON-encoded
+
+        assert len(cache) == 2
+        assert cache.get("key-0") is None
+        assert cache.stats()["bytes"] <= 25
+
+
+def test_make_key_is_order_insensitive_for_mappings() -> None:
+    """Keys only depend on content, not on dict ordering."""
+    assert make_key("chat", {"a": 1, "b": 2}) == make_key("chat", {"b": 2, "a": 1})
+    assert make_key("chat", {"a": 1}) != make_key("chat", {"a": 2})
@@ -0,0 +1,134 @@
+"""Unit tests for search-card and profile-page extraction in :mod:`sourceress.utils.scraping`."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from sourceress.utils import scraping
+from sourceress.utils.scraping import _parse_card, _parse_profile
+
+CARD_TEXT = """Jane Doe
+View Jane Doe's profile
+• 2nd degree connection
+Senior Data Engineer @ Acme
+Greater London Area
+Connect"""
+
+
+class TestParseCard:
+    """Test suite for :func:`_parse_card`."""
+
+    def test_extracts_fields(self) -> None:
+        """Name, title and location are picked from the card's text lines."""
+        profile = _parse_card("https://www.linkedin.com/in/jane?miniProfile=1", CARD_TEXT)
+
+        assert profile == {
+            "name": "Jane Doe",
+            "linkedin_url": "https://www.linkedin.com/in/jane",
+            "title": "Senior Data Engineer @ Acme",
+            "location": "Greater London Area",
+            "summary": "",
+            "skills": [],
+        }
+
+    def test_strips_current_prefix(self) -> None:
+        """``Current:`` prefixes are removed from titles."""
+        profile = _parse_card("https://x/in/a", "Ann Lee\nCurrent: Lead Designer at Studio")
+        assert profile["title"] == "Lead Designer at Studio"
+
+    def test_titles_and_places_beyond_the_old_keyword_lists(self) -> None:
+        """Acronym titles and places outside London/New York/San Francisco are recognised."""
+        profile = _parse_card("https://x/in/a", "Kai Berg\nCTO at Acme\nMunich, Bavaria, Germany")
+        assert (profile["title"], profile["location"]) == ("CTO at Acme", "Munich, Bavaria, Germany")
+
+    @pytest.mark.parametrize("text", ["", "Only one line", "V\nEngineer"])
+    def test_unusable_cards_are_skipped(self, text: str) -> None:
+        """Cards without a name line and at least one more line yield ``None``."""
+        assert _parse_card("https://x/in/a", text) is None
+
+
+class TestParseProfile:
+    """Test suite for :func:`_parse_profile`."""
+
+    def test_defaults_for_missing_fields(self) -> None:
+        """Fields absent from the page fall back to the historical defaults."""
+        assert _parse_profile({"name": None, "skills": None}) == {
+            "name": "Unknown",
+            "title": "Unknown",
+            "location": "Unknown",
+            "summary": "",
+            "skills": [],
+            "experience": [],
+        }
+
+    def test_passes_through_found_fields(self) -> None:
+        data = {
+            "name": "Jane Doe",
+            "title": "Engineer",
+            "location": "London",
+            "summary": "Builds things",
+            "skills": ["python"],
+            "experience": [{"title": "Engineer", "company": "Acme"}],
+        }
+        assert _parse_profile(data) == data
+
+
+def test_search_uses_one_script_call_per_scroll_step() -> None:
+    """Cards arrive in batches from a single script call; the loop ends on an empty batch."""
+    batches = [
+        [
+            {"href": "https://www.linkedin.com/in/a", "text": "Ann\nEngineer"},
+            {"href": None, "text": "Ad"},
+        ],
+        [
+            {"href": "https://www.linkedin.com/in/b", "text": "Bob\nDesigner"},
+            {"href": "https://www.linkedin.com/in/a", "text": "Ann\nEngineer"},
+        ],
+        [],
+    ]
+    driver = MagicMock(window_handles=["main"])
+    driver.find_elements.return_value = [object()]
+    driver.execute_script.side_effect = batches
+    pool = MagicMock()
+    pool.checkout.return_value = driver
+
+    with patch.object(scraping, "get_driver_pool", return_value=pool), patch.object(
+        scraping, "is_linkedin_authenticated", return_value=True
+    ), patch.object(scraping, "_is_signed_out", return_value=False), patch.object(
+        scraping.time, "sleep"
+    ):
+        profiles = scraping.search_linkedin("engineer", max_results=10)
+
+    assert [profile["name"] for profile in profiles] == ["Ann", "Bob"]
+    assert driver.execute_script.call_count == 3
+    assert all(
+        call.args[0] == scraping._COLLECT_CARDS_JS for call in driver.execute_script.call_args_list
+    )
+    pool.checkin.assert_called_once_with(driver)
+
+
+def test_search_reports_cards_and_stops_when_asked() -> None:
+    """``on_card`` sees each profile as it is parsed and can end the search early."""
+    driver = MagicMock(window_handles=["main"])
+    driver.execute_script.return_value = [
+        {"href": "https://www.linkedin.com/in/a", "text": "Ann\nEngineer"},
+        {"href": "https://www.linkedin.com/in/b", "text": "Bob\nDesigner"},
+    ]
+    pool = MagicMock()
+    pool.checkout.return_value = driver
+    seen: list[str] = []
+
+    with patch.object(scraping, "get_driver_pool", return_value=pool), patch.object(
+        scraping, "is_linkedin_authenticated", return_value=True
+    ), patch.object(scraping, "_is_signed_out", return_value=False), patch.object(
+        scraping, "settle", return_value=True
+    ):
+        profiles = scraping.search_linkedin(
+            "engineer", max_results=10, on_card=lambda profile: seen.append(profile["name"]) or False
+        )
+
+    assert seen == ["Ann"]
+    assert [profile["name"] for profile in profiles] == ["Ann"]
+    pool.checkin.assert_called_once_with(driver)
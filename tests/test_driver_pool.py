@@ -0,0 +1,146 @@
+"""Unit tests for the pooled LinkedIn browser drivers."""
+
+from __future__ import annotations
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from sourceress.utils import linkedin_auth, scraping
+from sourceress.utils.linkedin_auth import DriverPool
+
+
+def _factory() -> MagicMock:
+    return MagicMock(side_effect=lambda: MagicMock(window_handles=["main"]))
+
+
+class TestDriverPool:
+    """Test suite for :class:`DriverPool`."""
+
+    def test_drivers_are_reused(self) -> None:
+        """A checked-in driver is handed out again instead of starting a new one."""
+        factory = _factory()
+        pool = DriverPool(size=2, factory=factory)
+
+        with pool.driver() as first:
+            pass
+        with pool.driver() as second:
+            pass
+
+        assert first is second
+        assert factory.call_count == 1
+        first.quit.assert_not_called()
+
+    def test_pool_is_bounded(self) -> None:
+        """Checkouts beyond ``size`` block until a driver is returned."""
+        pool = DriverPool(size=1, factory=_factory())
+        held = pool.checkout()
+
+        with pytest.raises(TimeoutError):
+            pool.checkout(timeout=0.05)
+
+        threading.Timer(0.05, pool.checkin, args=(held,)).start()
+        assert pool.checkout(timeout=2) is held
+
+    def test_recycled_after_max_pages(self) -> None:
+        """Drivers are quit once they have served ``max_pages`` navigations."""
+        factory = _factory()
+        pool = DriverPool(size=1, max_pages=2, factory=factory)
+
+        driver = pool.checkout()
+        pool.record_page(driver)
+        pool.record_page(driver)
+        pool.checkin(driver)
+
+        driver.quit.assert_called_once()
+        assert pool.checkout() is not driver
+        assert factory.call_count == 2
+
+    def test_unhealthy_driver_replaced(self) -> None:
+        """A driver whose browser died is discarded at checkout."""
+        pool = DriverPool(size=1, factory=_factory())
+        driver = pool.checkout()
+        pool.checkin(driver)
+        type(driver).current_url = property(MagicMock(side_effect=RuntimeError("dead")))
+
+        replacement = pool.checkout()
+
+        assert replacement is not driver
+        assert pool.live == 1
+
+    def test_invalidate_retires_drivers_in_use(self) -> None:
+        """Drivers started before :meth:`invalidate` are quit, idle or not."""
+        pool = DriverPool(size=2, factory=_factory())
+        idle, busy = pool.checkout(), pool.checkout()
+        pool.checkin(idle)
+
+        pool.invalidate()
+        idle.quit.assert_called_once()
+        pool.checkin(busy)
+        busy.quit.assert_called_once()
+        assert pool.live == 0
+
+    def test_reauthentication_invalidates_the_shared_pool(self) -> None:
+        """``authenticate_linkedin`` retires drivers holding the old cookies."""
+        pool = DriverPool(size=1, factory=_factory())
+        driver = pool.checkout()
+        pool.checkin(driver)
+
+        with patch.object(linkedin_auth, "_POOL", pool), patch.object(
+            linkedin_auth, "LinkedInAuthenticator"
+        ) as mock_auth:
+            linkedin_auth.authenticate_linkedin()
+
+        mock_auth.return_value.authenticate.assert_called_once()
+        driver.quit.assert_called_once()
+        assert pool.live == 0
+
+    def test_factory_failure_frees_slot(self) -> None:
+        """A driver that fails to start does not leak pool capacity."""
+        factory = MagicMock(side_effect=[RuntimeError("chrome"), MagicMock()])
+        pool = DriverPool(size=1, factory=factory)
+
+        with pytest.raises(RuntimeError):
+            pool.checkout()
+        assert pool.checkout(timeout=0.1) is not None
+
+    def test_grow_wakes_blocked_checkout(self) -> None:
+        """Raising the limit lets a waiting checkout start another driver."""
+        pool = DriverPool(size=1, factory=_factory())
+        held = pool.checkout()
+
+        threading.Timer(0.05, pool.grow, args=(2,)).start()
+        assert pool.checkout(timeout=2) is not held
+        assert pool.live == 2
+
+    def test_close_quits_idle_drivers_and_rejects_checkout(self) -> None:
+        """After :meth:`close` no driver is handed out."""
+        pool = DriverPool(size=1, factory=_factory())
+        driver = pool.checkout()
+        pool.checkin(driver)
+
+        pool.close()
+
+        driver.quit.assert_called_once()
+        with pytest.raises(RuntimeError):
+            pool.checkout()
+
+
+def test_enrich_profile_reuses_pooled_driver() -> None:
+    """Consecutive enrichments share one browser and count its pages."""
+    factory = _factory()
+    pool = DriverPool(size=1, factory=factory)
+
+    with patch.object(scraping, "get_driver_pool", return_value=pool), patch.object(
+        scraping, "is_linkedin_authenticated", return_value=True
+    ), patch.object(scraping, "_is_signed_out", return_value=False), patch.object(
+        scraping.time, "sleep"
+    ):
+        for url in ("https://www.linkedin.com/in/a", "https://www.linkedin.com/in/b"):
+            scraping.enrich_profile(url)
+
+    assert factory.call_count == 1
+    driver = pool.checkout()
+    assert pool._pages[id(driver)] == 2
+    driver.quit.assert_not_called()
@@ -0,0 +1,103 @@
+"""Unit tests for concurrent bulk profile enrichment."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from sourceress.models import CandidateProfile
+from sourceress.utils import linkedin_api, scraping
+from sourceress.utils.profile_store import ProfileStore
+
+URLS = [f"https://www.linkedin.com/in/person-{i}" for i in range(6)]
+
+
+def _fake_enricher(concurrency, fail: str | None = None):
+    """Stands in for :func:`enrich_profile`; *fail* raises like a crashed page."""
+
+    def enrich(url: str, auto_authenticate: bool = False, cache: bool = True, lookup: bool = True) -> dict:
+        with concurrency.track(URLS.index(url)):
+            if url == fail:
+                raise RuntimeError("page crashed")
+            return {"linkedin_url": url, "summary": f"about {url}", "skills": ["python"]}
+
+    return enrich
+
+
+@pytest.fixture
+def scraping_env(tmp_path):
+    pool = MagicMock()
+    store = ProfileStore(tmp_path / "profiles.sqlite")
+    with patch.object(scraping, "is_linkedin_authenticated", return_value=True), patch.object(
+        scraping, "get_driver_pool", return_value=pool
+    ), patch.object(scraping, "get_profile_store", return_value=store):
+        yield pool
+
+
+class TestEnrichProfiles:
+    """Test suite for :func:`enrich_profiles` and its async variant."""
+
+    def test_results_in_input_order_with_partial_failure(self, scraping_env, concurrency) -> None:
+        """Results align with the input; one failure does not sink the batch."""
+        fake = _fake_enricher(concurrency, fail=URLS[2])
+        with patch.object(scraping, "enrich_profile", side_effect=fake):
+            results = scraping.enrich_profiles(URLS, concurrency=3)
+
+        assert [result["linkedin_url"] for result in results] == URLS
+        assert results[2]["error"] == "page crashed"
+        assert all("error" not in result for i, result in enumerate(results) if i != 2)
+        assert 1 < concurrency.peak <= 3
+        scraping_env.grow.assert_called_once_with(3)
+
+    @pytest.mark.asyncio
+    async def test_async_variant_bounded_by_semaphore(self, scraping_env, concurrency) -> None:
+        """The async API keeps order and never exceeds ``concurrency``."""
+        fake = _fake_enricher(concurrency)
+        with patch.object(scraping, "enrich_profile", side_effect=fake):
+            results = await scraping.enrich_profiles_async(URLS, concurrency=2)
+
+        assert [result["linkedin_url"] for result in results] == URLS
+        assert concurrency.peak == 2
+
+    def test_missing_session_fails_fast(self) -> None:
+        """Without a session the whole batch raises before any page loads."""
+        with patch.object(scraping, "is_linkedin_authenticated", return_value=False), patch.object(
+            scraping, "enrich_profile"
+        ) as mock_enrich:
+            with pytest.raises(ValueError, match="enrich_profiles"):
+                scraping.enrich_profiles(URLS)
+
+        mock_enrich.assert_not_called()
+
+    def test_empty_input(self) -> None:
+        """No URLs means no work and no session check."""
+        assert scraping.enrich_profiles([]) == []
+
+
+def test_fetch_profiles_merges_enrichment() -> None:
+    """``fetch_profiles(enrich=True)`` fills summary/skills, keeping failed rows as-is."""
+    hits = [
+        {"name": "Ada", "linkedin_url": URLS[0], "title": "Engineer", "location": "London"},
+        {"name": "Bob", "linkedin_url": URLS[1], "title": "Designer", "location": "Paris"},
+    ]
+    details = [
+        {"linkedin_url": URLS[0], "summary": "Builds compilers", "skills": ["rust"]},
+        {"linkedin_url": URLS[1], "error": "timeout"},
+    ]
+
+    with patch.object(linkedin_api, "search_linkedin", return_value=hits), patch.object(
+        linkedin_api, "enrich_profiles", return_value=details
+    ) as mock_enrich, patch.object(linkedin_api, "get_search_cache", return_value=None):
+        profiles = linkedin_api.fetch_profiles("engineer", limit=2, enrich=True, concurrency=4)
+
+    mock_enrich.assert_called_once_with([URLS[0], URLS[1]], concurrency=4)
+    assert profiles[0] == CandidateProfile(
+        name="Ada",
+        linkedin_url=URLS[0],
+        title="Engineer",
+        location="London",
+        summary="Builds compilers",
+        skills=["rust"],
+    )
+    assert profiles[1].summary == "" and profiles[1].skills == []
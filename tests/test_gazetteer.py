@@ -0,0 +1,72 @@
+"""Unit tests for the search-card line classifier in :mod:`sourceress.utils.gazetteer`."""
+
+from __future__ import annotations
+
+import json
+import re
+
+import pytest
+
+from sourceress.utils.gazetteer import Gazetteer, _trie_regex
+
+
+class TestClassify:
+    """Test suite for :meth:`Gazetteer.classify`."""
+
+    @pytest.fixture(scope="class")
+    def gazetteer(self) -> Gazetteer:
+        return Gazetteer()
+
+    @pytest.mark.parametrize(
+        "line",
+        [
+            "Senior Data Engineer @ Acme",
+            "Founder @ Stealth",
+            "Software Engineering at Contoso",
+            "CTO at Acme",
+            "Head of Data",
+            "London-based Software Developer",
+        ],
+    )
+    def test_titles(self, gazetteer, line) -> None:
+        """Title terms (whole words, inflected) or an ``@`` make a headline, even next to a place."""
+        assert gazetteer.classify(line) == "title"
+
+    @pytest.mark.parametrize(
+        "line",
+        [
+            "Greater London Area",
+            "Bengaluru, Karnataka, India",
+            "São Paulo, Brazil",
+            "san francisco bay area",
+            "Staffordshire, England",
+            "Remote, UK",
+        ],
+    )
+    def test_locations(self, gazetteer, line) -> None:
+        """Cities, regions and countries match whole words in any case."""
+        assert gazetteer.classify(line) == "location"
+
+    @pytest.mark.parametrize("line", ["Velocity", "BUSINESS", "Misleadingly", "Message", "uk"])
+    def test_no_partial_word_matches(self, gazetteer, line) -> None:
+        """Entries never match inside longer words, and all-caps codes only in capitals."""
+        assert gazetteer.classify(line) is None
+
+    def test_from_file_extends_the_defaults(self, tmp_path) -> None:
+        """``CARD_GAZETTEER_FILE`` entries are added to the built-in lists."""
+        path = tmp_path / "gazetteer.json"
+        path.write_text(json.dumps({"titles": ["Sommelier"], "cities": ["Reykjavík"]}), encoding="utf-8")
+        gazetteer = Gazetteer.from_file(path)
+
+        assert gazetteer.classify("Head Sommelier") == "title"
+        assert gazetteer.classify("Reykjavík, Capital Region") == "location"
+        assert gazetteer.classify("Berlin") == "location"
+
+
+def test_trie_regex_matches_exactly_its_terms() -> None:
+    """The prefix-factored alternation accepts each term and nothing else."""
+    terms = ["new york", "new york city", "newark", "nice", "n"]
+    pattern = re.compile(rf"(?:{_trie_regex(terms)})")
+
+    assert all(pattern.fullmatch(term) for term in terms)
+    assert not any(pattern.fullmatch(word) for word in ["new", "new yorker", "ne", ""])
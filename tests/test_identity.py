@@ -0,0 +1,146 @@
+"""Unit tests for :class:`sourceress.utils.identity.CandidateIndex`."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+
+from sourceress.agents import LinkedInSourcer
+from sourceress.agents import linkedin_sourcer
+from sourceress.models import CandidateProfile, JobDescription
+from sourceress.utils.identity import CandidateIndex
+
+JANE = "https://www.linkedin.com/in/jane-doe"
+
+
+class TestCandidateIndex:
+    """Test suite for :class:`CandidateIndex`."""
+
+    def test_url_forms_share_an_identity(self) -> None:
+        """Every URL variant of a profile resolves to the first canonical form."""
+        index = CandidateIndex()
+
+        assert index.resolve("https://uk.linkedin.com/in/Jane-Doe/?trk=x") == JANE
+        assert index.resolve("linkedin.com/in/jane-doe") == JANE
+        assert "https://www.linkedin.com/in/JANE-DOE/" in index
+        assert len(index) == 1
+
+    def test_same_name_pub_urls_stay_apart(self) -> None:
+        """Legacy ``/pub/`` profiles are told apart by their ids, not their names."""
+        index = CandidateIndex()
+        first = index.resolve("https://www.linkedin.com/pub/john-smith/12/345/678", "John Smith")
+        second = index.resolve("https://uk.linkedin.com/pub/john-smith/9a/bc/def/", "John Smith")
+        vanity = index.resolve("https://www.linkedin.com/in/john-smith", "John Smith")
+
+        assert len({first, second, vanity}) == 3
+        assert index.resolve("https://www.linkedin.com/pub/John-Smith/12/345/678?trk=x") == first
+
+    def test_same_summary_merges_and_persists(self, tmp_path) -> None:
+        """A member-id URL with the same name and enriched summary joins the identity."""
+        path = tmp_path / "candidates.sqlite"
+        summary = "Building payment infrastructure and data platforms at Acme since 2019."
+        first = CandidateIndex(path)
+        first.resolve(JANE, "Jane Doe", summary)
+        first.close()
+
+        second = CandidateIndex(path)
+        assert second.resolve("https://www.linkedin.com/in/ACoAABcdEf", "Jane Doe, PhD", summary) == JANE
+        assert second.resolve("https://www.linkedin.com/in/ACoAA2", "Jane Doe", "Engineer at Acme") != JANE
+
+    def test_persists_url_forms_only(self, tmp_path) -> None:
+        """URL aliases are reloaded from SQLite; near-duplicate merges are not."""
+        path = tmp_path / "candidates.sqlite"
+        with CandidateIndex(path).run() as run:
+            run.resolve(JANE, "Jane Doe", "CTO", "Berlin")
+            assert run.resolve("https://www.linkedin.com/in/ACoAA1", "Jane Doe", "CTO", "Berlin") == JANE
+            run.resolve("https://www.linkedin.com/in/bob", "Bob")
+
+        second = CandidateIndex(path)
+        assert len(second) == 3
+        assert "https://de.linkedin.com/in/bob/" in second
+        assert second.resolve("https://www.linkedin.com/in/ACoAA1", "Jane Doe") != JANE
+
+    def test_writes_are_batched_until_flush(self, tmp_path) -> None:
+        """New sightings reach SQLite in one write on :meth:`CandidateIndex.flush`."""
+        path = tmp_path / "candidates.sqlite"
+        index = CandidateIndex(path)
+        for i in range(3):
+            index.resolve(f"https://www.linkedin.com/in/p{i}")
+        assert not path.exists()
+
+        index.flush()
+        assert len(CandidateIndex(path)) == 3
+
+
+class TestCandidateRun:
+    """Test suite for run-scoped near-duplicate merging."""
+
+    def test_near_duplicate_under_another_url(self) -> None:
+        """The same person behind a member-id URL joins the vanity-URL identity for the run."""
+        index = CandidateIndex()
+        run = index.run()
+        run.resolve(JANE, "Jane Doe", "Senior Software Engineer at Acme", "London")
+
+        other = run.resolve(
+            "https://www.linkedin.com/in/ACoAABcdEf",
+            "Jane Doe, PhD",
+            "Senior Software Engineer @ Acme",
+            "London, England, United Kingdom",
+        )
+
+        assert other == JANE
+        assert index.resolve("https://www.linkedin.com/in/ACoAABcdEf") != JANE
+
+    def test_merges_end_with_the_run(self) -> None:
+        """A later run does not inherit near-duplicate merges."""
+        index = CandidateIndex()
+        first = index.run()
+        first.resolve(JANE, "Jane Doe", "CTO", "Berlin")
+        assert first.resolve("https://www.linkedin.com/in/ACoAA1", "Jane Doe", "CTO", "Berlin") == JANE
+
+        assert index.run().resolve("https://www.linkedin.com/in/ACoAA1", "Jane Doe", "CTO", "Berlin") != JANE
+
+    @pytest.mark.parametrize(
+        ("name", "title", "location"),
+        [
+            ("Jane Doe", "Accountant at KPMG", "Leeds"),
+            ("John Roe", "Senior Software Engineer at Acme", "London"),
+            ("Jane Doe", "", ""),
+        ],
+    )
+    def test_different_people_stay_apart(self, name, title, location) -> None:
+        """Other jobs, other names, or bare names never merge."""
+        index = CandidateIndex()
+        run = index.run()
+        run.resolve(JANE, "Jane Doe", "Senior Software Engineer at Acme", "London")
+
+        assert run.resolve("https://www.linkedin.com/in/someone", name, title, location) != JANE
+        assert len(index) == 2
+
+
+class TestSourcerDedup:
+    """``LinkedInSourcer.run`` de-duplicates by identity."""
+
+    @pytest.mark.asyncio
+    async def test_url_variants_and_near_duplicates_are_dropped(self) -> None:
+        """Trailing slashes, subdomains and member-id URLs of one person count once."""
+        jd = JobDescription(title="CTO", must_haves=[])
+        profiles = [
+            CandidateProfile(name="Jane Doe", linkedin_url=JANE, title="CTO at Acme", location="Berlin"),
+            CandidateProfile(name="Jane Doe", linkedin_url=f"{JANE}/", title="CTO at Acme"),
+            CandidateProfile(name="Jane Doe", linkedin_url="https://de.linkedin.com/in/Jane-Doe"),
+            CandidateProfile(
+                name="Jane Doe",
+                linkedin_url="https://www.linkedin.com/in/ACoAAXYZ",
+                title="CTO @ Acme",
+                location="Berlin, Germany",
+            ),
+            CandidateProfile(name="Bob", linkedin_url="https://www.linkedin.com/in/bob"),
+        ]
+        with patch.object(linkedin_sourcer, "get_candidate_index", return_value=CandidateIndex()), patch.object(
+            linkedin_sourcer, "fetch_profiles_async", return_value=profiles
+        ):
+            result = await LinkedInSourcer().run(jd)
+
+        assert [c.linkedin_url for c in result.candidates] == [JANE, "https://www.linkedin.com/in/bob"]
@@ -4,7 +4,7 @@ import json
 import pytest
 from unittest.mock import AsyncMock, patch
 
-from sourceress.agents.jd_ingestor import JDIngestor
+from sourceress.agents.jd_ingestor import JDIngestor, _JSONObjectScanner
 from sourceress.models import JobDescription, JDIngestResult
 
 
@@ -170,4 +170,77 @@ class TestJDIngestor:
             
             # Verify custom temperature was passed
             args, kwargs = mock_chat.call_args
-            assert kwargs.get('temperature') == 0.5 
\ No newline at end of file
+            assert kwargs.get('temperature') == 0.5
+
+    @pytest.mark.asyncio
+    async def test_streamed_reply_stops_at_object_end(
+        self,
+        ingestor: JDIngestor,
+        sample_jd_text: str,
+        expected_llm_response: str
+    ) -> None:
+        """The ingestor asks for early termination and ignores trailing text."""
+
+        async def _fake_chat(system_prompt, user_prompt, stop_when=None, **kwargs):
+            chunks = ["```json\n", expected_llm_response[:20], expected_llm_response[20:], "\n```", " extra"]
+            seen = []
+            for chunk in chunks:
+                seen.append(chunk)
+                if stop_when(chunk):
+                    break
+            return "".join(seen)
+
+        with patch('sourceress.agents.jd_ingestor.async_chat', side_effect=_fake_chat):
+            result = await ingestor.run(sample_jd_text, early_stop=True)
+
+        assert result.job_description.title == "Senior Python Developer - Remote"
+        assert len(result.job_description.must_haves) == 4
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(("backend", "streamed"), [("huggingface", False), ("openrouter", True)])
+    async def test_early_stop_defaults_per_backend(
+        self,
+        ingestor: JDIngestor,
+        sample_jd_text: str,
+        expected_llm_response: str,
+        backend: str,
+        streamed: bool,
+    ) -> None:
+        """Early stop is automatic on OpenRouter; HF keeps the micro-batched path."""
+        with patch('sourceress.utils.llm.BACKEND', backend), patch(
+            'sourceress.agents.jd_ingestor.async_chat', new_callable=AsyncMock
+        ) as mock_chat:
+            mock_chat.return_value = expected_llm_response
+            await ingestor.run(sample_jd_text)
+
+        assert (mock_chat.call_args.kwargs["stop_when"] is not None) is streamed
+
+
+class TestJSONObjectScanner:
+    """Test suite for the incremental JSON object scanner."""
+
+    def test_completes_on_top_level_close(self) -> None:
+        """Completion is reported exactly when the outer object closes."""
+        scanner = _JSONObjectScanner()
+
+        assert scanner.feed('Sure! ```json\n{"a": {"b": [1, 2]') is False
+        assert scanner.feed('}, "c": 3') is False
+        assert scanner.feed('}\n``` trailing') is True
+        assert json.loads(scanner.text) == {"a": {"b": [1, 2]}, "c": 3}
+
+    def test_braces_inside_strings_are_ignored(self) -> None:
+        """Braces and escaped quotes inside string literals don't affect depth."""
+        scanner = _JSONObjectScanner()
+        payload = '{"title": "C++ {Lead} \\"Dev\\"", "must_haves": []}'
+
+        for char in payload:
+            scanner.feed(char)
+
+        assert scanner.complete
+        assert json.loads(scanner.text)["title"] == 'C++ {Lead} "Dev"'
+
+    def test_incomplete_without_object(self) -> None:
+        """Text without an object never completes."""
+        scanner = _JSONObjectScanner()
+        assert scanner.feed("This is not valid JSON") is False
+        assert scanner.text == ""
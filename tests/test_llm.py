@@ -0,0 +1,917 @@
+"""Unit tests for the LLM back-end helpers in :mod:`sourceress.utils.llm`."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import queue
+import sys
+import threading
+import time
+import types
+from unittest.mock import MagicMock, patch
+
+import numpy
+import pytest
+import pytest_asyncio
+
+from sourceress.utils import llm
+from sourceress.utils.cache import SQLiteCache
+from sourceress.utils.llm import ModelRegistry
+
+
+def _fake_model(footprint: int) -> MagicMock:
+    model = MagicMock()
+    model.get_memory_footprint.return_value = footprint
+    return model
+
+
+class TestModelRegistry:
+    """Test suite for the process-wide HF model registry."""
+
+    def test_model_loaded_once_across_threads(self) -> None:
+        """Concurrent callers share a single load of the same model."""
+        registry = ModelRegistry(max_bytes=10**9)
+
+        def _slow_load(model_id: str):
+            time.sleep(0.05)
+            return MagicMock(), _fake_model(100)
+
+        with patch("sourceress.utils.llm._load_model", side_effect=_slow_load) as mock_load:
+            threads = [
+                threading.Thread(target=registry.get_model, args=("model-a",))
+                for _ in range(8)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert mock_load.call_count == 1
+        assert "model-a" in registry
+
+    def test_lru_eviction_under_memory_ceiling(self) -> None:
+        """The least recently used model is evicted once the ceiling is exceeded."""
+        registry = ModelRegistry(max_bytes=250)
+
+        with patch(
+            "sourceress.utils.llm._load_model",
+            side_effect=lambda model_id: (MagicMock(), _fake_model(100)),
+        ):
+            registry.get_model("model-a")
+            registry.get_model("model-b")
+            registry.get_model("model-a")  # a is now most recently used
+            registry.get_model("model-c")
+
+        assert "model-a" in registry
+        assert "model-b" not in registry
+        assert "model-c" in registry
+        assert registry.total_bytes == 200
+
+    def test_oversized_model_is_kept(self) -> None:
+        """A model larger than the ceiling still stays resident after loading."""
+        registry = ModelRegistry(max_bytes=50)
+
+        with patch(
+            "sourceress.utils.llm._load_model",
+            side_effect=lambda model_id: (MagicMock(), _fake_model(100)),
+        ):
+            registry.get_model("model-a")
+            registry.get_model("model-b")
+
+        assert "model-a" not in registry
+        assert "model-b" in registry
+
+    def test_footprint_measured_after_load(self) -> None:
+        """Memory taken by the load counts when it exceeds the parameter sum."""
+        registry = ModelRegistry(max_bytes=250)
+        readings = iter([1_000, 1_300, 1_300, 1_350])
+
+        with patch(
+            "sourceress.utils.llm._load_model",
+            side_effect=lambda model_id: (MagicMock(), _fake_model(100)),
+        ), patch("sourceress.utils.llm._memory_in_use", side_effect=lambda: next(readings)):
+            registry.get_model("model-a")  # int8 weights the parameter sum misses
+            registry.get_model("model-b")
+
+        assert "model-a" not in registry
+        assert registry.total_bytes == 100
+
+    def test_pipelines_keyed_by_generation_settings(self) -> None:
+        """Pipelines are reused per settings and share the loaded weights."""
+        registry = ModelRegistry(max_bytes=10**9)
+
+        with patch(
+            "sourceress.utils.llm._load_model",
+            return_value=(MagicMock(), _fake_model(100)),
+        ) as mock_load, patch(
+            "sourceress.utils.llm._build_pipeline",
+            side_effect=lambda tokenizer, model, **settings: object(),
+        ) as mock_build:
+            cold = registry.get_pipeline("model-a", temperature=0.1, max_new_tokens=256)
+            again = registry.get_pipeline("model-a", max_new_tokens=256, temperature=0.1)
+            warm = registry.get_pipeline("model-a", temperature=0.7, max_new_tokens=256)
+
+        assert cold is again
+        assert cold is not warm
+        assert mock_load.call_count == 1
+        assert mock_build.call_count == 2
+
+    def test_warmup_loads_default_model(self) -> None:
+        """``warmup()`` populates the shared registry."""
+        registry = ModelRegistry(max_bytes=10**9)
+
+        with patch.object(llm, "_REGISTRY", registry), patch(
+            "sourceress.utils.llm._load_model",
+            return_value=(MagicMock(), _fake_model(100)),
+        ):
+            llm.warmup("model-a")
+
+        assert "model-a" in registry
+
+
+@pytest.mark.asyncio
+async def test_hf_chat_reuses_registry_pipeline() -> None:
+    """Repeated HF chats only build the pipeline once."""
+    registry = ModelRegistry(max_bytes=10**9)
+    fake_pipe = MagicMock(
+        side_effect=lambda prompts, **_: [[{"generated_text": "reply"}] for _ in prompts]
+    )
+
+    with patch.object(llm, "_REGISTRY", registry), patch(
+        "sourceress.utils.llm._load_model",
+        return_value=(MagicMock(), _fake_model(100)),
+    ) as mock_load, patch(
+        "sourceress.utils.llm._build_pipeline", return_value=fake_pipe
+    ) as mock_build:
+        first = await llm._hf_chat("system", "hello", temperature=0.1)
+        second = await llm._hf_chat("system", "again", temperature=0.1)
+
+    assert first == "reply"
+    assert second == "reply"
+    assert mock_load.call_count == 1
+    assert mock_build.call_count == 1
+
+
+class TestMicroBatcher:
+    """Test suite for HF request micro-batching."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_batch(self) -> None:
+        """Prompts submitted together are generated in one batched call."""
+        batcher = llm.MicroBatcher(window=0.01, max_batch_size=8)
+
+        def _fake_batch(model_id, prompts, settings):
+            return [llm._Completion(f"echo:{prompt}") for prompt in prompts]
+
+        with patch(
+            "sourceress.utils.llm._hf_generate_batch", side_effect=_fake_batch
+        ) as mock_batch:
+            results = await asyncio.gather(
+                *(batcher.submit("model-a", f"p{i}", temperature=0.1) for i in range(5))
+            )
+
+        assert results == [f"echo:p{i}" for i in range(5)]
+        assert mock_batch.call_count == 1
+        assert mock_batch.call_args[0][1] == [f"p{i}" for i in range(5)]
+
+    @pytest.mark.asyncio
+    async def test_batches_split_by_settings_and_size(self) -> None:
+        """Different settings never share a batch; full batches flush early."""
+        batcher = llm.MicroBatcher(window=0.01, max_batch_size=2)
+
+        with patch(
+            "sourceress.utils.llm._hf_generate_batch",
+            side_effect=lambda model_id, prompts, settings: [llm._Completion(p) for p in prompts],
+        ) as mock_batch:
+            await asyncio.gather(
+                batcher.submit("model-a", "a1", temperature=0.1),
+                batcher.submit("model-a", "a2", temperature=0.1),
+                batcher.submit("model-a", "a3", temperature=0.1),
+                batcher.submit("model-a", "b1", temperature=0.7),
+            )
+
+        batches = sorted(call.args[1] for call in mock_batch.call_args_list)
+        assert batches == [["a1", "a2"], ["a3"], ["b1"]]
+
+    @pytest.mark.asyncio
+    async def test_short_batch_output_fails_every_caller(self) -> None:
+        """A batch returning fewer outputs than prompts raises instead of misaligning replies."""
+        batcher = llm.MicroBatcher(window=0.01, max_batch_size=8)
+
+        with patch(
+            "sourceress.utils.llm._hf_generate_batch",
+            side_effect=lambda model_id, prompts, settings: [llm._Completion(p) for p in prompts][:-1],
+        ):
+            results = await asyncio.gather(
+                *(batcher.submit("model-a", f"p{i}") for i in range(3)), return_exceptions=True
+            )
+
+        assert all(isinstance(result, ValueError) for result in results)
+
+    @pytest.mark.asyncio
+    async def test_token_counts_come_from_the_worker(self) -> None:
+        """``_hf_chat`` takes token counts from the batch, never the registry, on the loop."""
+        stats = llm._CallStats()
+
+        with patch(
+            "sourceress.utils.llm._hf_generate_batch",
+            side_effect=lambda model_id, prompts, settings: [llm._Completion("reply", 12, 3)],
+        ), patch.object(llm._REGISTRY, "get_model", side_effect=AssertionError("registry on loop")):
+            assert await llm._hf_chat("system", "hello", stats=stats) == "reply"
+
+        assert (stats.prompt_tokens, stats.completion_tokens) == (12, 3)
+
+    @pytest.mark.asyncio
+    async def test_batch_failure_propagates_to_every_caller(self) -> None:
+        """All callers in a failed batch receive the exception."""
+        batcher = llm.MicroBatcher(window=0.01)
+
+        with patch(
+            "sourceress.utils.llm._hf_generate_batch", side_effect=RuntimeError("OOM")
+        ):
+            results = await asyncio.gather(
+                batcher.submit("model-a", "p1"),
+                batcher.submit("model-a", "p2"),
+                return_exceptions=True,
+            )
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+    @pytest.mark.asyncio
+    async def test_async_chat_many_preserves_order(self) -> None:
+        """``async_chat_many`` returns replies aligned with its inputs."""
+
+        async def _fake_chat(system_prompt, user_prompt, **kwargs):
+            await asyncio.sleep(0.01 if user_prompt == "first" else 0)
+            return user_prompt.upper()
+
+        with patch("sourceress.utils.llm.async_chat", side_effect=_fake_chat):
+            replies = await llm.async_chat_many([("sys", "first"), ("sys", "second")])
+
+        assert replies == ["FIRST", "SECOND"]
+
+
+class _FakeStreamer:
+    """Queue-backed stand-in for ``transformers.TextIteratorStreamer``."""
+
+    def __init__(self, tokenizer, **kwargs) -> None:
+        self.queue: queue.Queue[str | None] = queue.Queue()
+
+    def on_finalized_text(self, text: str, stream_end: bool = False) -> None:
+        self.queue.put(text)
+
+    def end(self) -> None:
+        self.queue.put(None)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> str:
+        text = self.queue.get()
+        if text is None:
+            raise StopIteration
+        return text
+
+
+class TestStreaming:
+    """Test suite for streamed completions."""
+
+    CHUNKS = ['{"title": ', '"Designer"', "}", " and some", " trailing", " chatter"]
+
+    @pytest_asyncio.fixture
+    async def sse_server(self):
+        """Local stand-in for OpenRouter's streaming endpoint."""
+        from aiohttp import web
+
+        sent: list[str] = []
+
+        async def _completions(request: web.Request) -> web.StreamResponse:
+            body = await request.json()
+            assert body["stream"] is True
+            resp = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+            await resp.prepare(request)
+            await resp.write(b": OPENROUTER PROCESSING\n\n")
+            for chunk in self.CHUNKS:
+                event = {"choices": [{"delta": {"content": chunk}}]}
+                await resp.write(f"data: {json.dumps(event)}\n\n".encode())
+                sent.append(chunk)
+                await asyncio.sleep(0.01)
+            await resp.write(b"data: [DONE]\n\n")
+            return resp
+
+        app = web.Application()
+        app.router.add_post("/api/v1/chat/completions", _completions)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+
+        with patch.object(llm, "BACKEND", "openrouter"), patch.object(
+            llm, "OPENROUTER_API_KEY", "test"
+        ), patch.object(llm, "OPENROUTER_BASE_URL", f"http://127.0.0.1:{port}/api/v1"):
+            yield sent
+
+        await llm.aclose()
+        await runner.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_openrouter_stream_yields_deltas(self, sse_server) -> None:
+        """SSE deltas are yielded in order; comments and [DONE] are skipped."""
+        chunks = [chunk async for chunk in llm.async_chat_stream("system", "user")]
+        assert chunks == self.CHUNKS
+
+    @pytest.mark.asyncio
+    async def test_stop_when_ends_stream_early(self, sse_server) -> None:
+        """``stop_when`` returns the text so far and stops reading the stream."""
+        seen: list[str] = []
+
+        def _stop(chunk: str) -> bool:
+            seen.append(chunk)
+            return chunk == "}"
+
+        reply = await llm.async_chat("system", "user", cache=False, stop_when=_stop)
+
+        assert reply == '{"title": "Designer"}'
+        assert seen == self.CHUNKS[:3]
+
+    @pytest.fixture
+    def hf_stream(self):
+        """Route ``_hf_chat_stream`` to a fake model whose ``generate`` is set per test."""
+        entry = MagicMock()
+        inputs = {"input_ids": MagicMock(shape=(1, 4))}
+        fake_transformers = types.SimpleNamespace(
+            StoppingCriteria=object, StoppingCriteriaList=list, TextIteratorStreamer=_FakeStreamer
+        )
+        with patch.dict(sys.modules, {"transformers": fake_transformers}), patch.object(
+            llm._REGISTRY, "get_model", return_value=entry
+        ), patch.object(llm, "_generation_inputs", return_value=inputs):
+            yield entry.model.generate
+
+    @pytest.mark.asyncio
+    async def test_hf_stream_yields_streamer_text(self, hf_stream) -> None:
+        """Text pushed to the streamer by ``generate`` is yielded in order."""
+
+        def _generate(streamer, **kwargs):
+            for chunk in ("Hello", " world"):
+                streamer.on_finalized_text(chunk)
+            streamer.end()
+
+        hf_stream.side_effect = _generate
+        chunks = [chunk async for chunk in llm._hf_chat_stream("system", "user", model="model-s1")]
+
+        assert chunks == ["Hello", " world"]
+
+    @pytest.mark.asyncio
+    async def test_hf_stream_reraises_generation_errors(self, hf_stream) -> None:
+        """A failing ``generate`` ends the stream with its error instead of hanging."""
+
+        def _generate(streamer, **kwargs):
+            streamer.on_finalized_text("partial")
+            raise RuntimeError("CUDA out of memory")
+
+        hf_stream.side_effect = _generate
+
+        async def _consume() -> list[str]:
+            return [chunk async for chunk in llm._hf_chat_stream("system", "user", model="model-s2")]
+
+        with pytest.raises(RuntimeError, match="out of memory"):
+            await asyncio.wait_for(_consume(), timeout=5)
+
+    @pytest.mark.asyncio
+    async def test_hf_streams_share_the_concurrency_cap(self, hf_stream) -> None:
+        """Each streamed generation holds a limiter slot until ``generate`` returns."""
+        active = peak = 0
+        lock = threading.Lock()
+
+        def _generate(streamer, **kwargs):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.02)
+            streamer.on_finalized_text("done")
+            with lock:
+                active -= 1
+            streamer.end()
+
+        hf_stream.side_effect = _generate
+        limiter = llm.AdaptiveLimiter(rate=None, max_concurrency=1)
+
+        async def _consume() -> list[str]:
+            return [chunk async for chunk in llm._hf_chat_stream("system", "user")]
+
+        with patch.object(llm, "get_limiter", return_value=limiter):
+            results = await asyncio.gather(*(_consume() for _ in range(3)))
+
+        assert results == [["done"]] * 3
+        assert peak == 1
+
+
+class TestAdaptiveLimiter:
+    """Test suite for the AIMD rate limiter / concurrency governor."""
+
+    @pytest.mark.asyncio
+    async def test_token_bucket_paces_requests(self) -> None:
+        """With a burst of one, requests are spaced by ``1 / rate``."""
+        limiter = llm.AdaptiveLimiter(rate=20, burst=1, max_concurrency=10)
+
+        start = time.monotonic()
+        for _ in range(4):
+            async with limiter.slot():
+                pass
+
+        assert time.monotonic() - start >= 0.14
+
+    @pytest.mark.asyncio
+    async def test_concurrency_cap(self) -> None:
+        """No more than ``max_concurrency`` callers are inside a slot at once."""
+        limiter = llm.AdaptiveLimiter(rate=None, max_concurrency=2)
+        in_flight = peak = 0
+
+        async def _call() -> None:
+            nonlocal in_flight, peak
+            async with limiter.slot():
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+
+        await asyncio.gather(*(_call() for _ in range(6)))
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_throttle_halves_rate_and_honours_retry_after(self) -> None:
+        """A 429 applies multiplicative decrease and blocks for Retry-After."""
+        limiter = llm.AdaptiveLimiter(rate=8, max_rate=8, max_concurrency=4)
+
+        limiter.record_throttle(retry_after=0.1)
+        assert limiter.rate == 4
+
+        start = time.monotonic()
+        async with limiter.slot():
+            pass
+        assert time.monotonic() - start >= 0.09
+
+    def test_success_increases_rate_up_to_ceiling(self) -> None:
+        """Successful calls add to the rate until ``max_rate``."""
+        limiter = llm.AdaptiveLimiter(
+            rate=1, max_rate=1.25, additive_step=0.1, max_concurrency=1, latency_target=5
+        )
+
+        limiter.record_success(latency=0.5)
+        assert limiter.rate == pytest.approx(1.1)
+        for _ in range(5):
+            limiter.record_success(latency=0.5)
+        assert limiter.rate == pytest.approx(1.25)
+
+        limiter.record_success(latency=10)
+        assert limiter.rate == pytest.approx(1.125)
+
+    def test_parse_retry_after(self) -> None:
+        """Delta-seconds and HTTP-date forms are both understood."""
+        assert llm._parse_retry_after("3") == 3.0
+        assert llm._parse_retry_after(None) is None
+        assert llm._parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+        assert llm._parse_retry_after("soon") is None
+
+    @pytest.mark.asyncio
+    async def test_openrouter_retries_after_429(self) -> None:
+        """A 429 is absorbed by the limiter instead of bubbling up."""
+        from aiohttp import web
+
+        calls = 0
+
+        async def _completions(request: web.Request) -> web.Response:
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                return web.Response(status=429, headers={"Retry-After": "0"})
+            return web.json_response({"choices": [{"message": {"content": "ok"}}]})
+
+        app = web.Application()
+        app.router.add_post("/api/v1/chat/completions", _completions)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        limiter = llm.AdaptiveLimiter(rate=100, max_concurrency=2)
+
+        try:
+            with patch.object(llm, "OPENROUTER_API_KEY", "test"), patch.object(
+                llm, "OPENROUTER_BASE_URL", f"http://127.0.0.1:{port}/api/v1"
+            ), patch("sourceress.utils.llm.get_limiter", return_value=limiter):
+                reply = await llm._openrouter_chat("system", "user")
+        finally:
+            await llm.aclose()
+            await runner.cleanup()
+
+        assert reply == "ok"
+        assert calls == 2
+        assert limiter.throttled == 1
+        assert limiter.rate == pytest.approx(50 + limiter.additive_step)
+
+
+class TestSessionManager:
+    """Test suite for the pooled OpenRouter HTTP session."""
+
+    @pytest.mark.asyncio
+    async def test_session_reused_until_closed(self) -> None:
+        """The same session is handed out until ``close()`` is called."""
+        manager = llm.SessionManager(limit_per_host=4)
+
+        first = await manager.get()
+        second = await manager.get()
+        assert first is second
+        assert first.connector is not None
+        assert first.connector.limit_per_host == 4
+
+        await manager.close()
+        assert first.closed
+
+        third = await manager.get()
+        assert third is not first
+        await manager.close()
+
+    @pytest.mark.asyncio
+    async def test_close_is_idempotent(self) -> None:
+        """Closing an unused or already-closed manager is a no-op."""
+        manager = llm.SessionManager()
+        await manager.close()
+        await manager.get()
+        await manager.close()
+        await manager.close()
+
+
+class TestResponseCache:
+    """Test suite for the persistent LLM response cache."""
+
+    @pytest.fixture
+    def response_cache(self, tmp_path):
+        cache = SQLiteCache(tmp_path / "llm_cache.sqlite")
+        with patch.object(llm, "_RESPONSE_CACHE", cache), patch.object(
+            llm, "LLM_CACHE_ENABLED", True
+        ), patch.object(llm, "BACKEND", "huggingface"):
+            yield cache
+
+    @pytest.mark.asyncio
+    async def test_identical_calls_hit_cache(self, response_cache) -> None:
+        """A repeated call with identical inputs is served from disk."""
+        with patch("sourceress.utils.llm._hf_chat", return_value="reply") as mock_chat:
+            first = await llm.async_chat("system", "jd text", temperature=0.1)
+            second = await llm.async_chat("system", "jd text", temperature=0.1)
+
+        assert first == second == "reply"
+        assert mock_chat.call_count == 1
+        assert llm.cache_stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_sampling_parameters_are_part_of_key(self, response_cache) -> None:
+        """Changing temperature or prompt produces a miss."""
+        with patch("sourceress.utils.llm._hf_chat", return_value="reply") as mock_chat:
+            await llm.async_chat("system", "jd text", temperature=0.1)
+            await llm.async_chat("system", "jd text", temperature=0.7)
+            await llm.async_chat("system", "other jd", temperature=0.1)
+
+        assert mock_chat.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_bypass_flag(self, response_cache) -> None:
+        """``cache=False`` neither reads nor writes the cache."""
+        with patch("sourceress.utils.llm._hf_chat", return_value="reply") as mock_chat:
+            await llm.async_chat("system", "jd text", cache=False)
+            await llm.async_chat("system", "jd text", cache=False)
+
+        assert mock_chat.call_count == 2
+        assert len(response_cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_generate_is_cached(self, response_cache) -> None:
+        """``generate`` shares the same cache."""
+        with patch("sourceress.utils.llm._hf_generate", return_value="text") as mock_gen:
+            await llm.generate("prompt")
+            await llm.generate("prompt")
+
+        assert mock_gen.call_count == 1
+
+    def test_cache_dir_is_resolved_on_first_use(self, tmp_path, monkeypatch) -> None:
+        """``SOURCERESS_CACHE_DIR`` set after import applies once the cache is reset."""
+        monkeypatch.setenv("SOURCERESS_CACHE_DIR", str(tmp_path / "redirected"))
+        llm.reset_response_cache()
+        try:
+            with patch.object(llm, "LLM_CACHE_ENABLED", True):
+                llm._cache_store(llm._cache_key("chat", "system", "user", {}), "reply")
+            assert (tmp_path / "redirected" / "llm_cache.sqlite").exists()
+        finally:
+            llm.reset_response_cache()
+
+
+class TestMetrics:
+    """Test suite for per-call LLM instrumentation."""
+
+    @pytest.fixture
+    def metrics(self, tmp_path):
+        store = llm.LLMMetrics()
+        with patch.object(llm, "METRICS", store), patch.object(
+            llm, "_RESPONSE_CACHE", SQLiteCache(tmp_path / "llm_cache.sqlite")
+        ), patch.object(llm, "LLM_CACHE_ENABLED", True), patch.object(
+            llm, "BACKEND", "huggingface"
+        ):
+            yield store
+
+    @staticmethod
+    async def _fake_hf_chat(system_prompt, user_prompt, *, stats=None, **kwargs):
+        stats.queue_wait += 0.25
+        stats.prompt_tokens, stats.completion_tokens = 12, 3
+        return "reply"
+
+    @pytest.mark.asyncio
+    async def test_calls_are_recorded_per_agent(self, metrics) -> None:
+        """Misses carry backend stats; cache hits are flagged; agent tag applies."""
+        with patch.object(llm, "_hf_chat", side_effect=self._fake_hf_chat):
+            with llm.calling_agent("jd_ingestor"):
+                await llm.async_chat("system", "user")
+                await llm.async_chat("system", "user")
+            await llm.generate("prompt", cache=False)
+
+        miss, hit, untagged = metrics.records()
+        assert (miss.agent, miss.kind, miss.cache_hit) == ("jd_ingestor", "chat", False)
+        assert (miss.prompt_tokens, miss.completion_tokens, miss.queue_wait) == (12, 3, 0.25)
+        assert hit.cache_hit and hit.prompt_tokens is None
+        assert untagged.agent is None and untagged.kind == "generate"
+
+        summary = metrics.summary()
+        assert summary["jd_ingestor"]["calls"] == 2
+        assert summary["jd_ingestor"]["cache_hits"] == 1
+        assert summary["unknown"]["prompt_tokens"] == 12
+
+    @pytest.mark.asyncio
+    async def test_errors_are_recorded(self, metrics) -> None:
+        """A failing call is recorded with the exception type and re-raised."""
+        with patch.object(llm, "_hf_chat", side_effect=RuntimeError("boom")):
+            with pytest.raises(RuntimeError):
+                await llm.async_chat("system", "user", cache=False)
+
+        (record,) = metrics.records()
+        assert record.error == "RuntimeError"
+        assert metrics.summary()["unknown"]["errors"] == 1
+
+    @pytest.mark.asyncio
+    async def test_stream_records_time_to_first_token(self, metrics) -> None:
+        """Streamed calls record TTFT once the first chunk arrives."""
+
+        async def _fake_stream(system_prompt, user_prompt, *, stats=None, **kwargs):
+            await asyncio.sleep(0.02)
+            yield "a"
+            yield "b"
+
+        with patch.object(llm, "_hf_chat_stream", side_effect=_fake_stream):
+            chunks = [chunk async for chunk in llm.async_chat_stream("system", "user")]
+
+        (record,) = metrics.records()
+        assert chunks == ["a", "b"]
+        assert record.kind == "stream"
+        assert 0.02 <= record.time_to_first_token <= record.latency
+
+    @pytest.mark.asyncio
+    async def test_export_formats(self, metrics, tmp_path) -> None:
+        """``.jsonl`` writes one record per line; ``.prom`` writes Prometheus text."""
+        with patch.object(llm, "_hf_chat", side_effect=self._fake_hf_chat):
+            with llm.calling_agent("scorer"):
+                await llm.async_chat("system", "user")
+
+        jsonl = metrics.export(tmp_path / "metrics.jsonl")
+        (line,) = jsonl.read_text().splitlines()
+        assert json.loads(line)["agent"] == "scorer"
+
+        prom = metrics.export(tmp_path / "metrics.prom").read_text()
+        assert "# TYPE sourceress_llm_calls_total counter" in prom
+        assert (
+            f'sourceress_llm_prompt_tokens_total{{agent="scorer",backend="huggingface",'
+            f'model="{llm.HF_MODEL}"}} 12'
+        ) in prom
+
+    @pytest.mark.asyncio
+    async def test_agent_run_is_tagged(self) -> None:
+        """``BaseAgent`` subclasses run inside ``calling_agent(self.name)``."""
+        from sourceress.agents.jd_ingestor import JDIngestor
+
+        seen: list[str | None] = []
+
+        async def _capture(*args, **kwargs):
+            seen.append(llm._CURRENT_AGENT.get())
+            return '{"title": "Engineer", "must_haves": [], "nice_to_haves": []}'
+
+        with patch("sourceress.agents.jd_ingestor.async_chat", side_effect=_capture):
+            await JDIngestor().run("We need an engineer.")
+
+        assert seen == ["jd_ingestor"]
+        assert llm._CURRENT_AGENT.get() is None
+
+
+class _TokenIds(numpy.ndarray):
+    """numpy stand-in for a token-id tensor (``.to()`` and ``.device``)."""
+
+    device = "cpu"
+
+    def to(self, device):
+        return self
+
+
+def _token_ids(*ids: int) -> _TokenIds:
+    return numpy.array([ids]).view(_TokenIds)
+
+
+class _Encoding(dict):
+    """Stand-in for a tokenizer's ``BatchEncoding``."""
+
+    def to(self, device):
+        return self
+
+
+class TestPrefixCache:
+    """Test suite for reusing prefilled system-prompt KV-caches."""
+
+    LONG_SYSTEM = "Extract the job requirements as JSON. " * 10
+
+    @staticmethod
+    def _texts(completions: list) -> list[str]:
+        return [completion.text for completion in completions]
+
+    def test_prefix_prefilled_once_and_bounded(self) -> None:
+        """Each prefix is prefilled once; the per-model cache is LRU-bounded."""
+        registry = ModelRegistry(max_bytes=10**9)
+
+        with patch(
+            "sourceress.utils.llm._load_model", return_value=(MagicMock(), _fake_model(1))
+        ), patch(
+            "sourceress.utils.llm._prefill", side_effect=lambda tok, model, prefix: prefix
+        ) as mock_prefill, patch.object(llm, "HF_PREFIX_CACHE_SIZE", 2):
+            assert registry.get_prefix("model-a", "p1") == "p1"
+            assert registry.get_prefix("model-a", "p1") == "p1"
+            registry.get_prefix("model-a", "p2")
+            registry.get_prefix("model-a", "p3")
+
+        assert mock_prefill.call_count == 3
+        assert list(registry.get_model("model-a").prefixes) == ["p2", "p3"]
+
+    def test_format_prompt_splits_at_user_text(self) -> None:
+        """The static part of the prompt ends where the user text begins."""
+        prompt = llm._format_prompt("system", "user")
+        assert prompt.prefix == "<s>[INST] system \n\n"
+        assert prompt.text == "<s>[INST] system \n\nuser [/INST]"
+
+    def test_single_long_prompt_uses_prefix_path(self) -> None:
+        """Lone prompts with long prefixes bypass the pipeline; batches do not."""
+        long_prompt = llm._format_prompt(self.LONG_SYSTEM, "JD text")
+        short_prompt = llm._format_prompt("system", "hello")
+        fake_pipe = MagicMock(
+            side_effect=lambda prompts, **_: [[{"generated_text": "pipe"}] for _ in prompts]
+        )
+
+        with patch(
+            "sourceress.utils.llm._hf_generate_with_prefix", return_value="prefix"
+        ) as mock_prefix, patch.object(
+            llm._REGISTRY, "get_pipeline", return_value=fake_pipe
+        ), patch.object(llm._REGISTRY, "get_model"):
+            assert self._texts(llm._hf_generate_batch("m", [long_prompt], {})) == ["prefix"]
+            assert self._texts(llm._hf_generate_batch("m", [short_prompt], {})) == ["pipe"]
+            assert self._texts(llm._hf_generate_batch("m", [long_prompt, long_prompt], {})) == [
+                "pipe",
+                "pipe",
+            ]
+            with patch.object(llm, "HF_PREFIX_CACHE_ENABLED", False):
+                assert self._texts(llm._hf_generate_batch("m", [long_prompt], {})) == ["pipe"]
+
+        assert mock_prefix.call_count == 1
+        assert fake_pipe.call_args_list[1].args[0] == [long_prompt.text] * 2
+
+    @pytest.mark.parametrize(("full_ids", "reused"), [((1, 2, 3, 4), True), ((1, 2, 9, 4), False)])
+    def test_prefix_state_reused_only_on_token_match(self, full_ids, reused) -> None:
+        """The KV-cache is reused only when the whole prompt's ids start with the prefix ids."""
+        prompt = llm._format_prompt(self.LONG_SYSTEM, "JD text")
+        state = llm._PrefixState(input_ids=_token_ids(1, 2, 3), past_key_values=["kv"])
+        tokenizer = MagicMock(
+            return_value=_Encoding(input_ids=_token_ids(*full_ids), attention_mask=_token_ids(1, 1, 1, 1))
+        )
+        entry = MagicMock(tokenizer=tokenizer)
+
+        with patch.object(llm._REGISTRY, "get_model", return_value=entry), patch.object(
+            llm._REGISTRY, "get_prefix", return_value=state
+        ):
+            inputs = llm._generation_inputs("m", prompt)
+
+        tokenizer.assert_called_once_with(prompt.text, return_tensors="pt")
+        assert list(inputs["input_ids"][0]) == list(full_ids)
+        assert ("past_key_values" in inputs) is reused
+        if reused:
+            assert inputs["past_key_values"] == ["kv"]
+            assert inputs["past_key_values"] is not state.past_key_values
+
+
+class TestQuantizedLoading:
+    """Test suite for the CPU / quantised model loading options."""
+
+    @pytest.fixture
+    def transformers_mocks(self):
+        tokenizer = MagicMock(pad_token=None, eos_token="</s>")
+        model = MagicMock()
+        with patch("transformers.AutoTokenizer") as auto_tok, patch(
+            "transformers.AutoModelForCausalLM"
+        ) as auto_model, patch.object(llm, "_configure_cpu_threads") as threads, patch.object(
+            llm, "_warm_up"
+        ) as warm_up:
+            auto_tok.from_pretrained.return_value = tokenizer
+            auto_model.from_pretrained.return_value = model
+            yield auto_model, threads, warm_up, model
+
+    def test_split_model_spec(self) -> None:
+        """A ``:suffix`` overrides ``HF_QUANTIZATION`` for that model."""
+        with patch.object(llm, "HF_QUANTIZATION", "none"):
+            assert llm._split_model_spec("org/model:4BIT") == ("org/model", "4bit")
+            assert llm._split_model_spec("org/model") == ("org/model", "none")
+
+    def test_cpu_int8_uses_dynamic_quantization(self, transformers_mocks) -> None:
+        """CPU int8 loads memory-mapped weights on the CPU, then quantises Linear layers."""
+        auto_model, threads, warm_up, model = transformers_mocks
+        quantized = MagicMock()
+
+        torch = MagicMock()
+
+        with patch.object(llm, "HF_DEVICE", "cpu"), patch.object(
+            llm, "_quantize_dynamic_int8", return_value=quantized
+        ) as mock_quantize, patch.dict(sys.modules, {"torch": torch}):
+            tokenizer, loaded = llm._load_model("org/model:int8")
+
+        # bf16, not the fp32 default, so the pre-quantisation peak is halved.
+        auto_model.from_pretrained.assert_called_once_with(
+            "org/model", device_map="cpu", low_cpu_mem_usage=True, torch_dtype=torch.bfloat16
+        )
+        mock_quantize.assert_called_once_with(model)
+        assert loaded is quantized
+        assert tokenizer.padding_side == "left"
+        threads.assert_called_once()
+        warm_up.assert_called_once_with(tokenizer, quantized)
+
+    def test_linear_layers_are_quantised_one_at_a_time(self) -> None:
+        """Each bf16 Linear is widened to fp32 only while it is being quantised."""
+        events: list[str] = []
+
+        class Linear:
+            def __init__(self, name: str) -> None:
+                self.name = name
+
+            def float(self):
+                events.append(f"float {self.name}")
+                return self
+
+        def quantize_dynamic(wrapper, layers, dtype, inplace):
+            assert inplace
+            events.append(f"quantise {wrapper[0].name}")
+            wrapper[0] = f"q{wrapper[0].name}"
+
+        torch = types.SimpleNamespace(
+            nn=types.SimpleNamespace(Linear=Linear, Sequential=lambda *mods: list(mods)),
+            ao=types.SimpleNamespace(quantization=types.SimpleNamespace(quantize_dynamic=quantize_dynamic)),
+            qint8="qint8",
+        )
+        block = types.SimpleNamespace(proj=Linear("proj"))
+        model = MagicMock()
+        model.named_modules.return_value = [("", model), ("block", block), ("block.proj", block.proj)]
+        model.get_submodule.side_effect = {"block": block}.__getitem__
+        model.lm_head = Linear("lm_head")
+        model.named_modules.return_value.append(("lm_head", model.lm_head))
+
+        with patch.dict(sys.modules, {"torch": torch}):
+            assert llm._quantize_dynamic_int8(model) is model.float.return_value
+
+        assert events == ["float proj", "quantise proj", "float lm_head", "quantise lm_head"]
+        assert block.proj == "qproj" and model.lm_head == "qlm_head"
+
+    @pytest.mark.parametrize(
+        "device, requested, expected",
+        [("cpu", "4bit", "int8"), ("cpu", "int8", "int8"), ("cuda", "4bit", "none"), ("auto", "int8", "none")],
+    )
+    def test_fallback_without_bitsandbytes(self, device, requested, expected) -> None:
+        """Without bitsandbytes only the CPU keeps int8 (dynamic); other devices load unquantised."""
+        with patch("importlib.util.find_spec", return_value=None), patch.object(llm, "HF_DEVICE", device):
+            assert llm._resolve_quantization(requested) == expected
+
+    def test_unknown_quantization_is_rejected(self) -> None:
+        """Anything but ``none``/``int8``/``4bit`` is a configuration error."""
+        with pytest.raises(ValueError):
+            llm._resolve_quantization("2bit")
+
+    def test_default_load_unchanged(self, transformers_mocks) -> None:
+        """Without quantisation the model is loaded as before, with ``device_map='auto'``."""
+        auto_model, threads, _, _ = transformers_mocks
+
+        with patch.object(llm, "HF_DEVICE", "auto"), patch.object(llm, "HF_QUANTIZATION", "none"):
+            llm._load_model("org/model")
+
+        auto_model.from_pretrained.assert_called_once_with(
+            "org/model", device_map="auto", low_cpu_mem_usage=True
+        )
+        threads.assert_not_called()
@@ -0,0 +1,154 @@
+"""Unit tests for :mod:`sourceress.utils.pacing`."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from sourceress.agents import LinkedInSourcer, linkedin_sourcer
+from sourceress.models import JobDescription
+from sourceress.utils import pacing, scraping
+from sourceress.utils.pacing import PacingPolicy, ScrapeMetrics
+
+
+class TestPacingPolicy:
+    """Test suite for :class:`PacingPolicy`."""
+
+    def test_delays_stay_within_bounds(self) -> None:
+        """Unbounded policies draw every pause from ``[min_delay, max_delay]``."""
+        policy = PacingPolicy(min_delay=0.2, max_delay=0.4, budget=None)
+        delays = [policy.next_delay() for _ in range(50)]
+
+        assert all(0.2 <= delay <= 0.4 for delay in delays)
+        assert policy.remaining is None
+
+    def test_budget_caps_total_pauses(self) -> None:
+        """Once the session budget is spent, pauses drop to zero until reset."""
+        policy = PacingPolicy(min_delay=1.0, max_delay=1.0, budget=2.5)
+
+        assert [policy.next_delay() for _ in range(4)] == [1.0, 1.0, 0.5, 0.0]
+        assert policy.remaining == 0.0
+
+        policy.reset()
+        assert policy.next_delay() == 1.0
+
+    def test_zero_budget_never_sleeps(self) -> None:
+        """A zero budget disables pacing entirely."""
+        policy = PacingPolicy(budget=0)
+        with patch.object(pacing.time, "sleep") as mock_sleep:
+            assert policy.pause() == 0.0
+        mock_sleep.assert_not_called()
+
+    @pytest.mark.parametrize("engine", ["selenium", "playwright"])
+    def test_search_draws_from_the_run_budget(self, engine) -> None:
+        """A single search does not refill the budget concurrent searches share."""
+        policy = PacingPolicy(min_delay=1.0, max_delay=1.0, budget=2.0)
+        policy.next_delay(), policy.next_delay()
+        with patch.object(pacing, "PACING", policy), patch.object(
+            scraping, "_ensure_session", side_effect=ValueError("no session")
+        ):
+            with pytest.raises(ValueError):
+                if engine == "selenium":
+                    scraping.search_linkedin("engineer")
+                else:
+                    asyncio.run(scraping.PlaywrightScraper().search("engineer"))
+
+        assert policy.remaining == 0.0
+
+    @pytest.mark.asyncio
+    async def test_each_sourcing_run_starts_a_new_session(self) -> None:
+        """The sourcer resets the budget once, before its fanned-out searches start."""
+        policy = PacingPolicy(min_delay=1.0, max_delay=1.0, budget=2.0)
+        policy.next_delay(), policy.next_delay()
+
+        async def fanout(queries, target):
+            paced = [policy.next_delay() for _ in queries]
+            assert paced == [1.0, 1.0, 0.0]
+            return []
+
+        with patch.object(linkedin_sourcer, "PACING", policy), patch.object(
+            linkedin_sourcer, "fetch_profiles_fanout", side_effect=fanout
+        ):
+            jd = JobDescription(title="Python Developer", must_haves=["Python", "Django"])
+            await LinkedInSourcer().run(jd, query_variants=3)
+
+        assert policy.remaining == 0.0
+
+
+class TestScrapeMetrics:
+    """Test suite for :class:`ScrapeMetrics`."""
+
+    def test_summary_reports_time_saved(self) -> None:
+        """Time saved is the fixed-sleep baseline minus readiness waits and pacing."""
+        metrics = ScrapeMetrics()
+        metrics.record("profile", ready_wait=0.6, paced=0.4, baseline=3.0)
+        metrics.record("profile", ready_wait=1.0, paced=0.0, timed_out=True, baseline=3.0)
+        metrics.record("session", ready_wait=0.5, paced=0.0, baseline=2.0)
+
+        summary = metrics.summary()
+        assert summary["profile"]["pages"] == 2
+        assert summary["profile"]["timeouts"] == 1
+        assert summary["profile"]["baseline_total"] == pytest.approx(6.0)
+        assert summary["profile"]["time_saved"] == pytest.approx(4.0)
+        assert summary["session"]["time_saved"] == pytest.approx(1.5)
+
+        metrics.reset()
+        assert metrics.summary() == {}
+
+    def test_pages_without_a_baseline_are_not_compared(self) -> None:
+        """Waits that replaced no fixed sleep count as waits but not towards time saved."""
+        metrics = ScrapeMetrics()
+        metrics.record("search", ready_wait=1.0, paced=0.5, baseline=3.0)
+        metrics.record("search", ready_wait=2.0, paced=0.5)
+
+        summary = metrics.summary()["search"]
+        assert summary["pages"] == 2
+        assert summary["ready_wait_total"] == pytest.approx(3.0)
+        assert summary["baseline_total"] == pytest.approx(3.0)
+        assert summary["time_saved"] == pytest.approx(1.5)
+
+
+class TestSettle:
+    """Test suite for :func:`settle` and its readiness probe."""
+
+    @pytest.fixture(autouse=True)
+    def _fresh_state(self):
+        with patch.object(pacing, "PACING", PacingPolicy(budget=0)), patch.object(
+            pacing, "SCRAPE_METRICS", ScrapeMetrics()
+        ):
+            yield
+
+    def test_ready_page_is_recorded(self) -> None:
+        """The probe runs as one async script and the wait is recorded."""
+        driver = MagicMock()
+        driver.execute_async_script.return_value = {"ready": True, "waited": 0.5}
+
+        assert pacing.settle(driver, "search", "[data-card]", timeout=4) is True
+
+        args = driver.execute_async_script.call_args.args
+        assert args == (pacing._SETTLE_JS, "[data-card]", pacing.QUIET_MS, 4000)
+        summary = pacing.SCRAPE_METRICS.summary()["search"]
+        assert summary["pages"] == 1 and summary["timeouts"] == 0
+
+    def test_probe_failure_counts_as_timeout(self) -> None:
+        """A script error is treated as a page that never became ready."""
+        driver = MagicMock()
+        driver.execute_async_script.side_effect = RuntimeError("script timeout")
+
+        assert pacing.settle(driver, "profile") is False
+        assert pacing.SCRAPE_METRICS.summary()["profile"]["timeouts"] == 1
+
+    @pytest.mark.asyncio
+    async def test_async_variant_uses_promise_wrapper(self) -> None:
+        """Playwright pages evaluate the Promise-wrapped probe."""
+        page = MagicMock()
+
+        async def _evaluate(script, args):
+            assert script == pacing._SETTLE_PLAYWRIGHT_JS
+            return {"ready": True, "waited": 0.1}
+
+        page.evaluate = _evaluate
+        assert await pacing.settle_async(page, "scroll") is True
+        assert pacing.SCRAPE_METRICS.summary()["scroll"]["pages"] == 1
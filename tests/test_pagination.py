@@ -0,0 +1,131 @@
+"""Unit tests for page-indexed search pagination in :mod:`sourceress.utils.scraping`."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from sourceress.utils import scraping
+from sourceress.utils.linkedin_auth import SessionExpiredError
+
+
+def _cards(page: int, count: int = 10) -> list[dict]:
+    return [
+        {"href": f"https://www.linkedin.com/in/p{page}-{i}", "text": f"Person {page} {i}\nEngineer"}
+        for i in range(count)
+    ]
+
+
+class _FakePages:
+    """Stands in for :func:`_fetch_search_page` over a fixed number of result pages."""
+
+    def __init__(self, concurrency, last_page: int, overlap: bool = False) -> None:
+        self.concurrency = concurrency
+        self.last_page = last_page
+        self.overlap = overlap
+        self.requested: list[int] = []
+
+    def __call__(self, query: str, page: int) -> list[dict]:
+        self.requested.append(page)
+        with self.concurrency.track(page):
+            if page > self.last_page:
+                return []
+            cards = _cards(page)
+            if self.overlap:
+                cards += _cards(page - 1, 2)
+            return cards
+
+
+@pytest.fixture
+def pool():
+    pool = MagicMock()
+    with patch.object(scraping, "get_driver_pool", return_value=pool):
+        yield pool
+
+
+class TestSearchUrl:
+    """Test suite for :func:`_search_url`."""
+
+    def test_page_parameter(self) -> None:
+        """Page 1 is the bare search URL; later pages add ``&page=N``."""
+        assert scraping._search_url("data engineer") == (
+            "https://www.linkedin.com/search/results/people/?keywords=data%20engineer"
+        )
+        assert scraping._search_url("data engineer", 3).endswith("&page=3")
+
+
+class TestCollectPages:
+    """Test suite for :func:`_collect_pages`."""
+
+    def test_merges_in_page_order_and_stops_at_max(self, pool, concurrency) -> None:
+        """Profiles keep page order and collection stops at ``max_results``."""
+        fake = _FakePages(concurrency, last_page=10)
+        with patch.object(scraping, "_harvest_cards", return_value=_cards(1)), patch.object(
+            scraping, "_fetch_search_page", side_effect=fake
+        ):
+            profiles = scraping._collect_pages(MagicMock(), "q", max_results=35, concurrency=3)
+
+        urls = [profile["linkedin_url"] for profile in profiles]
+        assert len(urls) == 35
+        assert urls[:10] == [card["href"] for card in _cards(1)]
+        assert urls[10] == "https://www.linkedin.com/in/p2-0"
+        assert urls[-1] == "https://www.linkedin.com/in/p4-4"
+        assert 1 < concurrency.peak <= 3
+        assert max(fake.requested) <= 6
+        pool.grow.assert_called_once_with(4)
+
+    def test_dedupes_overlapping_pages(self, pool, concurrency) -> None:
+        """Cards repeated across pages are only returned once."""
+        fake = _FakePages(concurrency, last_page=3, overlap=True)
+        with patch.object(scraping, "_harvest_cards", return_value=_cards(1)), patch.object(
+            scraping, "_fetch_search_page", side_effect=fake
+        ):
+            profiles = scraping._collect_pages(MagicMock(), "q", max_results=100, concurrency=2)
+
+        urls = [profile["linkedin_url"] for profile in profiles]
+        assert len(urls) == len(set(urls)) == 30
+
+    def test_single_page_needs_no_fan_out(self, pool) -> None:
+        """When page 1 satisfies ``max_results`` no further pages are loaded."""
+        with patch.object(scraping, "_harvest_cards", return_value=_cards(1)), patch.object(
+            scraping, "_fetch_search_page"
+        ) as mock_fetch:
+            profiles = scraping._collect_pages(MagicMock(), "q", max_results=5, concurrency=3)
+
+        assert len(profiles) == 5
+        mock_fetch.assert_not_called()
+        pool.grow.assert_not_called()
+
+    def test_fetch_page_treats_missing_results_as_end(self, pool) -> None:
+        """A page whose results never render yields no cards."""
+        driver = MagicMock()
+        pool.driver.return_value.__enter__.return_value = driver
+        with patch.object(scraping, "_is_signed_out", return_value=False), patch.object(
+            scraping, "settle", return_value=False
+        ):
+            assert scraping._fetch_search_page("q", 7) == []
+
+        driver.get.assert_called_once_with(scraping._search_url("q", 7))
+
+    def test_sign_out_is_not_the_last_page(self, pool, concurrency) -> None:
+        """A lapsed session raises instead of ending pagination like an empty page."""
+        driver = MagicMock()
+        pool.driver.return_value.__enter__.return_value = driver
+        with patch.object(scraping, "_session_lost", return_value=True):
+            with pytest.raises(SessionExpiredError, match="page 4"):
+                scraping._fetch_search_page("q", 4)
+        pool.invalidate.assert_called_once()
+
+        fake = _FakePages(concurrency, last_page=10)
+
+        def fetch(query, page):
+            if page == 3:
+                raise SessionExpiredError("signed out")
+            return fake(query, page)
+
+        with patch.object(scraping, "_harvest_cards", return_value=_cards(1)), patch.object(
+            scraping, "_fetch_search_page", side_effect=fetch
+        ):
+            with pytest.raises(SessionExpiredError):
+                scraping._collect_pages(MagicMock(), "q", max_results=50, concurrency=2)
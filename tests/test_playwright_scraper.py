@@ -0,0 +1,206 @@
+"""Unit tests for the Playwright scraping engine (with a fake browser)."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from sourceress.agents import LinkedInSourcer
+from sourceress.models import JobDescription
+from sourceress.utils import pacing, scraping
+from sourceress.utils.linkedin_auth import LinkedInAuthenticator, SessionMonitor
+from sourceress.utils.profile_store import ProfileStore
+from sourceress.utils.scraping import PlaywrightScraper, _to_playwright_cookie
+
+SELENIUM_COOKIE = {
+    "name": "li_at",
+    "value": "token",
+    "domain": ".www.linkedin.com",
+    "path": "/",
+    "expiry": 1893456000,
+    "secure": True,
+    "httpOnly": True,
+    "sameSite": "None",
+}
+
+
+class _FakePage:
+    def __init__(self, browser: "_FakeBrowser") -> None:
+        self.browser = browser
+        self.url = "about:blank"
+        self._card_batches = [
+            [{"href": "https://www.linkedin.com/in/ann", "text": "Ann\nEngineer"}],
+            [],
+        ]
+
+    async def goto(self, url: str) -> None:
+        self.url = url
+        await asyncio.sleep(0.01)
+
+    async def wait_for_selector(self, selector: str, timeout: float) -> None:
+        return None
+
+    async def evaluate(self, script: str, arg=None):
+        if script == scraping._SIGNED_OUT_JS:
+            return False
+        if script == pacing._SETTLE_PLAYWRIGHT_JS:
+            return {"ready": True, "waited": 0.0}
+        if "data-sourceress-seen" in script:
+            return self._card_batches.pop(0)
+        return {"name": f"Person {self.url[-1]}", "skills": ["python"]}
+
+
+class _FakeContext:
+    def __init__(self, browser: "_FakeBrowser") -> None:
+        self.browser = browser
+        self.cookies: list[dict] = []
+
+    async def add_cookies(self, cookies: list[dict]) -> None:
+        self.cookies = cookies
+
+    async def route(self, pattern: str, handler) -> None:
+        self.route_handler = handler
+
+    async def new_page(self) -> _FakePage:
+        return _FakePage(self.browser)
+
+    async def close(self) -> None:
+        self.browser.open -= 1
+
+
+class _FakeBrowser:
+    def __init__(self) -> None:
+        self.contexts: list[_FakeContext] = []
+        self.open = 0
+        self.peak = 0
+
+    async def new_context(self, **_: object) -> _FakeContext:
+        self.open += 1
+        self.peak = max(self.peak, self.open)
+        context = _FakeContext(self)
+        self.contexts.append(context)
+        return context
+
+
+@pytest.fixture
+def fake_scraper(tmp_path):
+    browser = _FakeBrowser()
+    scraper = PlaywrightScraper(max_pages=3)
+    scraper._browser = browser
+    scraper._cookies = [_to_playwright_cookie(SELENIUM_COOKIE)]
+    with patch.object(scraping, "is_linkedin_authenticated", return_value=True), patch.object(
+        pacing.PACING, "budget", 0
+    ), patch.object(
+        scraping, "get_profile_store", return_value=ProfileStore(tmp_path / "profiles.sqlite")
+    ), patch.object(
+        scraping,
+        "get_session_monitor",
+        return_value=SessionMonitor(LinkedInAuthenticator(tmp_path / "session.json")),
+    ):
+        yield scraper, browser
+
+
+class TestPlaywrightScraper:
+    """Test suite for :class:`PlaywrightScraper`."""
+
+    def test_cookie_conversion(self) -> None:
+        """Selenium cookies map onto Playwright's ``add_cookies`` schema."""
+        assert _to_playwright_cookie(SELENIUM_COOKIE) == {
+            "name": "li_at",
+            "value": "token",
+            "domain": ".www.linkedin.com",
+            "path": "/",
+            "secure": True,
+            "httpOnly": True,
+            "expires": 1893456000.0,
+            "sameSite": "None",
+        }
+        assert "sameSite" not in _to_playwright_cookie({"name": "a", "value": "b"})
+
+    @pytest.mark.asyncio
+    async def test_search_matches_selenium_contract(self, fake_scraper) -> None:
+        """Search returns the same dict shape as :func:`search_linkedin`."""
+        scraper, browser = fake_scraper
+
+        profiles = await scraper.search("engineer", max_results=5)
+
+        assert profiles == [scraping._parse_card("https://www.linkedin.com/in/ann", "Ann\nEngineer")]
+        assert browser.contexts[0].cookies[0]["name"] == "li_at"
+        assert browser.open == 0
+
+    @pytest.mark.asyncio
+    async def test_enrich_many_uses_bounded_contexts(self, fake_scraper) -> None:
+        """Each profile gets its own seeded context; at most ``max_pages`` are open."""
+        scraper, browser = fake_scraper
+        urls = [f"https://www.linkedin.com/in/p{i}" for i in range(8)]
+
+        results = await scraper.enrich_many(urls, concurrency=8)
+
+        assert [result["linkedin_url"] for result in results] == urls
+        assert results[3]["name"] == "Person 3"
+        assert len(browser.contexts) == 8
+        assert 1 < browser.peak <= 3
+        assert all(context.cookies for context in browser.contexts)
+
+    @pytest.mark.asyncio
+    async def test_expired_session_without_auto_auth(self, fake_scraper) -> None:
+        """An expired session yields the error dict, like :func:`enrich_profile`."""
+        scraper, _ = fake_scraper
+        with patch.object(scraping, "_page_signed_out", AsyncMock(return_value=True)):
+            result = await scraper.enrich("https://www.linkedin.com/in/x")
+
+        assert "session expired" in result["error"]
+
+
+@pytest.mark.asyncio
+async def test_backend_switch_routes_async_entry_points() -> None:
+    """``SCRAPER_BACKEND=playwright`` sends the async API to the shared scraper."""
+    scraper = AsyncMock()
+    scraper.search.return_value = [{"name": "Ann"}]
+    with patch.object(scraping, "SCRAPER_BACKEND", "playwright"), patch.object(
+        scraping, "get_playwright_scraper", return_value=scraper
+    ):
+        assert await scraping.search_linkedin_async("engineer", 5) == [{"name": "Ann"}]
+        await scraping.enrich_profile_async("https://www.linkedin.com/in/x")
+
+    scraper.search.assert_awaited_once_with("engineer", 5, False, None)
+    scraper.enrich.assert_awaited_once_with("https://www.linkedin.com/in/x", False, True)
+
+
+@pytest.mark.asyncio
+async def test_sourcer_run_uses_the_selected_backend() -> None:
+    """The default single-query ``LinkedInSourcer.run`` scrapes through Playwright when selected."""
+    scraper = AsyncMock()
+    scraper.search.return_value = [scraping._parse_card("https://www.linkedin.com/in/ann", "Ann\nEngineer")]
+    jd = JobDescription(title="Engineer", must_haves=["Python"])
+    with patch.object(scraping, "SCRAPER_BACKEND", "playwright"), patch.object(
+        scraping, "get_playwright_scraper", return_value=scraper
+    ), patch.object(scraping, "search_linkedin") as mock_selenium:
+        result = await LinkedInSourcer().run(jd)
+
+    assert [candidate.name for candidate in result.candidates] == ["Ann"]
+    scraper.search.assert_awaited_once()
+    mock_selenium.assert_not_called()
+
+
+
+def test_scraper_survives_a_new_event_loop(fake_scraper) -> None:
+    """A second ``asyncio.run`` gets fresh primitives and a relaunched browser."""
+    scraper, browser = fake_scraper
+    relaunched = _FakeBrowser()
+    playwright = AsyncMock()
+    playwright.chromium.launch.return_value = relaunched
+    urls = [f"https://www.linkedin.com/in/p{i}" for i in range(6)]
+
+    first = asyncio.run(scraper.enrich_many(urls, concurrency=6, cache=False))
+    with patch("playwright.async_api.async_playwright") as mock_async_playwright, patch.object(
+        scraping, "load_session_cookies", return_value=[SELENIUM_COOKIE]
+    ):
+        mock_async_playwright.return_value.start = AsyncMock(return_value=playwright)
+        second = asyncio.run(scraper.enrich_many(urls, concurrency=6, cache=False))
+
+    assert all("error" not in result for result in first + second)
+    assert len(browser.contexts) == len(relaunched.contexts) == 6
+    assert 1 < relaunched.peak <= 3
@@ -0,0 +1,197 @@
+"""Unit tests for :mod:`sourceress.utils.profile_store` and profile URL canonicalisation."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from sourceress.models import CandidateProfile
+from sourceress.utils import linkedin_api, scraping
+from sourceress.utils.identity import canonical_profile_url
+from sourceress.utils.profile_store import PROFILE_FIELDS, ProfileStore
+
+JANE = "https://www.linkedin.com/in/jane"
+ENRICHED = {
+    "linkedin_url": JANE,
+    "name": "Jane Doe",
+    "title": "CTO",
+    "location": "London",
+    "summary": "Builds teams",
+    "skills": ["python"],
+    "experience": [{"title": "CTO", "company": "Acme"}],
+}
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = ProfileStore(tmp_path / "profiles.sqlite")
+    yield store
+    store.close()
+
+
+class TestCanonicalProfileUrl:
+    """Test suite for :func:`canonical_profile_url`."""
+
+    @pytest.mark.parametrize(
+        "url",
+        [
+            "https://www.linkedin.com/in/jane",
+            "https://www.linkedin.com/in/jane/",
+            "http://uk.linkedin.com/in/Jane?miniProfileUrn=abc#top",
+            "linkedin.com/in/JANE/details/skills/",
+        ],
+    )
+    def test_variants_collapse(self, url: str) -> None:
+        """Hosts, casing, query strings and sub-paths map to one key."""
+        assert canonical_profile_url(url) == JANE
+
+    def test_encoded_slugs(self) -> None:
+        """Percent-encoded slugs are normalised to one encoding."""
+        assert canonical_profile_url("https://www.linkedin.com/in/J%C3%BCrgen") == (
+            "https://www.linkedin.com/in/j%C3%BCrgen"
+        )
+
+    def test_legacy_pub_urls_keep_their_ids(self) -> None:
+        """``/pub/`` paths are normalised but never folded onto ``/in/<name>``."""
+        assert canonical_profile_url("https://m.linkedin.com/pub/Jane/12/345/678/?trk=x") == (
+            "https://www.linkedin.com/pub/jane/12/345/678"
+        )
+        assert canonical_profile_url("https://www.linkedin.com/pub/jane/12/345/678") != JANE
+
+    def test_other_urls_are_only_trimmed(self) -> None:
+        """Non-profile URLs keep their path but lose query and trailing slash."""
+        assert canonical_profile_url("HTTPS://Example.com/Jobs/?id=1") == "https://example.com/Jobs"
+
+
+class TestProfileStore:
+    """Test suite for :class:`ProfileStore`."""
+
+    def test_round_trip_by_canonical_url(self, store) -> None:
+        """Values written under one URL variant are found under another."""
+        store.put("https://uk.linkedin.com/in/Jane/?x=1", ENRICHED, source="profile")
+
+        assert store.get(JANE) == {field: ENRICHED[field] for field in PROFILE_FIELDS}
+        assert store.stats() == {"hits": 1, "misses": 0, "profiles": 1}
+
+    def test_per_field_ttl(self, tmp_path) -> None:
+        """A stale field makes the profile stale while fresh fields stay readable."""
+        store = ProfileStore(tmp_path / "p.sqlite", ttls={"name": 100, "title": 10})
+        with patch("sourceress.utils.profile_store.time.time", return_value=1_000):
+            store.put(JANE, {"name": "Jane", "title": "CTO", "ignored": 1}, source="search")
+        with patch("sourceress.utils.profile_store.time.time", return_value=1_050):
+            assert store.get(JANE, ("name", "title")) is None
+            assert store.get(JANE, ("name",)) == {"name": "Jane"}
+            assert store.fresh_fields([JANE]) == {JANE: {"name": "Jane"}}
+
+    def test_partial_profiles_are_misses(self, store) -> None:
+        """Search-card data alone does not satisfy an enrichment lookup."""
+        store.put(JANE, {"name": "Jane", "title": "CTO", "location": "London"}, source="search")
+
+        assert store.get(JANE) is None
+        assert store.get(JANE, ("name", "title")) == {"name": "Jane", "title": "CTO"}
+
+    def test_get_many_keys_by_input_url(self, store) -> None:
+        """Batch lookups answer under the URLs the caller passed in."""
+        store.put(JANE, ENRICHED, source="profile")
+        variant = "https://www.linkedin.com/in/jane?trk=1"
+
+        found = store.get_many([variant, "https://www.linkedin.com/in/bob"])
+
+        assert list(found) == [variant]
+        assert (store.hits, store.misses) == (1, 1)
+
+
+class TestStoreBackedEnrichment:
+    """Enrichment and search serve fresh entries from the store."""
+
+    @pytest.fixture(autouse=True)
+    def _use_store(self, store):
+        with patch.object(scraping, "get_profile_store", return_value=store), patch.object(
+            linkedin_api, "get_profile_store", return_value=store
+        ):
+            yield
+
+    def test_fresh_profile_skips_browser(self, store) -> None:
+        """A fresh stored profile is returned without touching the driver pool."""
+        store.put(JANE, ENRICHED, source="profile")
+        with patch.object(scraping, "get_driver_pool") as mock_pool:
+            assert scraping.enrich_profile(JANE) == ENRICHED
+        mock_pool.assert_not_called()
+
+    def test_scraped_profile_is_stored(self, store) -> None:
+        """Successful scrapes are recorded; ``cache=False`` forces a visit."""
+        driver = MagicMock()
+        driver.execute_script.return_value = {k: v for k, v in ENRICHED.items() if k != "linkedin_url"}
+        pool = MagicMock()
+        pool.checkout.return_value = driver
+        with patch.object(scraping, "get_driver_pool", return_value=pool), patch.object(
+            scraping, "is_linkedin_authenticated", return_value=True
+        ), patch.object(scraping, "_is_signed_out", return_value=False), patch.object(
+            scraping, "settle", return_value=True
+        ):
+            assert scraping.enrich_profile(JANE) == ENRICHED
+            assert scraping.enrich_profile(JANE) == ENRICHED
+            scraping.enrich_profile(JANE, cache=False)
+
+        assert pool.checkout.call_count == 2
+        assert store.get(JANE) is not None
+
+    def test_placeholder_fields_are_not_stored(self, store) -> None:
+        """A title or location the page did not show is not recorded as fresh."""
+        scraping._store_profile({**ENRICHED, "title": "Unknown", "location": "Unknown"})
+
+        assert store.fresh_fields([JANE])[JANE] == {
+            k: v for k, v in ENRICHED.items() if k not in {"linkedin_url", "title", "location"}
+        }
+        assert store.get(JANE) is None
+
+    def test_enrich_profiles_only_visits_stale(self, store) -> None:
+        """Batch enrichment scrapes only the profiles missing from the store."""
+        store.put(JANE, ENRICHED, source="profile")
+        urls = [JANE, "https://www.linkedin.com/in/bob"]
+        scraped = {"linkedin_url": urls[1], "name": "Bob"}
+        with patch.object(scraping, "is_linkedin_authenticated", return_value=True), patch.object(
+            scraping, "get_driver_pool"
+        ) as mock_pool, patch.object(scraping, "enrich_profile", return_value=scraped) as mock_enrich:
+            results = scraping.enrich_profiles(urls, concurrency=4)
+
+        assert results == [ENRICHED, scraped]
+        # Already known to be stale: the store is not asked again.
+        mock_enrich.assert_called_once_with(urls[1], auto_authenticate=False, cache=True, lookup=False)
+        mock_pool.return_value.grow.assert_called_once_with(1)
+
+    def test_all_fresh_needs_no_session(self, store) -> None:
+        """When everything is stored no session check or browser is needed."""
+        store.put(JANE, ENRICHED, source="profile")
+        with patch.object(scraping, "_ensure_session") as mock_session:
+            assert scraping.enrich_profiles([JANE]) == [ENRICHED]
+        mock_session.assert_not_called()
+
+    def test_fetch_profiles_records_cards_and_fills_details(self, store) -> None:
+        """Search hits are stored and pick up fresh summary/skills."""
+        store.put(JANE, ENRICHED, source="profile")
+        hits = [
+            {"name": "Jane Doe", "linkedin_url": JANE, "title": "VP Eng", "location": "London"},
+            {"name": "Bob", "linkedin_url": "https://www.linkedin.com/in/bob", "title": "Dev", "location": ""},
+        ]
+        with patch.object(linkedin_api, "search_linkedin", return_value=hits), patch.object(
+            linkedin_api, "get_search_cache", return_value=None
+        ):
+            profiles = linkedin_api.fetch_profiles("engineer", limit=2)
+
+        assert profiles[0] == CandidateProfile(
+            name="Jane Doe",
+            linkedin_url=JANE,
+            title="VP Eng",
+            location="London",
+            summary="Builds teams",
+            skills=["python"],
+        )
+        assert profiles[1].summary == ""
+        assert store.get(JANE, ("title",)) == {"title": "VP Eng"}
+        assert store.get("https://www.linkedin.com/in/bob", ("name", "title")) == {
+            "name": "Bob",
+            "title": "Dev",
+        }
+        assert store.get("https://www.linkedin.com/in/bob", ("location",)) is None
@@ -0,0 +1,97 @@
+"""Unit tests for the sourcer's query planner and concurrent fan-out."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from sourceress.agents import LinkedInSourcer
+from sourceress.agents import linkedin_sourcer
+from sourceress.agents.linkedin_sourcer import _build_search_query, _plan_queries
+from sourceress.models import CandidateProfile, JobDescription
+from sourceress.utils import linkedin_api
+from sourceress.utils.identity import CandidateIndex
+from sourceress.utils.linkedin_api import fetch_profiles_fanout
+
+JD = JobDescription(
+    title="Senior Python Developer - Platform",
+    must_haves=["Python", "Django", "PostgreSQL"],
+    location="Remote",
+)
+
+
+class TestPlanQueries:
+    """Test suite for :func:`_plan_queries`."""
+
+    def test_base_query_first_then_distinct_variants(self) -> None:
+        """The plan starts with the single-query search and never repeats itself."""
+        queries = _plan_queries(JD, 6)
+
+        assert queries[0] == _build_search_query(JD)
+        assert len(queries) == len(set(queries)) == 6
+        assert '"Senior Python Engineer" AND ("python" OR "django") AND "Remote"' in queries
+        assert '"Senior Python Developer" AND ("python" OR "postgresql") AND "Remote"' in queries
+        assert '"Senior Python Developer" AND ("python" OR "django")' in queries
+
+    def test_single_query_plan(self) -> None:
+        """One variant means the base query only."""
+        assert _plan_queries(JD, 1) == [_build_search_query(JD)]
+
+    def test_sparse_job_descriptions(self) -> None:
+        """Without skills or location only title variants remain."""
+        jd = JobDescription(title="Data Engineer", must_haves=[])
+        assert _plan_queries(jd, 5) == ['"Data Engineer"', '"Data Developer"']
+
+
+class TestFanout:
+    """Test suite for :func:`fetch_profiles_fanout`."""
+
+    @pytest.fixture(autouse=True)
+    def _isolate(self):
+        with patch.object(linkedin_api, "get_profile_store", return_value=None), patch.object(
+            linkedin_api, "get_driver_pool"
+        ), patch.object(linkedin_api, "get_candidate_index", return_value=CandidateIndex()), patch.object(
+            linkedin_api, "get_search_cache", return_value=None
+        ):
+            yield
+
+    @pytest.mark.asyncio
+    async def test_merges_with_global_dedup(self, fake_search) -> None:
+        """Hits from all queries are merged once per person, across URL forms."""
+        search = fake_search({"a": ["ann", "bob"], "b": ["Bob", "cat"], "c": ["ann", "dan"]}, delay=0.001)
+        with patch.object(linkedin_api, "search_linkedin_async", search):
+            profiles = await fetch_profiles_fanout(["a", "b", "c"], target=10)
+
+        assert sorted(p.name for p in profiles) == ["Ann", "Bob", "Cat", "Dan"]
+
+    @pytest.mark.asyncio
+    async def test_stops_at_target(self, fake_search) -> None:
+        """Reaching the target stops running searches and skips queued ones."""
+        many = [f"p{i}" for i in range(40)]
+        search = fake_search({"a": many, "b": [f"q{i}" for i in range(40)], "c": ["late"]}, delay=0.001)
+        with patch.object(linkedin_api, "search_linkedin_async", search):
+            profiles = await fetch_profiles_fanout(["a", "b", "c"], target=10, concurrency=2)
+
+        assert len(profiles) == 10
+        assert search.total < 20
+        assert "c" not in search.emitted
+
+
+class TestSourcerFanout:
+    """``LinkedInSourcer.run`` with a query plan."""
+
+    @pytest.mark.asyncio
+    async def test_run_fans_out_when_asked(self) -> None:
+        """``query_variants`` routes through the fan-out instead of one search."""
+        found = [CandidateProfile(name="Ann", linkedin_url="https://www.linkedin.com/in/ann")]
+        with patch.object(
+            linkedin_sourcer, "fetch_profiles_fanout", AsyncMock(return_value=found)
+        ) as mock_fanout, patch.object(linkedin_sourcer, "fetch_profiles_async") as mock_fetch:
+            result = await LinkedInSourcer().run(JD, query_variants=4, target=30)
+
+        assert result.candidates == found
+        mock_fetch.assert_not_called()
+        queries = mock_fanout.await_args.args[0]
+        assert queries == _plan_queries(JD, 4)
+        assert mock_fanout.await_args.kwargs == {"target": 30}
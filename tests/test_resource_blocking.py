@@ -0,0 +1,133 @@
+"""Unit tests for :mod:`sourceress.utils.resource_blocking`."""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from sourceress.utils import linkedin_auth, resource_blocking
+from sourceress.utils.resource_blocking import BlockPolicy, apply_to_driver, route_context
+
+
+class TestBlockPolicy:
+    """Test suite for :class:`BlockPolicy`."""
+
+    def test_blocks_by_type_and_domain(self) -> None:
+        """Listed resource types and (sub)domains are dropped; page content is not."""
+        policy = BlockPolicy()
+
+        assert policy.blocks("https://media.licdn.com/dms/image/abc", "image")
+        assert policy.blocks("https://www.linkedin.com/fonts/x.woff2", "font")
+        assert policy.blocks("https://px.ads.linkedin.com/collect?x=1", "xhr")
+        assert policy.blocks("https://stats.g.doubleclick.net/r", None)
+        assert not policy.blocks("https://www.linkedin.com/search/results/people/", "document")
+        assert not policy.blocks("https://static.licdn.com/sc/h/app.js", "script")
+        assert not policy.blocks("https://notdoubleclick.net/x", "script")
+
+    def test_disabled_policy_is_a_no_op(self) -> None:
+        """A disabled policy blocks nothing and installs nothing."""
+        policy = BlockPolicy(enabled=False)
+
+        assert not policy.blocks("https://doubleclick.net/x", "image")
+        assert policy.url_patterns() == []
+        assert policy.chrome_arguments() == []
+
+    def test_from_env(self, monkeypatch) -> None:
+        """Types and domains are configurable; an explicit domain list replaces the default."""
+        monkeypatch.setenv("SCRAPER_BLOCK_TYPES", "Image, stylesheet")
+        monkeypatch.setenv("SCRAPER_BLOCK_DOMAINS", "tracker.example")
+        monkeypatch.setenv("SCRAPER_BLOCKING", "1")
+
+        policy = BlockPolicy.from_env()
+
+        assert policy.resource_types == {"image", "stylesheet"}
+        assert policy.domains == {"tracker.example"}
+        assert policy.url_patterns()[:2] == ["*://tracker.example/*", "*://*.tracker.example/*"]
+        assert "*.css*" in policy.url_patterns()
+
+    def test_chrome_arguments_disable_images(self) -> None:
+        """Image blocking also switches off Blink's image loading."""
+        assert BlockPolicy().chrome_arguments() == ["--blink-settings=imagesEnabled=false"]
+        assert BlockPolicy(resource_types=frozenset({"font"})).chrome_arguments() == []
+
+
+class TestApplyToDriver:
+    """Test suite for the Selenium/CDP path."""
+
+    def test_sets_blocked_urls_over_cdp(self) -> None:
+        """The policy's patterns are sent with ``Network.setBlockedURLs``."""
+        driver = MagicMock()
+        policy = BlockPolicy(domains=frozenset({"ads.example"}), resource_types=frozenset({"font"}))
+
+        apply_to_driver(driver, policy)
+
+        assert driver.execute_cdp_cmd.call_args_list[0].args == ("Network.enable", {})
+        method, params = driver.execute_cdp_cmd.call_args_list[1].args
+        assert method == "Network.setBlockedURLs"
+        assert "*://*.ads.example/*" in params["urls"] and "*.woff2*" in params["urls"]
+
+    def test_cdp_failure_is_not_fatal(self) -> None:
+        """Drivers without CDP support keep working, just without blocking."""
+        driver = MagicMock()
+        driver.execute_cdp_cmd.side_effect = RuntimeError("no cdp")
+        apply_to_driver(driver, BlockPolicy())
+
+    def test_authenticated_drivers_are_blocked(self, tmp_path: Path) -> None:
+        """Every driver from ``get_authenticated_driver`` gets the policy before loading pages."""
+        auth = linkedin_auth.LinkedInAuthenticator(session_file=tmp_path / "session.json")
+        auth.save_cookies([{"name": "li_at", "value": "token", "expiry": time.time() + 3600}])
+        driver = MagicMock()
+        calls: list[str] = []
+        driver.execute_cdp_cmd.side_effect = lambda method, _: calls.append(method)
+        driver.get.side_effect = lambda url: calls.append(f"get {url}")
+
+        with patch("undetected_chromedriver.Chrome", return_value=driver) as mock_chrome, patch.object(
+            linkedin_auth, "wait_until_settled", return_value=(0.0, True)
+        ), patch.object(
+            linkedin_auth, "get_block_policy", return_value=BlockPolicy()
+        ):
+            assert auth.get_authenticated_driver() is driver
+
+        assert calls[:3] == ["Network.enable", "Network.setBlockedURLs", "get https://www.linkedin.com"]
+        options = mock_chrome.call_args.kwargs["options"]
+        assert "--blink-settings=imagesEnabled=false" in options.arguments
+
+
+class TestRouteContext:
+    """Test suite for the Playwright routing path."""
+
+    @pytest.mark.asyncio
+    async def test_aborts_matching_requests(self) -> None:
+        """Blocked requests are aborted, everything else continues."""
+        context = MagicMock()
+        context.route = AsyncMock()
+        await route_context(context, BlockPolicy())
+        pattern, handler = context.route.await_args.args
+        assert pattern == "**/*"
+
+        def _route(url: str, resource_type: str) -> MagicMock:
+            route = MagicMock(abort=AsyncMock(), continue_=AsyncMock())
+            route.request = SimpleNamespace(url=url, resource_type=resource_type)
+            return route
+
+        image = _route("https://media.licdn.com/x", "image")
+        page = _route("https://www.linkedin.com/in/jane", "document")
+        await handler(image)
+        await handler(page)
+
+        image.abort.assert_awaited_once()
+        page.continue_.assert_awaited_once()
+        page.abort.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_disabled_policy_installs_no_route(self) -> None:
+        """With blocking off no route handler is registered."""
+        context = MagicMock()
+        context.route = AsyncMock()
+        with patch.object(resource_blocking, "_POLICY", BlockPolicy(enabled=False)):
+            await route_context(context)
+        context.route.assert_not_awaited()
@@ -0,0 +1,227 @@
+"""Unit tests for the LinkedIn search result cache (:mod:`sourceress.utils.search_cache`)."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from sourceress.utils import linkedin_api
+from sourceress.utils.linkedin_api import fetch_profiles, iter_profiles
+from sourceress.utils.search_cache import SearchCache, canonical_query
+
+HITS = [
+    {"name": "Ada", "linkedin_url": "https://www.linkedin.com/in/ada", "title": "Engineer", "location": "London"},
+    {"name": "Bob", "linkedin_url": "https://www.linkedin.com/in/bob", "title": "Designer", "location": "Paris"},
+]
+
+
+class TestCanonicalQuery:
+    """Test suite for :func:`canonical_query`."""
+
+    @pytest.mark.parametrize(
+        "spelling",
+        [
+            '"Backend Engineer" AND ("python" OR "django") AND "Berlin"',
+            '"berlin" AND ("Django" OR "Python") AND "backend  engineer"',
+            '("python" OR "django") "Backend Engineer" AND ("Berlin")',
+            '"Backend Engineer" AND ("python" OR "django" OR "python") AND "Berlin" AND "berlin"',
+        ],
+    )
+    def test_equivalent_spellings_share_a_form(self, spelling) -> None:
+        """Operand order, case, spacing, duplicates and redundant grouping are ignored."""
+        assert canonical_query(spelling) == '"backend engineer" AND "berlin" AND ("django" OR "python")'
+
+    def test_precedence_is_kept(self) -> None:
+        """``AND`` binds tighter than ``OR``, and ``NOT`` tighter than both."""
+        assert canonical_query("a OR b AND c") == "(b AND c) OR a"
+        assert canonical_query("(a OR b) AND c") == "(a OR b) AND c"
+        assert canonical_query("c NOT (b OR a)") == "NOT (a OR b) AND c"
+
+    def test_quoted_phrases_stay_phrases(self) -> None:
+        """A quoted phrase is not the same query as its bare words."""
+        assert canonical_query('"data engineer"') != canonical_query("data engineer")
+
+    def test_malformed_queries_fall_back(self) -> None:
+        """Unbalanced input is only case- and whitespace-normalised."""
+        assert canonical_query('"Data  Engineer" AND (python') == '"data engineer" and (python'
+
+
+class TestSearchCache:
+    """Test suite for :class:`SearchCache`."""
+
+    def test_keys_by_result_count(self, tmp_path) -> None:
+        """A search cached for 10 results does not answer a request for 50."""
+        cache = SearchCache(tmp_path / "search.sqlite")
+        cache.store("engineer", 10, HITS)
+
+        assert cache.lookup("Engineer", 10).cards == HITS
+        assert cache.lookup("engineer", 50) is None
+
+    def test_empty_results_are_not_cached(self, tmp_path) -> None:
+        """A search that found nothing (or failed) is retried next time."""
+        cache = SearchCache(tmp_path / "search.sqlite")
+        cache.store("engineer", 10, [])
+
+        assert cache.lookup("engineer", 10) is None
+        assert cache.stats()["entries"] == 0
+
+    def test_fresh_stale_and_expired(self, tmp_path) -> None:
+        """Entries past the TTL are served as stale; past ``max_stale`` they are gone."""
+        path = tmp_path / "search.sqlite"
+        SearchCache(path).store("engineer", 10, HITS)
+
+        assert SearchCache(path, ttl=3600).lookup("engineer", 10).stale is False
+        assert SearchCache(path, ttl=0, max_stale=3600).lookup("engineer", 10).stale is True
+        assert SearchCache(path, ttl=0, max_stale=0).lookup("engineer", 10) is None
+
+    def test_one_refresh_per_key(self, tmp_path) -> None:
+        """Concurrent stale hits start a single background search."""
+        cache = SearchCache(tmp_path / "search.sqlite")
+        release = threading.Event()
+        calls = []
+
+        def slow_search():
+            calls.append(1)
+            release.wait(5)
+            return HITS
+
+        assert cache.revalidate("engineer", 10, slow_search) is True
+        assert cache.revalidate("ENGINEER", 10, slow_search) is False
+        release.set()
+
+        assert cache.wait(5) == 0
+        assert calls == [1]
+        assert cache.lookup("engineer", 10).cards == HITS
+
+    def test_refreshes_are_bounded_and_awaitable(self, tmp_path) -> None:
+        """No more than ``max_refreshes`` run at once, and :meth:`wait` reports stragglers."""
+        cache = SearchCache(tmp_path / "search.sqlite", max_refreshes=1)
+        release = threading.Event()
+
+        assert cache.revalidate("engineer", 10, lambda: release.wait(5) and HITS) is True
+        assert cache.revalidate("designer", 10, lambda: HITS) is False
+        assert cache.wait(0.01) == 1
+
+        release.set()
+        assert cache.wait(5) == 0
+        assert cache.revalidate("designer", 10, lambda: HITS) is True
+
+
+class TestCachedSearches:
+    """``fetch_profiles`` and ``iter_profiles`` read through the cache."""
+
+    @pytest.fixture(autouse=True)
+    def _isolate(self):
+        with patch.object(linkedin_api, "get_profile_store", return_value=None):
+            yield
+
+    def test_repeat_search_skips_the_browser(self, tmp_path) -> None:
+        """The second, differently spelled search is answered from the cache."""
+        cache = SearchCache(tmp_path / "search.sqlite")
+        with patch.object(linkedin_api, "get_search_cache", return_value=cache), patch.object(
+            linkedin_api, "search_linkedin", return_value=HITS
+        ) as mock_search:
+            first = fetch_profiles('"Engineer" AND "London"', limit=2)
+            second = fetch_profiles('"london" AND "engineer"', limit=2)
+
+        mock_search.assert_called_once()
+        assert second == first
+        assert [p.name for p in second] == ["Ada", "Bob"]
+        assert cache.stats() == {"hits": 1, "stale_hits": 0, "misses": 1, "entries": 1}
+
+    def test_stale_hit_is_served_and_refreshed(self, tmp_path) -> None:
+        """A stale entry answers at once while a background search replaces it."""
+        cache = SearchCache(tmp_path / "search.sqlite", ttl=0)
+        cache.store("engineer", 2, HITS[:1])
+        refreshed = threading.Event()
+
+        def fresh_search(query, max_results):
+            refreshed.set()
+            return HITS
+
+        with patch.object(linkedin_api, "get_search_cache", return_value=cache), patch.object(
+            linkedin_api, "search_linkedin", side_effect=fresh_search
+        ):
+            profiles = fetch_profiles("engineer", limit=2)
+            assert refreshed.wait(5)
+            cache.wait(5)
+
+        assert [p.name for p in profiles] == ["Ada"]
+        assert [card["name"] for card in cache.lookup("engineer", 2).cards] == ["Ada", "Bob"]
+
+    @pytest.mark.asyncio
+    async def test_async_refresh_uses_the_active_engine(self, tmp_path) -> None:
+        """Stale hits on the async path refresh through ``search_linkedin_async`` on the caller's loop."""
+        cache = SearchCache(tmp_path / "search.sqlite", ttl=0)
+        cache.store("engineer", 2, HITS[:1])
+        loops = []
+
+        async def fake_search(query, max_results=50, auto_authenticate=False, on_card=None):
+            loops.append(asyncio.get_running_loop())
+            return HITS
+
+        with patch.object(linkedin_api, "get_search_cache", return_value=cache), patch.object(
+            linkedin_api, "search_linkedin_async", fake_search
+        ), patch.object(linkedin_api, "search_linkedin") as mock_selenium:
+            profiles = await linkedin_api.fetch_profiles_async("engineer", limit=2)
+            assert await asyncio.to_thread(cache.wait, 5) == 0
+
+        assert [p.name for p in profiles] == ["Ada"]
+        assert loops == [asyncio.get_running_loop()]
+        mock_selenium.assert_not_called()
+        assert [card["name"] for card in cache.lookup("engineer", 2).cards] == ["Ada", "Bob"]
+
+    @pytest.mark.asyncio
+    async def test_stream_replays_cached_cards(self, tmp_path) -> None:
+        """A streamed search is cached, and the next stream replays it without searching."""
+        cache = SearchCache(tmp_path / "search.sqlite")
+        calls = []
+
+        async def fake_search(query, max_results=50, auto_authenticate=False, on_card=None):
+            calls.append(query)
+            for card in HITS:
+                await on_card(card)
+            return HITS
+
+        with patch.object(linkedin_api, "get_search_cache", return_value=cache), patch.object(
+            linkedin_api, "search_linkedin_async", fake_search
+        ):
+            first = [p.name async for p in iter_profiles("engineer", limit=2)]
+            second = [p.name async for p in iter_profiles("Engineer", limit=2)]
+
+        assert first == second == ["Ada", "Bob"]
+        assert calls == ["engineer"]
+
+    @pytest.mark.asyncio
+    async def test_interrupted_stream_is_not_cached(self, tmp_path) -> None:
+        """A stream closed early holds a partial result, which is not stored."""
+        cache = SearchCache(tmp_path / "search.sqlite")
+
+        async def fake_search(query, max_results=50, auto_authenticate=False, on_card=None):
+            for card in HITS:
+                if await on_card(card) is False:
+                    break
+            return HITS
+
+        with patch.object(linkedin_api, "get_search_cache", return_value=cache), patch.object(
+            linkedin_api, "search_linkedin_async", fake_search
+        ):
+            async for _ in iter_profiles("engineer", limit=2, buffer=1):
+                break
+
+        assert cache.lookup("engineer", 2) is None
+
+    def test_cache_errors_fall_back_to_searching(self) -> None:
+        """A broken cache never fails the search."""
+        cache = MagicMock()
+        cache.lookup.side_effect = OSError("disk full")
+        cache.store.side_effect = OSError("disk full")
+        with patch.object(linkedin_api, "get_search_cache", return_value=cache), patch.object(
+            linkedin_api, "search_linkedin", return_value=HITS
+        ):
+            profiles = fetch_profiles("engineer", limit=2)
+
+        assert [p.name for p in profiles] == ["Ada", "Bob"]
@@ -0,0 +1,154 @@
+"""Unit tests for the LinkedIn cookie jar and :class:`SessionMonitor`."""
+
+from __future__ import annotations
+
+import json
+import pickle
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from sourceress.utils import scraping
+from sourceress.utils.linkedin_auth import (
+    LinkedInAuthenticator,
+    SessionMonitor,
+    is_auth_redirect,
+)
+
+PROFILE = "https://www.linkedin.com/in/jane"
+
+
+def _login_cookie(expires_in: float | None) -> dict:
+    cookie = {"name": "li_at", "value": "token", "domain": ".linkedin.com", "path": "/"}
+    if expires_in is not None:
+        cookie["expiry"] = int(time.time() + expires_in)
+    return cookie
+
+
+@pytest.fixture
+def auth(tmp_path):
+    return LinkedInAuthenticator(session_file=tmp_path / ".linkedin_session.json")
+
+
+class TestCookieJar:
+    """Test suite for the JSON session jar."""
+
+    def test_round_trip_is_inspectable_json(self, auth) -> None:
+        """Cookies are written as versioned JSON readable by the owner only."""
+        cookies = [_login_cookie(3600), {"name": "JSESSIONID", "value": "x"}]
+        auth.save_cookies(cookies)
+
+        jar = json.loads(auth.session_file.read_text())
+        assert jar["version"] == 1 and jar["cookies"] == cookies
+        assert auth.session_file.stat().st_mode & 0o777 == 0o600
+        assert auth.load_cookies() == cookies
+
+    def test_legacy_pickle_is_converted(self, auth) -> None:
+        """A pickle from older versions is read once and replaced by the JSON jar."""
+        cookies = [_login_cookie(3600)]
+        legacy = auth.legacy_file
+        assert legacy is not None and legacy.name == ".linkedin_session"
+        legacy.write_bytes(pickle.dumps(cookies))
+
+        assert auth.load_cookies() == cookies
+        assert not legacy.exists()
+        assert json.loads(auth.session_file.read_text())["cookies"] == cookies
+
+    @pytest.mark.parametrize(
+        ("cookies", "status"),
+        [
+            ([_login_cookie(7200)], "ok"),
+            ([_login_cookie(600)], "expiring"),
+            ([_login_cookie(-60)], "expired"),
+            ([_login_cookie(None)], "ok"),
+            ([{"name": "JSESSIONID", "value": "x"}], "missing"),
+        ],
+    )
+    def test_session_health(self, auth, cookies, status) -> None:
+        """Health follows the ``li_at`` expiry."""
+        auth.save_cookies(cookies)
+        health = auth.session_health(margin=3600)
+
+        assert health.status == status
+        assert auth.has_valid_session() is (status != "expired" and status != "missing")
+
+    def test_missing_or_corrupt_jar(self, auth) -> None:
+        """No jar, or an unreadable one, is not a valid session."""
+        assert auth.session_health().status == "missing"
+        auth.session_file.write_text("{not json")
+        assert not auth.has_valid_session()
+
+
+class TestSessionMonitor:
+    """Test suite for :class:`SessionMonitor`."""
+
+    @pytest.fixture
+    def monitor(self, auth):
+        auth.save_cookies([_login_cookie(30 * 24 * 3600)])
+        return SessionMonitor(auth, interval=300, expiry_margin=3600)
+
+    def test_redirects_are_decided_from_the_url(self, monitor) -> None:
+        """Login, authwall and challenge pages mean signed out without a probe."""
+        assert monitor.assess(PROFILE, "https://www.linkedin.com/authwall?trk=x") is True
+        assert monitor.assess(PROFILE, "https://www.linkedin.com/checkpoint/challenge/abc") is True
+        assert monitor.stats() == {"probes": 0, "skipped": 0}
+
+    def test_probe_only_on_suspicion(self, monitor) -> None:
+        """After one confirming probe, pages that land where they were sent skip it."""
+        assert monitor.assess(PROFILE, PROFILE) is None
+        monitor.record_probe(False)
+
+        assert monitor.assess(PROFILE, f"{PROFILE}/") is False
+        assert monitor.assess(PROFILE, "https://www.linkedin.com/feed/") is None
+        assert monitor.stats() == {"probes": 2, "skipped": 1}
+
+    def test_periodic_reprobe(self, monitor) -> None:
+        """A confirmation older than the interval triggers another probe."""
+        monitor.record_probe(False)
+        with patch("sourceress.utils.linkedin_auth.time.monotonic", return_value=time.monotonic() + 301):
+            assert monitor.assess(PROFILE, PROFILE) is None
+
+    def test_expiring_cookie_is_suspect(self, auth) -> None:
+        """Within the expiry margin every navigation is probed."""
+        auth.save_cookies([_login_cookie(600)])
+        monitor = SessionMonitor(auth, interval=300, expiry_margin=3600)
+        monitor.record_probe(False)
+
+        assert monitor.assess(PROFILE, PROFILE) is None
+
+    def test_signed_out_probe_and_reset_clear_confirmation(self, monitor) -> None:
+        """A failed probe or a re-authentication forces the next probe."""
+        monitor.record_probe(False)
+        monitor.record_probe(True)
+        assert monitor.assess(PROFILE, PROFILE) is None
+
+        monitor.record_probe(False)
+        monitor.reset()
+        assert monitor.assess(PROFILE, PROFILE) is None
+
+    def test_search_keywords_are_not_redirects(self) -> None:
+        """Only the path counts, so a search for "login" is not an auth redirect."""
+        assert not is_auth_redirect("https://www.linkedin.com/search/results/people/?keywords=login")
+        assert is_auth_redirect("https://www.linkedin.com/login?session_redirect=%2Fin%2Fjane")
+
+
+class TestSessionLost:
+    """:func:`scraping._session_lost` runs the DOM scan only when asked to."""
+
+    def test_probes_only_on_suspicion(self, auth) -> None:
+        """Consecutive healthy navigations scan the DOM once; redirects need no scan."""
+        auth.save_cookies([_login_cookie(30 * 24 * 3600)])
+        monitor = SessionMonitor(auth)
+        driver = MagicMock()
+        driver.current_url = PROFILE
+
+        with patch.object(scraping, "get_session_monitor", return_value=monitor), patch.object(
+            scraping, "_is_signed_out", return_value=False
+        ) as mock_probe:
+            assert not scraping._session_lost(driver, PROFILE)
+            assert not scraping._session_lost(driver, PROFILE)
+            driver.current_url = "https://www.linkedin.com/login"
+            assert scraping._session_lost(driver, PROFILE)
+
+        mock_probe.assert_called_once_with(driver)
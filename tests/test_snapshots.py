@@ -0,0 +1,182 @@
+"""Unit tests for snapshot capture and offline parsing in :mod:`sourceress.utils.snapshots`."""
+
+from __future__ import annotations
+
+import gzip
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+pytest.importorskip("lxml")
+
+from sourceress.utils import scraping, snapshots  # noqa: E402
+
+SEARCH_HTML = """<html><body><main><ul>
+<li><div data-chameleon-result-urn="urn:li:member:1">
+  <div><a href="/in/jane?miniProfile=1">
+    <span>Jane   Doe</span></a></div><div>View Jane Doe's profile</div>
+  <div>• 2nd degree connection</div>
+  <div class="t-14">Senior Data Engineer @ Acme</div>
+  <div>Greater London Area</div>
+  <script>tracking()</script>
+  <button>Connect</button>
+</div></li>
+<li><div data-chameleon-result-urn="urn:li:member:2">
+  <div><a href="https://www.linkedin.com/in/bob"><span>Bob Roe</span></a></div>
+  <p>Current: Lead Designer at Studio</p>
+</div></li>
+<li><div data-chameleon-result-urn="urn:li:member:1">
+  <div><a href="/in/jane?miniProfile=1">Jane Doe</a></div><div>Engineer</div>
+</div></li>
+<li><div data-chameleon-result-urn="urn:li:ad:9"><div>Sponsored</div></div></li>
+</ul></main></body></html>"""
+
+PROFILE_HTML = """<html><body>
+<h1 class="text-heading-xlarge inline">Jane Doe</h1>
+<div class="text-body-medium break-words">Senior Data Engineer</div>
+<span class="text-body-small inline t-black--light">London, England</span>
+<div class="pv-shared-text-with-see-more">Builds <b>pipelines</b>.</div>
+<span class="pv-skill-category-entity__name">Python</span>
+<span class="pv-skill-category-entity__name">SQL</span>
+<div class="pv-entity__summary-info"><h3>Data Engineer</h3>
+  <p class="pv-entity__secondary-title">Acme</p></div>
+<div class="pv-entity__summary-info"><h3>Intern</h3></div>
+</body></html>"""
+
+
+class TestSnapshotFiles:
+    """Test suite for saving and loading snapshots."""
+
+    def test_round_trip(self, tmp_path) -> None:
+        """Snapshots are gzip files that load back with their metadata."""
+        path = snapshots.save_snapshot("search", "https://x/search?q=1", SEARCH_HTML, tmp_path)
+
+        assert path.parent == tmp_path / "search"
+        assert path.name.endswith(".html.gz")
+        with gzip.open(path, "rt") as fh:
+            assert fh.readline().startswith("<!-- sourceress-snapshot ")
+
+        snapshot = snapshots.load_snapshot(path)
+        assert (snapshot.kind, snapshot.url, snapshot.html) == (
+            "search",
+            "https://x/search?q=1",
+            SEARCH_HTML,
+        )
+        assert list(snapshots.iter_snapshots(tmp_path, "search")) == [path]
+        assert list(snapshots.iter_snapshots(tmp_path, "profile")) == []
+
+    def test_rejects_foreign_files(self, tmp_path) -> None:
+        """Arbitrary gzip files are not mistaken for snapshots."""
+        path = tmp_path / "other.html.gz"
+        with gzip.open(path, "wt") as fh:
+            fh.write("<html></html>")
+
+        with pytest.raises(ValueError, match="not a sourceress snapshot"):
+            snapshots.load_snapshot(path)
+
+
+class TestParsing:
+    """Test suite for the lxml parsers."""
+
+    def test_search_matches_live_card_parsing(self) -> None:
+        """Search snapshots yield the dicts ``_parse_card`` builds from live cards."""
+        profiles = snapshots.parse_search_html(SEARCH_HTML)
+
+        assert profiles == [
+            {
+                "name": "Jane Doe",
+                "linkedin_url": "https://www.linkedin.com/in/jane",
+                "title": "Senior Data Engineer @ Acme",
+                "location": "Greater London Area",
+                "summary": "",
+                "skills": [],
+            },
+            {
+                "name": "Bob Roe",
+                "linkedin_url": "https://www.linkedin.com/in/bob",
+                "title": "Lead Designer at Studio",
+                "location": "",
+                "summary": "",
+                "skills": [],
+            },
+        ]
+
+    def test_inner_text_lines(self) -> None:
+        """Block elements break lines; scripts are skipped and whitespace collapsed."""
+        doc = snapshots._document(SEARCH_HTML)
+        card = doc.xpath(snapshots._CARD_XPATH)[0]
+
+        assert snapshots._inner_text(card).splitlines() == [
+            "Jane Doe",
+            "View Jane Doe's profile",
+            "• 2nd degree connection",
+            "Senior Data Engineer @ Acme",
+            "Greater London Area",
+            "Connect",
+        ]
+
+    def test_profile_matches_enrich_profile(self) -> None:
+        """Profile snapshots yield the dict ``enrich_profile`` returns."""
+        profile = snapshots.parse_profile_html(PROFILE_HTML, "https://www.linkedin.com/in/jane")
+
+        assert profile == {
+            "linkedin_url": "https://www.linkedin.com/in/jane",
+            "name": "Jane Doe",
+            "title": "Senior Data Engineer",
+            "location": "London, England",
+            "summary": "Builds pipelines.",
+            "skills": ["Python", "SQL"],
+            "experience": [{"title": "Data Engineer", "company": "Acme"}],
+        }
+
+    def test_missing_fields_use_defaults(self) -> None:
+        """Empty pages fall back to the same defaults as the live scraper."""
+        profile = snapshots.parse_profile_html("<html><body></body></html>", "u")
+        assert profile["name"] == profile["title"] == profile["location"] == "Unknown"
+        assert profile["skills"] == profile["experience"] == []
+
+    def test_process_pool_keeps_order(self, tmp_path) -> None:
+        """``parse_snapshots`` returns one result per file, in input order."""
+        paths = [
+            snapshots.save_snapshot("profile", f"https://www.linkedin.com/in/p{i}", PROFILE_HTML, tmp_path)
+            for i in range(3)
+        ]
+        paths.insert(1, snapshots.save_snapshot("search", "https://x/s", SEARCH_HTML, tmp_path))
+
+        results = snapshots.parse_snapshots(paths, workers=2, chunksize=1)
+
+        assert [result["kind"] for result in results] == ["profile", "search", "profile", "profile"]
+        assert len(results[1]["data"]) == 2
+        assert results[3]["data"]["linkedin_url"] == "https://www.linkedin.com/in/p2"
+
+
+class TestCapture:
+    """Test suite for snapshot capture from the live scraper."""
+
+    def test_enrich_profile_saves_snapshot(self, tmp_path) -> None:
+        """With a snapshot directory set, profile pages are written to disk."""
+        driver = MagicMock(page_source=PROFILE_HTML)
+        driver.execute_script.return_value = {"name": "Jane Doe"}
+        pool = MagicMock()
+        pool.checkout.return_value = driver
+
+        with patch.object(snapshots, "SNAPSHOT_DIR", str(tmp_path)), patch.object(
+            scraping, "get_driver_pool", return_value=pool
+        ), patch.object(scraping, "is_linkedin_authenticated", return_value=True), patch.object(
+            scraping, "_is_signed_out", return_value=False
+        ), patch.object(scraping, "settle", return_value=True):
+            scraping.enrich_profile("https://www.linkedin.com/in/jane", cache=False)
+
+        (path,) = snapshots.iter_snapshots(tmp_path, "profile")
+        snapshot = snapshots.load_snapshot(path)
+        assert snapshot.url == "https://www.linkedin.com/in/jane"
+        assert snapshot.html == PROFILE_HTML
+
+    def test_capture_is_off_by_default(self, tmp_path) -> None:
+        """Without a snapshot directory nothing is read from the driver."""
+        driver = MagicMock()
+        with patch.object(snapshots, "SNAPSHOT_DIR", None), patch.object(
+            snapshots, "save_snapshot"
+        ) as mock_save:
+            scraping._capture("profile", "u", driver)
+        mock_save.assert_not_called()
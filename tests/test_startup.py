@@ -0,0 +1,74 @@
+"""Import-time regression tests for the CLI entry point."""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+#: Seconds allowed for ``import sourceress.main`` in a fresh interpreter.
+IMPORT_BUDGET_S = 1.0
+
+#: Modules that must only load once a code path actually needs them.
+HEAVY_MODULES = ("crewai", "selenium", "undetected_chromedriver", "transformers", "aiohttp")
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"elapsed": elapsed, "modules": sorted(sys.modules)}}))
+"""
+
+
+def _probe(module: str) -> dict:
+    result = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(module=module)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout)
+
+
+class TestStartup:
+    """Cold-start budget and lazy-import guarantees."""
+
+    def test_cli_import_within_budget(self) -> None:
+        """Importing the CLI module stays under the cold-start budget."""
+        probe = _probe("sourceress.main")
+        assert probe["elapsed"] < IMPORT_BUDGET_S
+
+    @pytest.mark.parametrize(
+        "module", ["sourceress", "sourceress.main", "sourceress.utils.linkedin_api"]
+    )
+    def test_heavy_dependencies_not_imported(self, module: str) -> None:
+        """crewai, selenium & co. are not pulled in at import time."""
+        loaded = set(_probe(module)["modules"])
+        assert not loaded & set(HEAVY_MODULES)
+
+    def test_version_flag(self) -> None:
+        """``python -m sourceress --version`` works without the agent stack."""
+        from sourceress import __version__
+
+        result = subprocess.run(
+            [sys.executable, "-m", "sourceress", "--version"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert __version__ in result.stdout
+
+    def test_lazy_attributes_resolve(self) -> None:
+        """Lazily exported names still resolve on access."""
+        import sourceress
+        from sourceress.agents import JDIngestor
+        from sourceress.agents.jd_ingestor import JDIngestor as Direct
+
+        assert JDIngestor is Direct
+        assert sourceress.agents.JDIngestor is Direct
+        assert "JDIngestor" in dir(sourceress.agents)
+        with pytest.raises(AttributeError):
+            sourceress.agents.Missing  # noqa: B018
@@ -0,0 +1,190 @@
+"""Unit tests for streaming search results (:func:`iter_profiles`, ``LinkedInSourcer.stream``)."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import aclosing
+from unittest.mock import patch
+
+import pytest
+
+from sourceress.agents import LinkedInSourcer
+from sourceress.agents import linkedin_sourcer
+from sourceress.agents.linkedin_sourcer import _build_search_query
+from sourceress.models import JobDescription
+from sourceress.utils import linkedin_api, scraping
+from sourceress.utils.identity import CandidateIndex
+from sourceress.utils.linkedin_api import iter_profiles
+
+
+def _slugs(n: int) -> list[str]:
+    return [f"person-{i}" for i in range(n)]
+
+
+@pytest.fixture(autouse=True)
+def _no_store():
+    with patch.object(linkedin_api, "get_profile_store", return_value=None), patch.object(
+        linkedin_sourcer, "get_candidate_index", return_value=CandidateIndex()
+    ), patch.object(linkedin_api, "get_search_cache", return_value=None):
+        yield
+
+
+class TestIterProfiles:
+    """Test suite for :func:`iter_profiles`."""
+
+    @pytest.mark.asyncio
+    async def test_yields_validated_profiles_in_order(self, fake_search) -> None:
+        """Cards are normalised like ``fetch_profiles`` and unusable ones dropped."""
+        cards = _slugs(3)
+        cards.insert(1, {"name": "Unknown", "linkedin_url": "https://www.linkedin.com/in/x", "title": "Dev"})
+        with patch.object(linkedin_api, "search_linkedin_async", fake_search(cards)):
+            profiles = [profile async for profile in iter_profiles("dev", limit=10)]
+
+        assert [p.name for p in profiles] == ["Person 0", "Person 1", "Person 2"]
+        assert profiles[0].linkedin_url == "https://www.linkedin.com/in/person-0"
+
+    @pytest.mark.asyncio
+    async def test_backpressure_bounds_the_lead(self, fake_search) -> None:
+        """The search never runs more than ``buffer`` profiles ahead of a slow consumer."""
+        search = fake_search(_slugs(20))
+        leads = []
+        with patch.object(linkedin_api, "search_linkedin_async", search):
+            consumed = 0
+            async for _ in iter_profiles("dev", limit=20, buffer=2):
+                consumed += 1
+                await asyncio.sleep(0.01)
+                leads.append(search.total - consumed)
+
+        assert consumed == 20
+        assert max(leads) <= 3
+
+    @pytest.mark.asyncio
+    async def test_closing_stops_the_search(self, fake_search) -> None:
+        """Closing the iterator ends the search instead of scrolling to the limit."""
+        search = fake_search(_slugs(50))
+        with patch.object(linkedin_api, "search_linkedin_async", search):
+            async with aclosing(iter_profiles("dev", limit=50, buffer=2)) as profiles:
+                async for profile in profiles:
+                    if profile.name == "Person 1":
+                        break
+
+        assert search.total <= 5
+
+    @pytest.mark.asyncio
+    async def test_stop_event(self, fake_search) -> None:
+        """Setting ``stop`` ends the stream after the current profile."""
+        stop = asyncio.Event()
+        with patch.object(linkedin_api, "search_linkedin_async", fake_search(_slugs(10))):
+            names = []
+            async for profile in iter_profiles("dev", stop=stop):
+                names.append(profile.name)
+                stop.set()
+
+        assert names == ["Person 0"]
+
+    @pytest.mark.asyncio
+    async def test_selenium_thread_waits_for_the_consumer(self, fake_search) -> None:
+        """With the Selenium engine the scraping thread blocks on a full queue."""
+        threads = set()
+
+        def blocking_search(query, max_results, auto_authenticate, on_card=None):
+            for card in map(fake_search.card, _slugs(5)):
+                threads.add(threading.current_thread().name)
+                if on_card(card) is False:
+                    break
+            return []
+
+        with patch.object(scraping, "SCRAPER_BACKEND", "selenium"), patch.object(
+            scraping, "search_linkedin", blocking_search
+        ):
+            names = [profile.name async for profile in iter_profiles("dev", buffer=1)]
+
+        assert names == [f"Person {i}" for i in range(5)]
+        assert threading.current_thread().name not in threads
+
+    @pytest.mark.asyncio
+    async def test_search_cache_io_runs_off_the_loop(self, fake_search) -> None:
+        """The SQLite-backed search cache is read and written on worker threads."""
+        threads = []
+
+        def record(*args):
+            threads.append(threading.current_thread())
+
+        with patch.object(linkedin_api, "search_linkedin_async", fake_search(_slugs(2))), patch.object(
+            linkedin_api, "_cache_lookup", side_effect=record
+        ), patch.object(linkedin_api, "_cache_store", side_effect=record):
+            assert len([profile async for profile in iter_profiles("dev")]) == 2
+
+        assert len(threads) == 2 and threading.current_thread() not in threads
+
+    @pytest.mark.asyncio
+    async def test_selenium_callback_error_reaches_the_caller(self, fake_search) -> None:
+        """A failing ``on_card`` stops the search and is re-raised, not turned into ``[]``."""
+        parsed = []
+
+        def blocking_search(query, max_results, auto_authenticate, on_card=None):
+            try:
+                for card in map(fake_search.card, _slugs(5)):
+                    parsed.append(card)
+                    if on_card(card) is False:
+                        break
+            except Exception:  # noqa: BLE001 – like search_linkedin
+                return []
+            return parsed
+
+        async def on_card(card):
+            if len(parsed) == 2:
+                raise RuntimeError("consumer failed")
+
+        with patch.object(scraping, "SCRAPER_BACKEND", "selenium"), patch.object(
+            scraping, "search_linkedin", blocking_search
+        ):
+            with pytest.raises(RuntimeError, match="consumer failed"):
+                await scraping.search_linkedin_async("dev", on_card=on_card)
+
+        assert len(parsed) == 2
+
+    def test_selenium_searches_do_not_starve_the_default_executor(self, fake_search) -> None:
+        """Blocked search threads leave the default executor free for ``to_thread`` callbacks."""
+
+        def blocking_search(query, max_results, auto_authenticate, on_card=None):
+            for card in map(fake_search.card, _slugs(3)):
+                on_card(card)
+            return []
+
+        async def on_card(card):
+            await asyncio.to_thread(lambda: None)
+
+        async def fan_out():
+            asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=2))
+            await asyncio.gather(
+                *(scraping.search_linkedin_async(f"q{i}", on_card=on_card) for i in range(3))
+            )
+
+        with patch.object(scraping, "SCRAPER_BACKEND", "selenium"), patch.object(
+            scraping, "search_linkedin", blocking_search
+        ):
+            asyncio.run(asyncio.wait_for(fan_out(), timeout=5))
+
+
+class TestSourcerStream:
+    """Test suite for :meth:`LinkedInSourcer.stream`."""
+
+    @pytest.mark.asyncio
+    async def test_stream_deduplicates_and_reuses_the_query(self, fake_search) -> None:
+        """Candidates arrive de-duplicated, searched with the same query as ``run``."""
+        jd = JobDescription(title="Backend Engineer", must_haves=["Python"], location="Berlin")
+        search = fake_search(_slugs(2) + _slugs(1))
+        queries = []
+
+        async def recording_search(query, *args, **kwargs):
+            queries.append(query)
+            return await search(query, *args, **kwargs)
+
+        with patch.object(linkedin_api, "search_linkedin_async", recording_search):
+            names = [profile.name async for profile in LinkedInSourcer().stream(jd)]
+
+        assert names == ["Person 0", "Person 1"]
+        assert queries == [_build_search_query(jd)] == ['"Backend Engineer" AND ("python") AND "Berlin"']